@@ -0,0 +1,114 @@
+import io
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, TextIO, Tuple
+
+ACTION_PLAN_HEADER = "\nEMPLOYEE ENGAGEMENT ACTION PLAN\n" + '=' * 50 + "\n\n"
+ACTION_PLAN_FOOTER = """
+IMPLEMENTATION TIMELINE:
+Week 1: Conduct stay interview and implement quick wins
+Week 2-3: Begin medium-effort interventions
+Week 4-8: Execute high-impact, longer-term initiatives
+Week 12: Review progress and adjust plan
+
+SUCCESS METRICS:
+• Improvement in relevant survey scores
+• Reduction in turnover risk score
+• Increase in engagement metrics
+• Employee feedback on interventions
+"""
+# Written between plans in a single text file
+PLAN_SEPARATOR = "\n" + '-' * 50 + "\n"
+
+class ActionPlanRenderer:
+    """Renders action plans from generate_individual_recommendations() results
+
+    The static header and footer are precompiled, need labels are formatted
+    once per need, and each intervention's block is formatted once per entry
+    (catalog entries are shared across employees, so most plans are
+    assembled from cached pieces). Pieces are written to a buffer rather
+    than concatenated. write() streams any number of plans to a text file or
+    a zip bundle (one file per employee) without holding them all in memory.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = ()):
+        self._need_labels = {}
+        # id(entry) -> (entry, block after the number) for the shared entries
+        # (e.g. InterventionCatalog.entries); other dicts are formatted per call
+        self._blocks = {id(entry): (entry, self._format_block(entry)) for entry in entries}
+
+    def _need_label(self, need: str) -> str:
+        label = self._need_labels.get(need)
+        if label is None:
+            label = self._need_labels[need] = f"• {need.replace('_', ' ').title()}"
+        return label
+
+    @staticmethod
+    def _format_block(rec: Dict[str, Any]) -> str:
+        return (f"{rec['intervention']}\n"
+                f"   Description: {rec['description']}\n"
+                f"   Impact Score: {rec['impact_score']}/10\n"
+                f"   Effort Level: {rec['effort_level']}\n"
+                f"   Timeline: {rec['timeline']}\n"
+                f"   \n")
+
+    def _block(self, rec: Dict[str, Any]) -> str:
+        cached = self._blocks.get(id(rec))
+        if cached is not None and cached[0] is rec:
+            return cached[1]
+        return self._format_block(rec)
+
+    def render_to(self, buffer: TextIO, recommendations: Dict[str, Any]):
+        """Write one plan to `buffer`"""
+        write = buffer.write
+        write(ACTION_PLAN_HEADER)
+        write(f"Employee: {recommendations['employee_name']}\n"
+              f"Department: {recommendations['department']}\n"
+              f"Priority Level: {recommendations['priority_level']}\n"
+              f"Estimated Impact: {recommendations['estimated_impact']:.1f}/10\n\n"
+              "IDENTIFIED NEEDS:\n")
+        write("\n".join([self._need_label(need) for need in recommendations['identified_needs']]))
+        write("\n\nRECOMMENDED ACTIONS:\n")
+        for i, rec in enumerate(recommendations['recommendations'], 1):
+            write(f"\n{i}. ")
+            write(self._block(rec))
+        write(ACTION_PLAN_FOOTER)
+
+    def render(self, recommendations: Dict[str, Any]) -> str:
+        buffer = io.StringIO()
+        self.render_to(buffer, recommendations)
+        return buffer.getvalue()
+
+    def iter_render(self, recommendations: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, str]]:
+        """Lazily yield (employee_id, plan) for each recommendations dict"""
+        for rec in recommendations:
+            yield rec.get('employee_id', ''), self.render(rec)
+
+    def write(self, recommendations: Iterable[Dict[str, Any]], path: str,
+              compression: int = zipfile.ZIP_DEFLATED) -> int:
+        """Stream plans to `path` and return how many were written
+
+        A '.zip' path gets one '<employee_id>.txt' member per plan; any other
+        path gets a text file with the plans separated by PLAN_SEPARATOR.
+        Plans are rendered and written one at a time.
+        """
+        written = 0
+        if path.endswith('.zip'):
+            names = set()
+            with zipfile.ZipFile(path, 'w', compression=compression) as bundle:
+                for employee_id, plan in self.iter_render(recommendations):
+                    name = f"{employee_id or written + 1}.txt"
+                    # Repeated employee IDs get a numbered suffix rather than duplicate members
+                    if name in names:
+                        name = f"{employee_id or written + 1}_{written + 1}.txt"
+                    names.add(name)
+                    bundle.writestr(name, plan)
+                    written += 1
+            return written
+
+        with open(path, 'w', encoding='utf-8') as f:
+            for rec in recommendations:
+                if written:
+                    f.write(PLAN_SEPARATOR)
+                self.render_to(f, rec)
+                written += 1
+        return written
@@ -1,61 +1,236 @@
 import pandas as pd
 import numpy as np
+import hashlib
+import json
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from feature_store import FeatureStore
+from kpi_engine import KPIEngine
+from olap_cube import EngagementCube
+from sentiment_analysis import SentimentAnalyzer
+from data_export import ChunkedExporter, infer_export_format
 import warnings
 warnings.filterwarnings('ignore')
 
+def scatter_trace(x, y, name, max_points=5000, mode='bin', bins=60):
+    """Scatter of x/y that hands the browser at most ~`max_points` markers
+    
+    Above the limit, mode='sample' plots a fixed-seed uniform sample and
+    mode='bin' plots the occupied cells of a bins x bins grid, sized and
+    coloured by how many employees fall in each cell.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    present = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[present], y[present]
+    if len(x) <= max_points:
+        return go.Scatter(x=x, y=y, mode='markers', name=name)
+    
+    if mode == 'sample':
+        keep = np.sort(np.random.default_rng(0).choice(len(x), size=max_points, replace=False))
+        return go.Scatter(x=x[keep], y=y[keep], mode='markers', name=f"{name} (sample of {len(x):,})")
+    
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    xi, yi = np.nonzero(counts)
+    cell_counts = counts[xi, yi]
+    return go.Scatter(
+        x=(x_edges[xi] + x_edges[xi + 1]) / 2, y=(y_edges[yi] + y_edges[yi + 1]) / 2,
+        mode='markers', name=f"{name} (binned)",
+        marker=dict(size=4 + 16 * np.sqrt(cell_counts / cell_counts.max()), color=cell_counts,
+                    colorscale='Viridis', showscale=False),
+        text=[f"{int(count)} employees" for count in cell_counts]
+    )
+
 class EngagementDashboard:
     """Analytics dashboard for IGNITE project"""
     
-    def __init__(self):
+    # Figure name -> builder method, for figure() / figures_json()
+    FIGURES = {
+        'engagement_heatmap': '_build_engagement_heatmap',
+        'satisfaction_trends': '_build_satisfaction_trends',
+        'turnover_risk_analysis': '_build_turnover_risk_analysis',
+        'kpi_summary': '_build_kpi_summary'
+    }
+    
+    def __init__(self, max_scatter_points=5000, scatter_mode='bin', trend_freq='M'):
         self.data = None
+        # MetricHistory of snapshots across survey waves, for the trend chart
+        self.metric_history = None
+        self.trend_freq = trend_freq
         self.metrics = {}
-        
-    def load_data(self, employees_df, survey_df, metrics_df, sentiment_df=None):
-        """Load all data sources"""
-        # Merge all data
-        self.data = employees_df.merge(survey_df, on='employee_id', how='left')
-        self.data = self.data.merge(metrics_df, on='employee_id', how='left')
-        
-        if sentiment_df is not None:
-            self.data = self.data.merge(sentiment_df, left_on='employee_id', 
-                                      right_on='feedback_id', how='left')
-        
+        self.kpi_engine = None
+        # Column the KPIs key rows by (None: the index), set by calculate_kpis
+        self._key_column = None
+        self.cube = None
+        self.max_scatter_points = max_scatter_points
+        self.scatter_mode = scatter_mode
+        # Hash identifying the loaded data and every update applied since
+        self.data_version = None
+        # name -> (data_version, figure, JSON or None)
+        self._figure_cache = {}
+        
+    def load_data(self, employees_df, survey_df, metrics_df, sentiment_df=None, feature_store=None,
+                  metric_history=None):
+        """Load all data sources
+        
+        A FeatureStore already built for these frames (e.g. the one the
+        predictors used) is reused instead of joining them again. Sentiment
+        results are summarized per employee and joined when they are linked
+        to employees (analyze_feedback_batch with employee_ids). With a
+        MetricHistory, satisfaction trends are charted over time from it;
+        add later snapshots through append_history().
+        """
+        if feature_store is None:
+            feature_store = FeatureStore(employees_df, survey_df, metrics_df)
+        # Shallow copy: the dashboard adds columns the shared frame should not get
+        self.data = feature_store.frame.copy(deep=False)
+        
+        if sentiment_df is not None and 'employee_id' in sentiment_df.columns:
+            # Per-employee summary joined through the store's sorted employee_id index
+            summary = SentimentAnalyzer.summarize_by_employee(sentiment_df)
+            self.data = pd.concat([self.data, feature_store.align(summary)], axis=1)
+        
+        # Charts are answered from the cube instead of re-aggregating rows
+        self.cube = EngagementCube.from_frame(self.data)
         self.calculate_kpis()
+        self._bump_version(pd.util.hash_pandas_object(self.data, index=False).to_numpy().tobytes(), reset=True)
+        self.metric_history = metric_history
+        if metric_history is not None:
+            self._bump_version(repr(('history', id(metric_history), metric_history.version)).encode('ascii'))
+    
+    def _bump_version(self, payload: bytes, reset=False):
+        """Chain `payload` into data_version, invalidating cached figures"""
+        digest = hashlib.blake2b(b'' if reset else self.data_version.encode('ascii'), digest_size=16)
+        digest.update(payload)
+        self.data_version = digest.hexdigest()
         
     def calculate_kpis(self):
         """Calculate key performance indicators"""
         if self.data is None:
             return
+        
+        # Rows are keyed by employee_id when it is unique, else by index label
+        self._key_column = 'employee_id' if self.data['employee_id'].is_unique else None
+        self.kpi_engine = KPIEngine.from_frame(self.data, self._key_column)
+        self.metrics = self.kpi_engine.kpis()
+    
+    def _row_keys(self, rows):
+        return pd.Index(rows.index if self._key_column is None else rows[self._key_column])
+    
+    def apply_changes(self, upserts=None, deletes=None):
+        """Apply changed or new rows and deleted keys to the data, cube and KPIs together
+        
+        Rows are keyed like the KPIs (see calculate_kpis). `upserts` is a
+        frame of rows: an existing row takes the columns given and keeps the
+        rest, a new row is appended with the columns given. `deletes` lists
+        keys to remove. Each affected row is retracted from the cube and KPIs
+        in its old state and added in its new one, so charts and KPIs always
+        describe `data`. Rebuilding `data` costs O(rows); the cube and KPI
+        updates only touch the affected rows.
+        """
+        if deletes is not None and len(deletes):
+            deletes = pd.Index(deletes)
+            positions = self._row_keys(self.data).get_indexer(deletes)
+            if (positions < 0).any():
+                raise KeyError(deletes[positions < 0][0])
+            self.cube.remove(self.data.iloc[positions])
+            for key in deletes:
+                self.kpi_engine.delete(key)
+            keep = np.ones(len(self.data), dtype=bool)
+            keep[positions] = False
+            self.data = self.data.iloc[keep]
+            self._bump_version(b'-' + pd.util.hash_pandas_object(deletes.to_series(), index=False).to_numpy().tobytes())
+        
+        if upserts is not None and len(upserts):
+            keys = self._row_keys(upserts)
+            if not keys.is_unique:
+                raise ValueError("Each row may appear only once in upserts")
+            positions = self._row_keys(self.data).get_indexer(keys)
+            existing = positions >= 0
+            changed = positions[existing]
+            old = self.data.iloc[changed]
+            new = old.copy()
+            for col in upserts.columns:
+                new[col] = upserts[col].to_numpy()[existing]
+            
+            # Changed rows stay in place and new rows go last
+            keep = np.ones(len(self.data), dtype=bool)
+            keep[changed] = False
+            rows = pd.concat([self.data.iloc[keep], new, upserts[~existing]])
+            order = np.concatenate([np.flatnonzero(keep), changed, len(self.data) + np.arange((~existing).sum())])
+            affected = rows.iloc[int(keep.sum()):]
+            self.data = rows.iloc[np.argsort(order, kind='stable')]
+            if self._key_column is not None:
+                self.data = self.data.reset_index(drop=True)
             
-        self.metrics = {
-            'total_employees': len(self.data),
-            'avg_engagement': self.data['engagement_score'].mean(),
-            'avg_satisfaction': self.data['satisfaction_score'].mean(),
-            'avg_enps': self.data['enps_score'].mean(),
-            'high_risk_employees': (self.data['turnover_risk'] > 0.6).sum(),
-            'engagement_by_dept': self.data.groupby('department')['engagement_score'].mean().to_dict(),
-            'satisfaction_by_arrangement': self.data.groupby('work_arrangement')['satisfaction_score'].mean().to_dict(),
-            'retention_risk': (self.data['turnover_risk'] > 0.6).mean() * 100
-        }
+            self.cube.remove(old)
+            self.cube.add(affected)
+            self.kpi_engine.upsert_frame(affected, self._key_column)
+            self._bump_version(b'+' + pd.util.hash_pandas_object(upserts, index=False).to_numpy().tobytes())
+        self.metrics = self.kpi_engine.kpis()
+    
+    def update_kpis(self, key, record):
+        """Insert or change one row (dict of fields) in the data, cube and KPIs; see apply_changes"""
+        if self._key_column is None:
+            rows = pd.DataFrame([record], index=[key])
+        else:
+            rows = pd.DataFrame([{**record, self._key_column: key}])
+        self.apply_changes(upserts=rows)
+    
+    def remove_from_kpis(self, key):
+        """Remove one row from the data, cube and KPIs; see apply_changes"""
+        self.apply_changes(deletes=[key])
+        
+    def update_cube(self, added=None, removed=None):
+        """Apply newly loaded rows and retract removed ones (matched by key); see apply_changes"""
+        self.apply_changes(upserts=added, deletes=None if removed is None else self._row_keys(removed))
+    
+    def append_history(self, snapshots):
+        """Append metric snapshots (e.g. a new survey wave) to the trend history"""
+        self.metric_history.append(snapshots)
+        self._bump_version(repr(('history', id(self.metric_history), self.metric_history.version)).encode('ascii'))
+    
+    def figure(self, name):
+        """Figure `name` (see FIGURES), built on first use and cached per data_version
+        
+        Cached figures are shared between callers; copy one before modifying it.
+        """
+        cached = self._figure_cache.get(name)
+        if cached is None or cached[0] != self.data_version:
+            cached = (self.data_version, getattr(self, self.FIGURES[name])(), None)
+            self._figure_cache[name] = cached
+        return cached[1]
+    
+    def figure_json(self, name):
+        """Plotly JSON for figure `name`, serialized once per data_version"""
+        fig = self.figure(name)
+        version, _, serialized = self._figure_cache[name]
+        if serialized is None:
+            serialized = pio.to_json(fig, validate=False) if fig is not None else 'null'
+            self._figure_cache[name] = (version, fig, serialized)
+        return serialized
+    
+    def figures_json(self):
+        """All dashboard figures as one JSON document for the analytics page"""
+        return '{"data_version": %s, "figures": {%s}}' % (
+            json.dumps(self.data_version),
+            ', '.join(f"{json.dumps(name)}: {self.figure_json(name)}" for name in self.FIGURES))
         
     def create_engagement_heatmap(self):
         """Create engagement heatmap by department and work arrangement"""
+        return self.figure('engagement_heatmap')
+    
+    def _build_engagement_heatmap(self):
         if self.data is None:
             return None
             
-        # Create pivot table
-        heatmap_data = self.data.pivot_table(
-            values='engagement_score', 
-            index='department', 
-            columns='work_arrangement', 
-            aggfunc='mean'
-        )
+        # Department x arrangement means, rolled up from the cube
+        heatmap_data = self.cube.mean('engagement_score', by=('department', 'work_arrangement'))
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
@@ -80,8 +255,13 @@ class EngagementDashboard:
     
     def create_satisfaction_trends(self):
         """Create satisfaction trends visualization"""
+        return self.figure('satisfaction_trends')
+    
+    def _build_satisfaction_trends(self):
         if self.data is None:
             return None
+        if self.metric_history is not None and len(self.metric_history):
+            return self._build_satisfaction_history()
             
         # Calculate satisfaction metrics
         satisfaction_metrics = ['job_satisfaction', 'work_life_balance', 'career_development',
@@ -90,7 +270,7 @@ class EngagementDashboard:
         avg_scores = []
         for metric in satisfaction_metrics:
             if metric in self.data.columns:
-                avg_scores.append(self.data[metric].mean())
+                avg_scores.append(self.cube.mean(metric))
             else:
                 avg_scores.append(0)
         
@@ -118,16 +298,35 @@ class EngagementDashboard:
         
         return fig
     
+    def _build_satisfaction_history(self):
+        # Per-period department means, downsampled from the history's daily buckets
+        trend = self.metric_history.trend('satisfaction_score', freq=self.trend_freq)
+        overall = self.metric_history.trend('satisfaction_score', freq=self.trend_freq, by_department=False)
+        
+        fig = go.Figure()
+        for department in trend.columns:
+            fig.add_trace(go.Scatter(x=trend.index, y=trend[department], mode='lines+markers', name=str(department)))
+        fig.add_trace(go.Scatter(x=overall.index, y=overall['All'], mode='lines', name='All employees',
+                                 line=dict(color='black', width=3, dash='dash')))
+        
+        fig.update_layout(
+            title="Employee Satisfaction Trends by Department",
+            xaxis_title="Period",
+            yaxis_title="Average Satisfaction Score",
+            yaxis=dict(range=[0, 10]),
+            height=500
+        )
+        
+        return fig
+    
     def create_turnover_risk_analysis(self):
         """Create turnover risk analysis"""
+        return self.figure('turnover_risk_analysis')
+    
+    def _build_turnover_risk_analysis(self):
         if self.data is None or 'turnover_risk' not in self.data.columns:
             return None
             
-        # Risk categories
-        self.data['risk_category'] = pd.cut(self.data['turnover_risk'], 
-                                          bins=[0, 0.3, 0.6, 1.0], 
-                                          labels=['Low', 'Medium', 'High'])
-        
         # Create subplots
         fig = make_subplots(
             rows=2, cols=2,
@@ -138,21 +337,21 @@ class EngagementDashboard:
         )
         
         # Risk distribution pie chart
-        risk_counts = self.data['risk_category'].value_counts()
+        risk_counts = self.cube.risk_distribution()
         fig.add_trace(
             go.Pie(labels=risk_counts.index, values=risk_counts.values, name="Risk Distribution"),
             row=1, col=1
         )
         
         # Risk by department
-        dept_risk = self.data.groupby('department')['turnover_risk'].mean().sort_values(ascending=False)
+        dept_risk = self.cube.mean('turnover_risk', by=('department',)).sort_values(ascending=False)
         fig.add_trace(
             go.Bar(x=dept_risk.index, y=dept_risk.values, name="Avg Risk by Dept"),
             row=1, col=2
         )
         
         # Risk by work arrangement
-        arrangement_risk = self.data.groupby('work_arrangement')['turnover_risk'].mean()
+        arrangement_risk = self.cube.mean('turnover_risk', by=('work_arrangement',))
         fig.add_trace(
             go.Bar(x=arrangement_risk.index, y=arrangement_risk.values, name="Risk by Arrangement"),
             row=2, col=1
@@ -160,8 +359,8 @@ class EngagementDashboard:
         
         # Risk vs Engagement scatter
         fig.add_trace(
-            go.Scatter(x=self.data['engagement_score'], y=self.data['turnover_risk'],
-                      mode='markers', name="Risk vs Engagement"),
+            scatter_trace(self.data['engagement_score'], self.data['turnover_risk'], "Risk vs Engagement",
+                          max_points=self.max_scatter_points, mode=self.scatter_mode),
             row=2, col=2
         )
         
@@ -170,6 +369,9 @@ class EngagementDashboard:
     
     def create_kpi_summary(self):
         """Create KPI summary dashboard"""
+        return self.figure('kpi_summary')
+    
+    def _build_kpi_summary(self):
         if not self.metrics:
             return None
             
@@ -291,11 +493,26 @@ class EngagementDashboard:
         
         return report
     
-    def export_dashboard_data(self, filename="ignite_dashboard_data.csv"):
-        """Export dashboard data to CSV"""
-        if self.data is not None:
-            self.data.to_csv(filename, index=False)
+    def export_dashboard_data(self, filename="ignite_dashboard_data.csv", file_format=None, columns=None,
+                              partition_by=None, progress=None, background=False, chunk_size=100000, n_jobs=1):
+        """Export dashboard data in chunks
+        
+        The format follows the file extension (.csv, .csv.gz, .ndjson,
+        .ndjson.gz, .parquet) unless `file_format` is given. `columns`
+        projects the export, and `partition_by` (e.g. 'department') writes a
+        directory with one file per value, `n_jobs` at a time. With
+        background=True the ExportJob is returned at once; its wait() gives
+        the files written and `progress(rows_written, total_rows)` reports
+        along the way.
+        """
+        if self.data is None:
+            return None
+        exporter = ChunkedExporter(file_format or infer_export_format(filename), chunk_size=chunk_size, n_jobs=n_jobs)
+        job = exporter.export(self.data, filename, columns=columns, partition_by=partition_by,
+                              progress=progress, background=background)
+        if not background:
             print(f"Dashboard data exported to {filename}")
+        return job
 
 # Example usage
 if __name__ == "__main__":
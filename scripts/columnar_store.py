@@ -0,0 +1,388 @@
+import pandas as pd
+import numpy as np
+import json
+from dataclasses import fields
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:  # snapshots are optional; everything else works without pyarrow
+    pa = None
+
+# Storage dtypes for the non-NumPy column kinds
+CATEGORY_CODE_DTYPE = np.int16
+OBJECT_KINDS = ('object', 'str')
+
+def _is_sequence(value) -> bool:
+    """True for array-likes holding one value per row (not scalars or strings)"""
+    return hasattr(value, '__len__') and not isinstance(value, (str, bytes, dict))
+
+class ColumnTable:
+    """Growable table of typed NumPy columns sharing a single row count
+
+    Schema kinds are NumPy dtype strings (e.g. 'int8', 'float64',
+    'datetime64[us]'), 'category' for dictionary-encoded labels stored as
+    int16 codes (-1 = missing) or 'object' for free-form Python values.
+    """
+
+    def __init__(self, schema: Dict[str, str], capacity: int = 1024):
+        self.schema = dict(schema)
+        self.categories = {name: [] for name, kind in self.schema.items() if kind == 'category'}
+        self._category_codes = {name: {} for name in self.categories}
+        self._size = 0
+        # Bumped on every mutation so derived views can tell when they are stale
+        self.version = 0
+        # Set once a frame has been handed out that shares our buffers, so
+        # in-place updates copy first instead of mutating the caller's frame
+        self._exported = False
+        self._columns = {name: self._allocate(kind, max(capacity, 1))
+                         for name, kind in self.schema.items()}
+        # Object columns loaded from Arrow are only converted to Python
+        # objects the first time they are read
+        self._pending = {}
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def _allocate(kind: str, n: int) -> np.ndarray:
+        """Allocate an n-row buffer filled with the kind's missing value"""
+        if kind == 'category':
+            return np.full(n, -1, dtype=CATEGORY_CODE_DTYPE)
+        if kind in OBJECT_KINDS:
+            return np.full(n, None, dtype=object)
+        dtype = np.dtype(kind)
+        if dtype.kind == 'M':
+            return np.full(n, np.datetime64('NaT'), dtype=dtype)
+        if dtype.kind == 'f':
+            return np.full(n, np.nan, dtype=dtype)
+        return np.zeros(n, dtype=dtype)
+
+    def _reserve(self, extra: int):
+        """Grow every buffer geometrically so appends stay amortized O(1)"""
+        self._materialize_pending()
+        needed = self._size + extra
+        capacity = len(next(iter(self._columns.values())))
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name, kind in self.schema.items():
+            grown = self._allocate(kind, new_capacity)
+            grown[:self._size] = self._columns[name][:self._size]
+            self._columns[name] = grown
+        # Fresh buffers are not shared with any exported frame
+        self._exported = False
+
+    def encode(self, name: str, values) -> np.ndarray:
+        """Map labels to category codes, registering unseen labels"""
+        codes = self._category_codes[name]
+        labels = self.categories[name]
+        if isinstance(values, pd.Categorical) or isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+            values = pd.Categorical(values)
+            lookup = np.array([self._category_code(name, label) for label in values.categories] + [-1],
+                              dtype=CATEGORY_CODE_DTYPE)
+            return lookup[values.codes]
+        values = pd.Series(values, dtype=object)
+        for label in pd.unique(values[values.notna()]):
+            if label not in codes:
+                self._category_code(name, label)
+        return pd.Index(labels, dtype=object).get_indexer(values).astype(CATEGORY_CODE_DTYPE)
+
+    def _category_code(self, name: str, label) -> int:
+        if isinstance(label, np.generic):
+            label = label.item()
+        codes = self._category_codes[name]
+        if label not in codes:
+            codes[label] = len(self.categories[name])
+            self.categories[name].append(label)
+        return codes[label]
+
+    def _coerce(self, name: str, values, n: int) -> np.ndarray:
+        """Convert incoming values to the column's storage dtype"""
+        kind = self.schema[name]
+        if not _is_sequence(values):
+            values = [values] * n
+        if kind == 'category':
+            return self.encode(name, values)
+        if kind in OBJECT_KINDS:
+            return np.asarray(pd.Series(values, dtype=object), dtype=object)
+        dtype = np.dtype(kind)
+        if dtype.kind == 'M':
+            return pd.to_datetime(pd.Series(values)).to_numpy().astype(dtype)
+        if dtype.kind in 'iu':
+            values = np.asarray(values)
+            if values.dtype.kind not in 'iub':
+                # Integer columns have no missing value, and 7.6 is not a 7
+                numeric = pd.to_numeric(pd.Series(values.ravel()), errors='coerce').to_numpy(dtype=np.float64)
+                if not (np.isfinite(numeric) & (numeric % 1 == 0)).all():
+                    raise ValueError(f"Column {name!r} ({kind}) only holds whole numbers")
+                values = numeric
+        return np.asarray(values, dtype=dtype)
+
+    def append_columns(self, columns: Dict[str, Any]) -> int:
+        """Append a block of rows given as equal-length columns; returns rows added"""
+        lengths = {len(v) for v in columns.values() if _is_sequence(v)}
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        unknown = set(columns) - set(self.schema)
+        if unknown:
+            raise KeyError(f"Unknown columns: {sorted(unknown)}")
+        n = lengths.pop() if lengths else 1
+
+        coerced = {name: self._coerce(name, values, n) for name, values in columns.items()}
+        self._reserve(n)
+        start, stop = self._size, self._size + n
+        for name, values in coerced.items():
+            self._columns[name][start:stop] = values
+        self._size = stop
+        self.version += 1
+        return n
+
+    def append_row(self, row: Dict[str, Any]):
+        """Append a single row given as a dict of scalars"""
+        unknown = set(row) - set(self.schema)
+        if unknown:
+            raise KeyError(f"Unknown columns: {sorted(unknown)}")
+        # Convert every value before writing any, so a bad value leaves no partial row
+        values = {name: self._scalar(name, value) for name, value in row.items()}
+        self._reserve(1)
+        for name, value in values.items():
+            self._columns[name][self._size] = value
+        self._size += 1
+        self.version += 1
+
+    def _scalar(self, name: str, value):
+        kind = self.schema[name]
+        if kind == 'category':
+            return -1 if value is None or value is pd.NA else self._category_code(name, value)
+        if kind in OBJECT_KINDS:
+            return value
+        if np.dtype(kind).kind == 'M':
+            return np.datetime64('NaT') if value is None else pd.Timestamp(value).to_datetime64()
+        if value is None and np.dtype(kind).kind == 'f':
+            return np.nan
+        if np.dtype(kind).kind in 'iu':
+            if not isinstance(value, (int, float, np.number)) or not np.isfinite(value) or value % 1:
+                raise ValueError(f"Column {name!r} ({kind}) only holds whole numbers, got {value!r}")
+            return int(value)
+        return value
+
+    def get(self, name: str, row: int):
+        """Read one cell, decoding categories and datetimes to Python values"""
+        value = self.column(name)[row]
+        kind = self.schema[name]
+        if kind == 'category':
+            return None if value < 0 else self.categories[name][value]
+        if kind in OBJECT_KINDS:
+            return value
+        if np.dtype(kind).kind == 'M':
+            return None if np.isnat(value) else pd.Timestamp(value).to_pydatetime()
+        return value.item()
+
+    def set(self, name: str, row: int, value):
+        """Overwrite one cell in place"""
+        if not 0 <= row < self._size:
+            raise IndexError(row)
+        self._materialize_pending()
+        if self._exported:
+            # Detach from previously exported frames (or read-only memory maps) before writing
+            self._columns = {col: buf.copy() for col, buf in self._columns.items()}
+            self._exported = False
+        self._columns[name][row] = self._scalar(name, value)
+        self.version += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of a column's storage (category codes for categoricals)"""
+        if name in self._pending:
+            self._columns[name] = self._pending.pop(name).to_numpy(zero_copy_only=False)
+        return self._columns[name][:self._size]
+
+    def _materialize_pending(self):
+        for name in list(self._pending):
+            self.column(name)
+
+    def series(self, name: str, categorical: bool = True) -> pd.Series:
+        """Column as a pandas Series sharing the underlying buffer where possible
+
+        With categorical=False, category columns are decoded to plain object
+        labels (None where missing), which costs one take over the codes.
+        """
+        values = self.column(name)
+        kind = self.schema[name]
+        if kind == 'category':
+            if not categorical:
+                labels = np.array(self.categories[name] + [None], dtype=object)
+                return pd.Series(labels[values], dtype=object, copy=False, name=name)
+            values = pd.Categorical.from_codes(values, categories=pd.Index(self.categories[name], dtype=object))
+        elif kind in OBJECT_KINDS:
+            return pd.Series(values, dtype=object, copy=False, name=name)
+        return pd.Series(values, copy=False, name=name)
+
+    def to_frame(self, columns: Optional[List[str]] = None, categorical: bool = True) -> pd.DataFrame:
+        """Build a DataFrame view over the stored columns without copying them
+
+        Category columns are copied when categorical=False (see series()).
+        """
+        columns = list(self.schema) if columns is None else columns
+        self._exported = True
+        return pd.DataFrame({name: self.series(name, categorical) for name in columns}, copy=False)
+
+    def clear(self):
+        """Drop all rows and category vocabularies"""
+        version = self.version
+        self.__init__(self.schema)
+        self.version = version + 1
+
+    def to_arrow(self) -> Tuple['pa.Table', Dict[str, Any]]:
+        """Convert to an Arrow table plus the column metadata needed by from_arrow
+
+        Numeric, category-code and datetime columns are wrapped without
+        copying; object columns holding anything but strings are stored as
+        JSON text.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow/Parquet snapshots")
+        arrays, meta = {}, {}
+        for name, kind in self.schema.items():
+            values = self.column(name)
+            column_meta = {'kind': kind}
+            if kind == 'category':
+                column_meta['categories'] = list(self.categories[name])
+                arrays[name] = pa.array(values)
+            elif kind in OBJECT_KINDS:
+                if pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty'):
+                    arrays[name] = pa.array(values, type=pa.string())
+                else:
+                    column_meta['encoding'] = 'json'
+                    arrays[name] = pa.array([None if v is None else json.dumps(v, default=str)
+                                             for v in values], type=pa.string())
+            elif np.dtype(kind).kind == 'M':
+                # Keep NaT as a plain value so the column round-trips zero-copy
+                unit = np.datetime_data(np.dtype(kind))[0]
+                arrays[name] = pa.array(values.view(np.int64)).view(pa.timestamp(unit))
+            else:
+                arrays[name] = pa.array(values)
+            meta[name] = column_meta
+        return pa.table(arrays), meta
+
+    @classmethod
+    def from_arrow(cls, arrow_table: 'pa.Table', meta: Dict[str, Any]) -> 'ColumnTable':
+        """Rebuild a table from to_arrow output, sharing Arrow's buffers where possible
+
+        Buffers backed by a memory map stay read-only; the first in-place
+        update or append copies them.
+        """
+        table = cls({name: column_meta['kind'] for name, column_meta in meta.items()}, capacity=1)
+        arrow_table = arrow_table.combine_chunks()
+        for name, column_meta in meta.items():
+            column = arrow_table.column(name)
+            chunk = column.chunk(0) if column.num_chunks else pa.array([], type=column.type)
+            kind = column_meta['kind']
+            if kind == 'category':
+                for label in column_meta['categories']:
+                    table._category_code(name, label)
+                table._columns[name] = chunk.to_numpy(zero_copy_only=True)
+            elif kind in OBJECT_KINDS:
+                if column_meta.get('encoding') == 'json':
+                    table._columns[name] = np.array([None if v is None else json.loads(v)
+                                                     for v in chunk.to_pylist()], dtype=object)
+                else:
+                    table._pending[name] = chunk
+            elif np.dtype(kind).kind == 'M':
+                table._columns[name] = chunk.view(pa.int64()).to_numpy(zero_copy_only=True).view(kind)
+            else:
+                table._columns[name] = chunk.to_numpy(zero_copy_only=True)
+        table._size = arrow_table.num_rows
+        table._exported = True
+        return table
+
+class RowProxy:
+    """Lightweight handle on one row of a ColumnTable"""
+    __slots__ = ('_table', '_row')
+    record_cls = None
+    field_names = ()
+
+    def __init__(self, table: ColumnTable, row: int):
+        self._table = table
+        self._row = row
+
+    def to_record(self):
+        """Materialize this row as the original dataclass"""
+        return self.record_cls(**{name: getattr(self, name) for name in self.field_names})
+
+    def __repr__(self):
+        return repr(self.to_record())
+
+    def __eq__(self, other):
+        if isinstance(other, RowProxy):
+            other = other.to_record()
+        return self.to_record() == other
+
+    # Proxies compare by value and can be written through, so like the
+    # (non-frozen) dataclasses they stand in for they are unhashable
+    __hash__ = None
+
+def row_proxy_class(record_cls, computed: Optional[Dict[str, Callable]] = None):
+    """Create a RowProxy subclass exposing a dataclass's fields over a ColumnTable
+
+    Plain fields read and write the column of the same name; `computed` maps
+    field names to functions (table, row) -> value for fields that are not
+    stored as a single column.
+    """
+    computed = computed or {}
+
+    def make_property(name):
+        if name in computed:
+            getter = computed[name]
+            return property(lambda self: getter(self._table, self._row))
+        return property(lambda self: self._table.get(name, self._row),
+                        lambda self, value: self._table.set(name, self._row, value))
+
+    field_names = tuple(f.name for f in fields(record_cls))
+    namespace = {'__slots__': (), 'record_cls': record_cls, 'field_names': field_names}
+    for name in field_names:
+        namespace[name] = make_property(name)
+    return type(f"{record_cls.__name__}Row", (RowProxy,), namespace)
+
+class RecordView:
+    """List-like view of a ColumnTable that yields row proxies
+
+    Keeps the `employees` / `survey_responses` / `engagement_metrics` list API
+    working on top of columnar storage.
+    """
+
+    def __init__(self, table: ColumnTable, proxy_cls, to_row: Callable[[Any], Dict[str, Any]]):
+        self.table = table
+        self.proxy_cls = proxy_cls
+        self.to_row = to_row
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.proxy_cls(self.table, i) for i in range(*index.indices(len(self.table)))]
+        if index < 0:
+            index += len(self.table)
+        if not 0 <= index < len(self.table):
+            raise IndexError("record index out of range")
+        return self.proxy_cls(self.table, index)
+
+    def __iter__(self):
+        for i in range(len(self.table)):
+            yield self.proxy_cls(self.table, i)
+
+    def __bool__(self):
+        return len(self.table) > 0
+
+    def append(self, record):
+        """Append a dataclass record (or row proxy) as a new row"""
+        self.table.append_row(self.to_row(record))
+
+    def extend(self, records: Iterable):
+        for record in records:
+            self.append(record)
+
+    def to_records(self) -> list:
+        """Materialize every row as its dataclass"""
+        return [proxy.to_record() for proxy in self]
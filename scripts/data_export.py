@@ -0,0 +1,188 @@
+import pandas as pd
+import gzip
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export needs pyarrow; the text formats do not
+    pa = None
+    pq = None
+
+# Format -> file extension
+EXPORT_FORMATS = {'parquet': '.parquet', 'csv': '.csv', 'csv.gz': '.csv.gz', 'ndjson': '.ndjson', 'ndjson.gz': '.ndjson.gz'}
+MISSING_PARTITION = '__missing__'
+
+def infer_export_format(path: str) -> str:
+    """Export format from a file name's extension (longest match wins)"""
+    for file_format, extension in sorted(EXPORT_FORMATS.items(), key=lambda item: -len(item[1])):
+        if path.endswith(extension):
+            return file_format
+    raise ValueError(f"Cannot infer an export format from '{path}'; pass one of {list(EXPORT_FORMATS)}")
+
+class ExportCancelled(Exception):
+    """Raised by ExportJob.wait() when the export was cancelled"""
+
+class ExportJob:
+    """An export running in the background; wait() returns the files written"""
+
+    def __init__(self, total_rows: int, progress: Optional[Callable[[int, int], None]]):
+        self.total_rows = total_rows
+        self.rows_written = 0
+        self.files = []
+        self.error = None
+        self._progress = progress
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread = None
+
+    def _advance(self, rows: int):
+        with self._lock:
+            self.rows_written += rows
+            if self._progress is not None:
+                self._progress(self.rows_written, self.total_rows)
+        if self._cancelled.is_set():
+            raise ExportCancelled()
+
+    def cancel(self):
+        """Stop after the chunk being written; partial files are left in place"""
+        self._cancelled.set()
+
+    def done(self) -> bool:
+        return self._thread is None or not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.files
+
+class ChunkedExporter:
+    """Writes a DataFrame as Parquet, CSV (optionally gzipped) or NDJSON in chunks
+
+    Chunks of `chunk_size` rows are written one after another, so the whole
+    frame is never serialized at once. With `partition_by`, the output path
+    is a directory holding one file per value (`<column>=<value>/part<ext>`),
+    and `n_jobs` partitions are written concurrently. Parquet files get one
+    row group per chunk.
+    """
+
+    def __init__(self, file_format: str = 'parquet', chunk_size: int = 100000,
+                 compression: Optional[str] = None, n_jobs: int = 1):
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{file_format}'; expected one of {list(EXPORT_FORMATS)}")
+        if file_format == 'parquet' and pq is None:
+            raise ImportError("Parquet export requires pyarrow")
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        # Parquet codec; the .gz formats use gzip at this level (default 6, much faster than 9)
+        self.compression = compression
+        self.n_jobs = n_jobs
+
+    def export(self, data: pd.DataFrame, path: str, columns: Optional[Sequence[str]] = None,
+               partition_by: Optional[str] = None, progress: Optional[Callable[[int, int], None]] = None,
+               background: bool = True) -> ExportJob:
+        """Start exporting `data` (projected to `columns`) to `path`
+
+        `progress(rows_written, total_rows)` is called after every chunk. With
+        background=False the export runs (and errors raise) before returning.
+        """
+        if columns is not None:
+            keep = list(columns) + ([partition_by] if partition_by and partition_by not in columns else [])
+            data = data[keep]
+        else:
+            # Shallow copy: columns the caller adds later do not race with the writer
+            data = data.copy(deep=False)
+
+        job = ExportJob(len(data), progress)
+        if background:
+            job._thread = threading.Thread(target=self._run, args=(job, data, path, columns, partition_by),
+                                           name='dashboard-export', daemon=True)
+            job._thread.start()
+        else:
+            self._run(job, data, path, columns, partition_by)
+            job.wait()
+        return job
+
+    def _run(self, job: ExportJob, data: pd.DataFrame, path: str, columns, partition_by):
+        try:
+            if partition_by is None:
+                self._write_file(job, data, path)
+                return
+            os.makedirs(path, exist_ok=True)
+            parts = []
+            for value, part in data.groupby(partition_by, observed=True, dropna=False, sort=True):
+                value = value[0] if isinstance(value, tuple) else value
+                name = MISSING_PARTITION if pd.isna(value) else str(value).replace(os.sep, '_')
+                directory = os.path.join(path, f"{partition_by}={name}")
+                os.makedirs(directory, exist_ok=True)
+                # The partition value lives in the directory name, as in Hive-style layouts
+                if columns is None or partition_by not in columns:
+                    part = part.drop(columns=partition_by)
+                parts.append((part, os.path.join(directory, 'part' + EXPORT_FORMATS[self.file_format])))
+            if self.n_jobs == 1:
+                for part, part_path in parts:
+                    self._write_file(job, part, part_path)
+            else:
+                with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                    for future in [executor.submit(self._write_file, job, part, part_path) for part, part_path in parts]:
+                        future.result()
+        except BaseException as error:
+            job.error = error
+
+    def _chunks(self, data: pd.DataFrame):
+        for start in range(0, len(data), self.chunk_size):
+            yield data.iloc[start:start + self.chunk_size]
+
+    def _write_file(self, job: ExportJob, data: pd.DataFrame, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.file_format == 'parquet':
+            self._write_parquet(job, data, path)
+        else:
+            self._write_text(job, data, path)
+        with job._lock:
+            job.files.append(path)
+
+    @staticmethod
+    def _parquet_schema(data: pd.DataFrame) -> 'pa.Schema':
+        """Arrow schema for all of `data`, so every chunk converts to the same types
+
+        Typed columns map straight from their dtype. Object columns are typed
+        from all of their values, not just the first chunk's; columns with no
+        values at all are written as strings.
+        """
+        schema = pa.Schema.from_pandas(data.iloc[:0], preserve_index=False)
+        for i, field in enumerate(schema):
+            if pa.types.is_null(field.type):
+                inferred = pa.infer_type(data[field.name].to_numpy(dtype=object), from_pandas=True)
+                schema = schema.set(i, pa.field(field.name, pa.string() if pa.types.is_null(inferred) else inferred))
+        return schema
+
+    def _write_parquet(self, job: ExportJob, data: pd.DataFrame, path: str):
+        schema = self._parquet_schema(data)
+        with pq.ParquetWriter(path, schema, compression=self.compression or 'snappy') as writer:
+            for chunk in self._chunks(data):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                job._advance(len(chunk))
+
+    def _write_text(self, job: ExportJob, data: pd.DataFrame, path: str):
+        gzipped = self.file_format.endswith('.gz')
+        level = int(self.compression) if gzipped and self.compression else 6
+        with (gzip.open(path, 'wt', compresslevel=level, newline='', encoding='utf-8') if gzipped
+              else open(path, 'w', newline='', encoding='utf-8')) as f:
+            if self.file_format.startswith('csv') and data.empty:
+                # No chunks to write, but the file still gets its header
+                data.to_csv(f, index=False)
+            for i, chunk in enumerate(self._chunks(data)):
+                if self.file_format.startswith('csv'):
+                    chunk.to_csv(f, header=i == 0, index=False)
+                else:
+                    lines = chunk.to_json(orient='records', lines=True, date_format='iso')
+                    f.write(lines if lines.endswith('\n') else lines + '\n')
+                job._advance(len(chunk))
@@ -1,9 +1,20 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import json
+import os
+import re
+
+from columnar_store import ColumnTable, RecordView, RowProxy, row_proxy_class
+from timeseries_store import MetricHistory
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 @dataclass
 class Employee:
@@ -25,7 +36,8 @@ class SurveyResponse:
     survey_type: str  # eNPS, Gallup Q12, custom
     responses: Dict[str, any]
     sentiment_score: Optional[float] = None
-    timestamp: datetime = datetime.now()
+    # Per-instance default; a plain datetime.now() default is evaluated once at import
+    timestamp: datetime = field(default_factory=datetime.now)
 
 @dataclass
 class EngagementMetrics:
@@ -36,22 +48,186 @@ class EngagementMetrics:
     satisfaction_score: float
     turnover_risk: float
     department: str
-    last_updated: datetime = datetime.now()
+    last_updated: datetime = field(default_factory=datetime.now)
+
+# Column layouts for the columnar store backing EmployeeEngagementData
+EMPLOYEE_SCHEMA = {
+    'employee_id': 'object',
+    'name': 'object',
+    'department': 'category',
+    'role': 'object',
+    'hire_date': 'datetime64[us]',
+    'work_arrangement': 'category',
+    'level': 'category',
+    'manager_id': 'object'
+}
+
+SURVEY_QUESTIONS = ['job_satisfaction', 'work_life_balance', 'career_development',
+                    'management_support', 'company_culture', 'compensation_satisfaction']
+
+# Answers are 1-10; 0 marks a question the respondent skipped
+MISSING_ANSWER = 0
+
+SURVEY_RESPONSE_SCHEMA = {
+    'response_id': 'object',
+    'employee_id': 'object',
+    'survey_type': 'category',
+    **{question: 'int8' for question in SURVEY_QUESTIONS},
+    # Any answers outside the six standard questions, as a dict (or None)
+    'extra_responses': 'object',
+    'sentiment_score': 'float64',
+    'timestamp': 'datetime64[us]'
+}
+
+# Alternate spellings seen in survey exports, after normalize_question_key
+QUESTION_ALIASES = {
+    'satisfaction': 'job_satisfaction',
+    'work_life': 'work_life_balance',
+    'worklife_balance': 'work_life_balance',
+    'wlb': 'work_life_balance',
+    'career_growth': 'career_development',
+    'manager_support': 'management_support',
+    'culture': 'company_culture',
+    'compensation': 'compensation_satisfaction',
+    'pay_satisfaction': 'compensation_satisfaction'
+}
+
+# Columns of a survey export that are not question answers
+SURVEY_META_COLUMNS = ['response_id', 'employee_id', 'survey_type', 'sentiment_score', 'timestamp']
+
+def normalize_question_key(key: str) -> str:
+    """Normalize a survey column name to the keys used by prepare_features"""
+    key = re.sub(r'[^0-9a-z]+', '_', str(key).strip().lower()).strip('_')
+    for prefix in ('responses_', 'q_'):
+        if key.startswith(prefix) and key[len(prefix):]:
+            key = key[len(prefix):]
+    return QUESTION_ALIASES.get(key, key)
+
+# Direct reports per manager in generated sample data: employee i reports to
+# employee (i - 1) // SAMPLE_SPAN_OF_CONTROL, so EMP0000 heads the org
+SAMPLE_SPAN_OF_CONTROL = 8
+
+def sample_manager_id(i: int) -> Optional[str]:
+    return f"EMP{(i - 1) // SAMPLE_SPAN_OF_CONTROL:04d}" if i > 0 else None
+
+# Bump when the on-disk layout written by save_snapshot changes
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MANIFEST = 'manifest.json'
+
+ENGAGEMENT_METRICS_SCHEMA = {
+    'employee_id': 'object',
+    'enps_score': 'float64',
+    'engagement_score': 'float64',
+    'satisfaction_score': 'float64',
+    'turnover_risk': 'float64',
+    'department': 'category',
+    'last_updated': 'datetime64[us]'
+}
+
+def _survey_responses_getter(table: ColumnTable, row: int) -> Dict[str, any]:
+    responses = {}
+    for question in SURVEY_QUESTIONS:
+        answer = table.get(question, row)
+        if answer != MISSING_ANSWER:
+            responses[question] = answer
+    responses.update(table.get('extra_responses', row) or {})
+    return responses
+
+def _survey_answer(question: str, value) -> int:
+    """Storage value for one standard answer: a whole number 1-10, or MISSING_ANSWER if unanswered"""
+    if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+        return MISSING_ANSWER
+    if not isinstance(value, (int, float, np.number)) or value % 1 or not 1 <= value <= 10:
+        raise ValueError(f"Answer to {question!r} must be a whole number from 1 to 10, got {value!r}")
+    return int(value)
+
+def _survey_response_to_row(response) -> Dict[str, any]:
+    """Split a response's answers into the standard question columns and extra_responses
+    
+    Unanswered standard questions (None/NaN) are stored as MISSING_ANSWER and
+    read back as absent; answers to any other question key are kept as-is in
+    the row's extra_responses dict.
+    """
+    row = {
+        'response_id': response.response_id,
+        'employee_id': response.employee_id,
+        'survey_type': response.survey_type,
+        'sentiment_score': response.sentiment_score,
+        'timestamp': response.timestamp
+    }
+    extra = {}
+    for key, value in response.responses.items():
+        if key in SURVEY_QUESTIONS:
+            row[key] = _survey_answer(key, value)
+        else:
+            extra[key] = value
+    row['extra_responses'] = extra or None
+    return row
+
+def _record_to_row(record) -> Dict[str, any]:
+    return {name: getattr(record, name) for name in record.field_names} \
+        if isinstance(record, RowProxy) else dict(vars(record))
+
+EmployeeRow = row_proxy_class(Employee)
+SurveyResponseRow = row_proxy_class(SurveyResponse, {'responses': _survey_responses_getter})
+EngagementMetricsRow = row_proxy_class(EngagementMetrics)
 
 class EmployeeEngagementData:
-    """Main data management class for IGNITE project"""
+    """Main data management class for IGNITE project
+    
+    Records live in three columnar tables; `employees`, `survey_responses`
+    and `engagement_metrics` are list-like views yielding row proxies with
+    the same attributes as the dataclasses above.
+    """
+    
+    SURVEY_QUESTIONS = SURVEY_QUESTIONS
     
-    def __init__(self):
-        self.employees = []
-        self.survey_responses = []
-        self.engagement_metrics = []
+    def __init__(self, reference_date: Optional[datetime] = None):
+        self.employee_table = ColumnTable(EMPLOYEE_SCHEMA)
+        self.survey_table = ColumnTable(SURVEY_RESPONSE_SCHEMA)
+        self.metrics_table = ColumnTable(ENGAGEMENT_METRICS_SCHEMA)
+        # Date tenure is measured against; None means "now" at the time the
+        # employees frame is (re)built
+        self.reference_date = reference_date
+        # name -> (table version, DataFrame) for the get_*_df methods
+        self._df_cache = {}
+        # Latest SentimentAnalyzer output, persisted alongside the tables
+        self.sentiment_results: Optional[pd.DataFrame] = None
+        # Metric snapshots across survey waves, also persisted with the tables
+        self.metric_history: Optional[MetricHistory] = None
+    
+    @property
+    def employees(self) -> RecordView:
+        return RecordView(self.employee_table, EmployeeRow, _record_to_row)
+    
+    @property
+    def survey_responses(self) -> RecordView:
+        return RecordView(self.survey_table, SurveyResponseRow, _survey_response_to_row)
+    
+    @property
+    def engagement_metrics(self) -> RecordView:
+        return RecordView(self.metrics_table, EngagementMetricsRow, _record_to_row)
         
+    def _reset_tables(self):
+        """Empty the record tables (and their cached frames), keeping every other attribute"""
+        for table in self._tables().values():
+            table.clear()
+        self._df_cache.clear()
+    
     def generate_sample_data(self, num_employees=100):
-        """Generate sample employee data for demonstration"""
+        """Generate sample employee data for demonstration
+        
+        Replaces any employees, survey responses and metrics already in the
+        store rather than adding to them; other attributes (sentiment results,
+        metric history) are kept.
+        """
         departments = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance', 'Operations']
         work_arrangements = ['hybrid', 'remote', 'in-office']
         levels = ['junior', 'mid', 'senior', 'leadership']
         
+        # Generated data replaces any records loaded before
+        self._reset_tables()
+        
         # Generate employees
         for i in range(num_employees):
             employee = Employee(
@@ -61,7 +237,8 @@ class EmployeeEngagementData:
                 role=f"Role {i+1}",
                 hire_date=datetime.now() - timedelta(days=np.random.randint(30, 1825)),
                 work_arrangement=np.random.choice(work_arrangements),
-                level=np.random.choice(levels)
+                level=np.random.choice(levels),
+                manager_id=sample_manager_id(i)
             )
             self.employees.append(employee)
             
@@ -101,51 +278,373 @@ class EmployeeEngagementData:
         print(f"Generated sample data for {num_employees} employees")
         return self
     
+    def generate_sample_data_vectorized(self, num_employees=100,
+                                        rng: Optional[np.random.Generator] = None):
+        """Generate sample data column-wise, drawing each attribute in a single NumPy call
+        
+        Like generate_sample_data, this replaces the records already in the
+        store. No dataclass lists are built: `employees` and the other record
+        views create row proxies on access, and `.to_records()` on a view
+        materializes the dataclasses eagerly when a caller needs them.
+        """
+        departments = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance', 'Operations']
+        work_arrangements = ['hybrid', 'remote', 'in-office']
+        levels = ['junior', 'mid', 'senior', 'leadership']
+        
+        if rng is None:
+            rng = np.random.default_rng()
+        
+        # Generated data replaces any records loaded before
+        self._reset_tables()
+        now = np.datetime64(datetime.now(), 'us')
+        index = range(num_employees)
+        employee_ids = [f"EMP{i:04d}" for i in index]
+        department = pd.Categorical.from_codes(
+            rng.integers(0, len(departments), num_employees), categories=departments)
+        
+        # Employees
+        self.employee_table.append_columns({
+            'employee_id': employee_ids,
+            'name': [f"Employee {i+1}" for i in index],
+            'department': department,
+            'role': [f"Role {i+1}" for i in index],
+            'hire_date': now - rng.integers(30, 1825, num_employees).astype('timedelta64[D]'),
+            'work_arrangement': pd.Categorical.from_codes(
+                rng.integers(0, len(work_arrangements), num_employees), categories=work_arrangements),
+            'level': pd.Categorical.from_codes(
+                rng.integers(0, len(levels), num_employees), categories=levels),
+            'manager_id': [sample_manager_id(i) for i in index]
+        })
+        
+        # Survey responses: one (num_employees x questions) draw for all answers
+        answers = rng.integers(1, 11, (num_employees, len(SURVEY_QUESTIONS)), dtype=np.int8)
+        self.survey_table.append_columns({
+            'response_id': [f"RESP{i:04d}" for i in index],
+            'employee_id': employee_ids,
+            'survey_type': pd.Categorical.from_codes(np.zeros(num_employees, dtype=np.int8),
+                                                     categories=['custom_satisfaction']),
+            **{question: answers[:, j] for j, question in enumerate(SURVEY_QUESTIONS)},
+            'sentiment_score': rng.uniform(0.2, 0.9, num_employees),
+            'timestamp': np.full(num_employees, now)
+        })
+        
+        # Engagement metrics
+        self.metrics_table.append_columns({
+            'employee_id': employee_ids,
+            'enps_score': rng.integers(-100, 101, num_employees),
+            'engagement_score': rng.uniform(1, 10, num_employees),
+            'satisfaction_score': rng.uniform(1, 10, num_employees),
+            'turnover_risk': rng.uniform(0, 1, num_employees),
+            'department': department,
+            'last_updated': np.full(num_employees, now)
+        })
+        
+        print(f"Generated sample data for {num_employees} employees")
+        return self
+    
+    def generate_metric_history(self, num_waves=6, wave_days=30,
+                                rng: Optional[np.random.Generator] = None) -> pd.DataFrame:
+        """Sample per-employee snapshots over `num_waves` survey waves, `wave_days` apart
+
+        The latest wave is the current engagement metrics and survey answers;
+        earlier waves step back from it with a per-department drift plus
+        individual noise. Rows are oldest first, shaped for MetricHistory.append().
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        metrics = self.get_engagement_metrics_df()
+        survey = self.get_survey_responses_df().drop_duplicates('employee_id', keep='last').set_index('employee_id')
+        current = metrics.join(survey[SURVEY_QUESTIONS], on='employee_id')
+        dept_codes, dept_labels = pd.factorize(current['department'].astype(object))
+
+        # Column -> (low, high, step scale, rounded)
+        ranges = {
+            'engagement_score': (1, 10, 0.3, False),
+            'satisfaction_score': (1, 10, 0.3, False),
+            'enps_score': (-100, 100, 8, True),
+            'turnover_risk': (0, 1, 0.04, False),
+            **{question: (1, 10, 0.5, True) for question in SURVEY_QUESTIONS}
+        }
+        values = {col: current[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in ranges}
+        drift = {col: rng.normal(0, scale / 2, len(dept_labels) + 1)[dept_codes]
+                 for col, (_, _, scale, _) in ranges.items()}
+
+        waves = []
+        for wave in range(num_waves):
+            if wave:
+                for col, (low, high, scale, rounded) in ranges.items():
+                    stepped = np.clip(values[col] - drift[col] - rng.normal(0, scale, len(current)), low, high)
+                    values[col] = np.round(stepped) if rounded else stepped
+            waves.append(pd.DataFrame({
+                'employee_id': current['employee_id'].to_numpy(),
+                'department': current['department'].to_numpy(),
+                'timestamp': current['last_updated'].to_numpy() - np.timedelta64(wave * wave_days, 'D'),
+                **{col: values[col].copy() for col in ranges}
+            }))
+        return pd.concat(waves[::-1], ignore_index=True)
+
+    def _cached_frame(self, name: str, table: ColumnTable, build) -> pd.DataFrame:
+        """Return the cached frame for `name`, rebuilding it only if `table` changed
+        
+        Callers get a shallow copy, so adding columns to it never leaks into
+        the cache.
+        """
+        cached = self._df_cache.get(name)
+        if cached is None or cached[0] != table.version:
+            cached = (table.version, build())
+            self._df_cache[name] = cached
+        return cached[1].copy(deep=False)
+    
     def get_employees_df(self):
-        """Convert employees to DataFrame"""
-        return pd.DataFrame([
-            {
-                'employee_id': emp.employee_id,
-                'name': emp.name,
-                'department': emp.department,
-                'role': emp.role,
-                'hire_date': emp.hire_date,
-                'work_arrangement': emp.work_arrangement,
-                'level': emp.level,
-                'tenure_days': (datetime.now() - emp.hire_date).days
-            }
-            for emp in self.employees
-        ])
+        """Convert employees to DataFrame
+        
+        Label columns (department, level, ...) come back as plain object
+        columns, so callers can assign new labels to them.
+        """
+        return self._cached_frame('employees', self.employee_table, self._build_employees_df)
     
     def get_survey_responses_df(self):
         """Convert survey responses to DataFrame"""
-        data = []
-        for response in self.survey_responses:
-            row = {
-                'response_id': response.response_id,
-                'employee_id': response.employee_id,
-                'survey_type': response.survey_type,
-                'sentiment_score': response.sentiment_score,
-                'timestamp': response.timestamp
-            }
-            row.update(response.responses)
-            data.append(row)
-        return pd.DataFrame(data)
+        return self._cached_frame('survey_responses', self.survey_table, self._build_survey_responses_df)
     
     def get_engagement_metrics_df(self):
         """Convert engagement metrics to DataFrame"""
-        return pd.DataFrame([
-            {
-                'employee_id': metrics.employee_id,
-                'enps_score': metrics.enps_score,
-                'engagement_score': metrics.engagement_score,
-                'satisfaction_score': metrics.satisfaction_score,
-                'turnover_risk': metrics.turnover_risk,
-                'department': metrics.department,
-                'last_updated': metrics.last_updated
-            }
-            for metrics in self.engagement_metrics
-        ])
+        return self._cached_frame('engagement_metrics', self.metrics_table,
+                                  lambda: self.metrics_table.to_frame(categorical=False))
+    
+    def _build_employees_df(self) -> pd.DataFrame:
+        df = self.employee_table.to_frame(categorical=False)
+        reference = np.datetime64(self.reference_date or datetime.now(), 'us')
+        # One vectorized subtraction against a single reference date
+        df['tenure_days'] = (reference - df['hire_date'].to_numpy()).astype('timedelta64[D]').astype(np.int64)
+        return df
+    
+    def _build_survey_responses_df(self) -> pd.DataFrame:
+        table = self.survey_table
+        df = table.to_frame(['response_id', 'employee_id', 'survey_type', 'sentiment_score', 'timestamp'],
+                            categorical=False)
+        for question in SURVEY_QUESTIONS:
+            answers = table.column(question)
+            missing = answers == MISSING_ANSWER
+            # Skipped questions surface as <NA> rather than the 0 sentinel
+            df[question] = pd.arrays.IntegerArray(answers, missing) if missing.any() else answers
+        
+        extra = table.column('extra_responses')
+        if any(value is not None for value in extra):
+            extra_df = pd.DataFrame([value or {} for value in extra])
+            for col in extra_df.columns:
+                df[col] = extra_df[col].to_numpy()
+        return df
+
+    def ingest_survey_responses(self, path: str, chunk_size: int = 50000,
+                                file_format: Optional[str] = None,
+                                on_error: str = 'raise') -> Dict[str, int]:
+        """Stream survey responses from a CSV or JSONL file into the store
+        
+        The file is read `chunk_size` rows at a time, so memory use is bounded
+        by the chunk rather than the file. Column names are normalized with
+        normalize_question_key; nested JSON `responses` objects are flattened.
+        Rows with a missing id or an answer that is not a whole number from
+        1 to 10 raise a ValueError, or are dropped and counted when
+        `on_error='skip'`.
+        """
+        if on_error not in ('raise', 'skip'):
+            raise ValueError("on_error must be 'raise' or 'skip'")
+        if file_format is None:
+            name = path.lower()
+            for suffix in ('.gz', '.bz2', '.zip', '.xz'):
+                if name.endswith(suffix):
+                    name = name[:-len(suffix)]
+            file_format = 'jsonl' if name.endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+        
+        if file_format == 'csv':
+            reader = pd.read_csv(path, chunksize=chunk_size, dtype={'response_id': str, 'employee_id': str})
+        elif file_format == 'jsonl':
+            reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+        else:
+            raise ValueError(f"Unsupported survey file format: {file_format}")
+        
+        stats = {'chunks': 0, 'rows_read': 0, 'rows_ingested': 0, 'rows_skipped': 0}
+        with reader:
+            for chunk in reader:
+                columns, skipped = self._validate_survey_chunk(chunk, stats['rows_read'], on_error)
+                stats['chunks'] += 1
+                stats['rows_read'] += len(chunk)
+                stats['rows_skipped'] += skipped
+                if columns:
+                    stats['rows_ingested'] += self.survey_table.append_columns(columns)
+        
+        print(f"Ingested {stats['rows_ingested']} survey responses from {path}")
+        return stats
+    
+    def _validate_survey_chunk(self, chunk: pd.DataFrame, offset: int, on_error: str):
+        """Normalize and validate one chunk; returns (columns for append_columns, rows skipped)"""
+        if 'responses' in chunk.columns:
+            # JSONL exports may nest the answers in a `responses` object
+            nested = pd.DataFrame([r if isinstance(r, dict) else {} for r in chunk['responses']],
+                                  index=chunk.index)
+            chunk = pd.concat([chunk.drop(columns='responses'), nested], axis=1)
+        chunk = chunk.rename(columns=normalize_question_key)
+        chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+        
+        missing = [col for col in ('response_id', 'employee_id') if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Survey file is missing required columns: {missing}")
+        
+        invalid = chunk['response_id'].isna() | chunk['employee_id'].isna()
+        answers = {}
+        for question in SURVEY_QUESTIONS:
+            if question not in chunk.columns:
+                answers[question] = np.full(len(chunk), MISSING_ANSWER, dtype=np.int8)
+                continue
+            values = pd.to_numeric(chunk[question], errors='coerce')
+            present = chunk[question].notna()
+            # Answers are whole points on the 1-10 scale; 7.6 is an error, not a 7
+            invalid |= present & ~(values.between(1, 10) & (values % 1 == 0))
+            answers[question] = values.fillna(MISSING_ANSWER).clip(0, 10).to_numpy().astype(np.int8)
+        
+        if invalid.any():
+            if on_error == 'raise':
+                row = offset + int(np.flatnonzero(invalid.to_numpy())[0])
+                raise ValueError(f"Invalid survey response at data row {row}")
+            keep = ~invalid.to_numpy()
+            chunk = chunk[keep]
+            answers = {question: values[keep] for question, values in answers.items()}
+        if chunk.empty:
+            return None, int(invalid.sum())
+        
+        columns = {
+            'response_id': chunk['response_id'].astype(str).to_numpy(dtype=object),
+            'employee_id': chunk['employee_id'].astype(str).to_numpy(dtype=object),
+            'survey_type': chunk['survey_type'].fillna('custom') if 'survey_type' in chunk.columns else 'custom',
+            **answers,
+            'sentiment_score': pd.to_numeric(chunk['sentiment_score'], errors='coerce').to_numpy(dtype=np.float64)
+                if 'sentiment_score' in chunk.columns else np.nan,
+            'timestamp': pd.to_datetime(chunk['timestamp'], errors='coerce', format='mixed')
+                if 'timestamp' in chunk.columns else np.datetime64(datetime.now(), 'us')
+        }
+        
+        # Anything that is neither metadata nor a standard question is kept per row
+        extra_cols = [col for col in chunk.columns if col not in SURVEY_META_COLUMNS and col not in SURVEY_QUESTIONS]
+        if extra_cols:
+            extra = chunk[extra_cols]
+            columns['extra_responses'] = [
+                {k: v for k, v in zip(extra_cols, values) if not pd.isna(v)} or None
+                for values in extra.itertuples(index=False, name=None)
+            ]
+        return columns, int(invalid.sum())
+    
+    def _tables(self) -> Dict[str, ColumnTable]:
+        return {
+            'employees': self.employee_table,
+            'survey_responses': self.survey_table,
+            'engagement_metrics': self.metrics_table
+        }
+    
+    def save_snapshot(self, directory: str, sentiment_df: Optional[pd.DataFrame] = None,
+                      file_format: str = 'arrow') -> str:
+        """Write all tables (plus sentiment results and metric history) to a versioned snapshot directory
+        
+        'arrow' writes uncompressed Arrow IPC files that load_snapshot
+        memory-maps; 'parquet' trades reload speed for smaller files. The
+        metric history is written one file per time partition under history/.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for snapshots (pip install pyarrow)")
+        if file_format not in ('arrow', 'parquet'):
+            raise ValueError(f"Unsupported snapshot format: {file_format}")
+        
+        os.makedirs(directory, exist_ok=True)
+        manifest = {
+            'format_version': SNAPSHOT_FORMAT_VERSION,
+            'file_format': file_format,
+            'created_at': datetime.now().isoformat(),
+            'reference_date': self.reference_date.isoformat() if self.reference_date else None,
+            'tables': {}
+        }
+        
+        for name, table in self._tables().items():
+            arrow_table, columns = table.to_arrow()
+            filename = f"{name}.{file_format}"
+            self._write_arrow(arrow_table, os.path.join(directory, filename), file_format)
+            manifest['tables'][name] = {'file': filename, 'rows': len(table), 'columns': columns}
+        
+        sentiment_df = self.sentiment_results if sentiment_df is None else sentiment_df
+        if sentiment_df is not None:
+            filename = f"sentiment_results.{file_format}"
+            self._write_arrow(pa.Table.from_pandas(sentiment_df, preserve_index=False),
+                              os.path.join(directory, filename), file_format)
+            manifest['sentiment_results'] = {'file': filename, 'rows': len(sentiment_df)}
+        
+        if self.metric_history is not None:
+            history = self.metric_history
+            os.makedirs(os.path.join(directory, 'history'), exist_ok=True)
+            partitions = []
+            for period, frame in history.partition_frames():
+                filename = os.path.join('history', f"{period}.{file_format}")
+                self._write_arrow(pa.Table.from_pandas(frame, preserve_index=False),
+                                  os.path.join(directory, filename), file_format)
+                partitions.append({'period': str(period), 'file': filename, 'rows': len(frame)})
+            manifest['metric_history'] = {'partition_freq': history.partition_freq,
+                                          'metrics': list(history.metrics), 'partitions': partitions}
+        
+        # Manifest goes last so a partially written snapshot is never loadable
+        with open(os.path.join(directory, SNAPSHOT_MANIFEST), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        
+        print(f"Snapshot saved to {directory}")
+        return directory
+    
+    @staticmethod
+    def _write_arrow(arrow_table, path: str, file_format: str):
+        if file_format == 'parquet':
+            pq.write_table(arrow_table, path)
+        else:
+            with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+    
+    @staticmethod
+    def _read_arrow(path: str, file_format: str):
+        if file_format == 'parquet':
+            return pq.read_table(path, memory_map=True)
+        # Buffers point straight into the mapped file; nothing is copied here
+        return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    
+    @classmethod
+    def load_snapshot(cls, directory: str) -> 'EmployeeEngagementData':
+        """Load a snapshot written by save_snapshot, memory-mapping Arrow files"""
+        if pa is None:
+            raise ImportError("pyarrow is required for snapshots (pip install pyarrow)")
+        with open(os.path.join(directory, SNAPSHOT_MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {manifest.get('format_version')} "
+                             f"(expected {SNAPSHOT_FORMAT_VERSION})")
+        
+        file_format = manifest['file_format']
+        reference_date = manifest.get('reference_date')
+        data = cls(datetime.fromisoformat(reference_date) if reference_date else None)
+        
+        for name, entry in manifest['tables'].items():
+            arrow_table = cls._read_arrow(os.path.join(directory, entry['file']), file_format)
+            table = ColumnTable.from_arrow(arrow_table, entry['columns'])
+            setattr(data, {'employees': 'employee_table',
+                           'survey_responses': 'survey_table',
+                           'engagement_metrics': 'metrics_table'}[name], table)
+        
+        if 'sentiment_results' in manifest:
+            entry = manifest['sentiment_results']
+            data.sentiment_results = cls._read_arrow(os.path.join(directory, entry['file']), file_format).to_pandas()
+        
+        if 'metric_history' in manifest:
+            entry = manifest['metric_history']
+            data.metric_history = MetricHistory(entry['partition_freq'], entry['metrics'])
+            for partition in entry['partitions']:
+                data.metric_history.append(
+                    cls._read_arrow(os.path.join(directory, partition['file']), file_format).to_pandas())
+        
+        return data
 
 # Initialize and generate sample data
 if __name__ == "__main__":
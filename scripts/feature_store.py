@@ -0,0 +1,204 @@
+import pandas as pd
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Survey questions that get derived features
+SURVEY_FEATURE_COLUMNS = ['job_satisfaction', 'work_life_balance', 'career_development',
+                          'management_support', 'company_culture', 'compensation_satisfaction']
+# Risk indicator name -> survey question flagged when the answer is 5 or lower
+RISK_INDICATORS = {
+    'low_satisfaction': 'job_satisfaction',
+    'poor_work_life_balance': 'work_life_balance',
+    'limited_career_dev': 'career_development',
+    'weak_management': 'management_support'
+}
+CATEGORICAL_FEATURES = ['department', 'work_arrangement', 'level']
+
+def _key_array(keys) -> np.ndarray:
+    """employee_id values as fixed-width strings, which sort and search natively"""
+    return np.asarray(keys).astype(str)
+
+def left_join_indexer(sorted_keys: np.ndarray, key_order: np.ndarray,
+                      right_keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row indexers for a left join against unique left keys given pre-sorted
+
+    `sorted_keys` is the left key array ordered by `key_order`. Unmatched
+    left rows get -1 on the right. Like merge(how='left'), left order is kept
+    and several right matches repeat the left row, in right order.
+    """
+    n = len(sorted_keys)
+    positions = np.minimum(np.searchsorted(sorted_keys, right_keys), max(n - 1, 0))
+    matched = np.flatnonzero(sorted_keys[positions] == right_keys) if n else np.empty(0, dtype=np.intp)
+    left_rows = key_order[positions[matched]]
+    counts = np.bincount(left_rows, minlength=n)
+
+    if counts.max(initial=0) <= 1:
+        right_index = np.full(n, -1, dtype=np.intp)
+        right_index[left_rows] = matched
+        return np.arange(n), right_index
+
+    repeats = np.maximum(counts, 1)
+    right_index = np.full(repeats.sum(), -1, dtype=np.intp)
+    right_index[np.repeat(counts > 0, repeats)] = matched[np.argsort(left_rows, kind='stable')]
+    return np.repeat(np.arange(n), repeats), right_index
+
+def _take(series: pd.Series, indexer: np.ndarray) -> pd.Series:
+    """Rows of `series` by position, -1 giving a missing value as in a left merge"""
+    if (indexer < 0).any():
+        values = pd.api.extensions.take(series.array, indexer, allow_fill=True)
+        return pd.Series(values, name=series.name, dtype=object if series.dtype == object else None)
+    return series.iloc[indexer].reset_index(drop=True)
+
+def float32_matrix(data: pd.DataFrame, columns: Sequence[str], fill_value: Optional[float] = None) -> np.ndarray:
+    """C-contiguous float32 matrix of `columns`, NaN replaced by `fill_value` if given"""
+    X = np.ascontiguousarray(data[list(columns)].to_numpy(dtype=np.float32, na_value=np.nan))
+    if fill_value is not None:
+        X[np.isnan(X)] = fill_value
+    return X
+
+class FeatureStore:
+    """Joined and feature-engineered employee data, built once and shared
+
+    Employees are left-joined to survey responses and engagement metrics on
+    employee_id through sorted key arrays (columns the employee frame already
+    has, such as department, are not duplicated). Derived features are added
+    as one block, and float32 matrices of any column set are cached for reuse
+    by the predictors and the dashboard. Label-encoded columns are kept in
+    `encoded`, apart from the `frame` the dashboard reads.
+    """
+
+    def __init__(self, employees_df: pd.DataFrame, survey_df: pd.DataFrame, metrics_df: pd.DataFrame):
+        # Sorted employee_id index, built once for the joins and row lookups
+        keys = _key_array(employees_df['employee_id'])
+        key_order = np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[key_order]
+
+        frame, row_index = self._join(employees_df, key_order, [survey_df, metrics_df])
+        self.frame = pd.concat([frame, self._derived_features(frame)], axis=1)
+        # Employee -> first joined row (rows of one employee are contiguous)
+        first_rows = np.searchsorted(row_index, np.arange(len(keys)))
+        self._row_order = first_rows[key_order]
+        self._row_counts = np.diff(np.append(first_rows, len(row_index)))[key_order]
+        # <col>_encoded columns from encode_categoricals, aligned to `frame`
+        self.encoded = pd.DataFrame(index=self.frame.index)
+        self._matrices = {}
+
+    def _join(self, employees_df: pd.DataFrame, key_order: np.ndarray,
+              others: List[pd.DataFrame]) -> Tuple[pd.DataFrame, np.ndarray]:
+        row_index = np.arange(len(employees_df))
+        columns = {}
+        for other in others:
+            other_index, right_index = left_join_indexer(self._sorted_keys, key_order,
+                                                         _key_array(other['employee_id']))
+            if len(other_index) == len(employees_df):
+                right_index = right_index[row_index]
+            elif len(row_index) == len(employees_df):
+                # One-to-many: columns joined so far are repeated to the new row count
+                columns = {name: _take(col, other_index) for name, col in columns.items()}
+                row_index = other_index
+            else:
+                raise ValueError("Only one joined frame may have several rows per employee")
+            for name in other.columns:
+                if name != 'employee_id' and name not in employees_df.columns and name not in columns:
+                    columns[name] = _take(other[name], right_index)
+
+        if len(row_index) == len(employees_df):
+            base = employees_df.reset_index(drop=True)
+        else:
+            base = pd.DataFrame({name: _take(employees_df[name], row_index)
+                                 for name in employees_df.columns})
+        return pd.concat([base] + list(columns.values()), axis=1), row_index
+
+    @staticmethod
+    def _derived_features(data: pd.DataFrame) -> pd.DataFrame:
+        derived = {'tenure_years': data['tenure_days'].to_numpy(dtype=np.float64) / 365.25}
+
+        questions = [col for col in SURVEY_FEATURE_COLUMNS if col in data.columns]
+        answers = data[questions].to_numpy(dtype=np.float64, na_value=np.nan)
+        normalized = answers / 10.0
+        derived.update((f"{col}_normalized", normalized[:, i]) for i, col in enumerate(questions))
+
+        flagged = [questions.index(col) for col in RISK_INDICATORS.values()]
+        flags = (answers[:, flagged] <= 5).astype(int)
+        derived.update((name, flags[:, i]) for i, name in enumerate(RISK_INDICATORS))
+        return pd.DataFrame(derived, index=data.index)
+
+    def encode_categoricals(self, label_encoders: Dict[str, LabelEncoder]) -> None:
+        """Set the <col>_encoded columns of `encoded`, fitting any encoder missing from `label_encoders`
+
+        Only each column's distinct labels go through the encoder; rows are
+        mapped with their factorized codes. `frame` is left untouched.
+        """
+        encoded = {}
+        for col in CATEGORICAL_FEATURES:
+            codes, labels = pd.factorize(self.frame[col].astype(object).fillna('Unknown'))
+            if col not in label_encoders:
+                label_encoders[col] = LabelEncoder().fit(labels)
+            encoded[f"{col}_encoded"] = label_encoders[col].transform(labels)[codes]
+
+        self.encoded = pd.DataFrame(encoded, index=self.frame.index)
+        self._matrices.clear()
+
+    def feature_frame(self) -> pd.DataFrame:
+        """`frame` plus the encoded columns, as a new frame sharing their data"""
+        return pd.concat([self.frame, self.encoded], axis=1)
+
+    def backs(self, data: pd.DataFrame, columns: Sequence[str]) -> bool:
+        """True if `data` still holds this store's values of `columns`, row for row
+
+        Holds for feature_frame() and copies of it with columns added. An
+        edited, filtered or reordered column is copied (copy-on-write), so it
+        no longer shares memory with the store and is not backed.
+        """
+        if len(data) != len(self.frame):
+            return False
+        for col in columns:
+            source = self.encoded if col in self.encoded.columns else self.frame
+            if col not in data.columns or col not in source.columns \
+                    or not np.may_share_memory(data[col].to_numpy(), source[col].to_numpy()):
+                return False
+        return True
+
+    def matrix(self, columns: Sequence[str], fill_value: Optional[float] = None) -> np.ndarray:
+        """Cached, read-only float32_matrix of `columns` (from `frame` or `encoded`)"""
+        key = (tuple(columns), fill_value)
+        if key not in self._matrices:
+            X = float32_matrix(self.feature_frame(), columns, fill_value)
+            X.setflags(write=False)
+            self._matrices[key] = X
+        return self._matrices[key]
+
+    def rows(self, employee_id: str) -> np.ndarray:
+        """Positions of an employee's joined rows, found by binary search on the sorted index"""
+        key = str(employee_id)
+        position = np.searchsorted(self._sorted_keys, key)
+        if position == len(self._sorted_keys) or self._sorted_keys[position] != key:
+            return np.empty(0, dtype=np.intp)
+        start = self._row_order[position]
+        return np.arange(start, start + self._row_counts[position])
+
+    def align(self, per_employee: pd.DataFrame) -> pd.DataFrame:
+        """Columns of a frame indexed by unique employee_id, aligned to the rows of `frame`
+
+        Uses the sorted index, so no hash merge is needed; employees missing
+        from `per_employee` get missing values.
+        """
+        keys = _key_array(per_employee.index)
+        positions = np.minimum(np.searchsorted(self._sorted_keys, keys), max(len(self._sorted_keys) - 1, 0))
+        matched = np.flatnonzero(self._sorted_keys[positions] == keys) if len(self._sorted_keys) else np.empty(0, dtype=np.intp)
+        # Every joined row of a matched employee takes that employee's values
+        counts = self._row_counts[positions[matched]]
+        starts = self._row_order[positions[matched]]
+        rows = np.repeat(starts, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        indexer = np.full(len(self.frame), -1, dtype=np.intp)
+        indexer[rows] = np.repeat(matched, counts)
+        return pd.DataFrame({name: _take(per_employee[name].reset_index(drop=True), indexer)
+                             for name in per_employee.columns})
+
+    def features(self, employee_id: str, columns: Sequence[str], fill_value: Optional[float] = 0.0) -> np.ndarray:
+        """One employee's feature vector (their first row), e.g. for TurnoverPredictor.score_employee"""
+        rows = self.rows(employee_id)
+        if len(rows) == 0:
+            raise KeyError(employee_id)
+        return self.matrix(columns, fill_value)[rows[0]]
@@ -0,0 +1,155 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Numeric inputs tracked by the engine, in accumulator order
+KPI_METRICS = ('engagement_score', 'satisfaction_score', 'enps_score', 'turnover_risk')
+# Grouping column -> metric averaged per group
+KPI_GROUPS = {'department': 'engagement_score', 'work_arrangement': 'satisfaction_score'}
+HIGH_RISK_THRESHOLD = 0.6
+_RISK = KPI_METRICS.index('turnover_risk')
+
+def _is_missing(value) -> bool:
+    return value is None or value != value
+
+class _Accumulator:
+    """Running row count, per-metric sums and non-missing counts, and high-risk count"""
+
+    __slots__ = ('rows', 'sums', 'counts', 'high_risk')
+
+    def __init__(self):
+        self.rows = 0
+        self.sums = [0.0] * len(KPI_METRICS)
+        self.counts = [0] * len(KPI_METRICS)
+        self.high_risk = 0
+
+    @classmethod
+    def from_rows(cls, metrics: np.ndarray) -> '_Accumulator':
+        """Accumulator over a (rows x KPI_METRICS) array in one vectorized pass"""
+        accumulator = cls()
+        present = ~np.isnan(metrics)
+        accumulator.rows = len(metrics)
+        accumulator.sums = np.where(present, metrics, 0.0).sum(axis=0).tolist()
+        accumulator.counts = present.sum(axis=0).tolist()
+        accumulator.high_risk = int((metrics[:, _RISK] > HIGH_RISK_THRESHOLD).sum())
+        return accumulator
+
+    def add(self, values: Tuple[float, ...], sign: int = 1):
+        self.rows += sign
+        for i, value in enumerate(values):
+            if not _is_missing(value):
+                self.sums[i] += sign * value
+                self.counts[i] += sign
+        risk = values[_RISK]
+        if not _is_missing(risk) and risk > HIGH_RISK_THRESHOLD:
+            self.high_risk += sign
+
+    def mean(self, metric: str) -> float:
+        i = KPI_METRICS.index(metric)
+        return self.sums[i] / self.counts[i] if self.counts[i] else np.nan
+
+class KPIEngine:
+    """Incrementally maintained dashboard KPIs
+
+    Keeps running sums and counts overall and per department / work
+    arrangement, so inserting, updating or deleting one row is O(1) and
+    kpis() only touches the accumulators. Means skip missing values and the
+    high-risk share is taken over all rows, as the pandas calculation did.
+    """
+
+    def __init__(self):
+        self.total = _Accumulator()
+        self.groups = {column: {} for column in KPI_GROUPS}
+        # key -> (metric values, group labels) as last applied, for update/delete
+        self._records = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, key_column: Optional[str] = None) -> 'KPIEngine':
+        """Engine seeded from a frame, keyed by `key_column` values or the frame's index
+
+        Seeding is vectorized; only the per-key records are built row by row.
+        """
+        engine = cls()
+        keys, metrics, labels = cls._frame_records(data, key_column)
+
+        engine.total = _Accumulator.from_rows(metrics)
+        for column, column_labels in zip(KPI_GROUPS, labels):
+            codes, uniques = pd.factorize(column_labels)
+            for code, label in enumerate(uniques):
+                engine.groups[column][label] = _Accumulator.from_rows(metrics[codes == code])
+
+        engine._records = dict(zip(keys, zip(map(tuple, metrics.tolist()), zip(*labels))))
+        if len(engine._records) != len(data):
+            raise ValueError("KPI keys must be unique")
+        return engine
+
+    @staticmethod
+    def _frame_records(data: pd.DataFrame, key_column: Optional[str]):
+        """Keys, (rows x KPI_METRICS) values and per-group label arrays of a frame"""
+        keys = data.index if key_column is None else data[key_column]
+        metrics = np.column_stack([
+            data[metric].to_numpy(dtype=np.float64, na_value=np.nan) if metric in data.columns
+            else np.full(len(data), np.nan) for metric in KPI_METRICS
+        ]) if len(data) else np.empty((0, len(KPI_METRICS)))
+        labels = [data[column].astype(object).to_numpy() if column in data.columns
+                  else np.full(len(data), None, dtype=object) for column in KPI_GROUPS]
+        return keys, metrics, labels
+
+    def upsert_frame(self, data: pd.DataFrame, key_column: Optional[str] = None):
+        """upsert() every row of a frame, keyed as in from_frame"""
+        keys, metrics, labels = self._frame_records(data, key_column)
+        for key, values, group_labels in zip(keys, map(tuple, metrics.tolist()), zip(*labels)):
+            self.upsert(key, values, group_labels)
+
+    def upsert(self, key: Hashable, values: Tuple[float, ...], group_labels: Tuple[Any, ...]):
+        """Insert or replace a row: `values` in KPI_METRICS order, `group_labels` in KPI_GROUPS order"""
+        if key in self._records:
+            self.delete(key)
+        record = (tuple(values), tuple(group_labels))
+        self._apply(record, 1)
+        self._records[key] = record
+
+    def update(self, key: Hashable, record: Dict[str, Any]):
+        """Insert or update a row from a dict; fields it omits keep their previous values"""
+        old_values, old_labels = self._records.get(key, ((np.nan,) * len(KPI_METRICS), (None,) * len(KPI_GROUPS)))
+        values = tuple(record.get(metric, old) for metric, old in zip(KPI_METRICS, old_values))
+        labels = tuple(record.get(column, old) for column, old in zip(KPI_GROUPS, old_labels))
+        self.upsert(key, values, labels)
+
+    def delete(self, key: Hashable):
+        self._apply(self._records.pop(key), -1)
+
+    def _apply(self, record, sign: int):
+        values, labels = record
+        self.total.add(values, sign)
+        for column, label in zip(KPI_GROUPS, labels):
+            if _is_missing(label):
+                continue
+            group = self.groups[column]
+            accumulator = group.get(label)
+            if accumulator is None:
+                accumulator = group[label] = _Accumulator()
+            accumulator.add(values, sign)
+            if accumulator.rows == 0:
+                del group[label]
+
+    def __len__(self) -> int:
+        return self.total.rows
+
+    def kpis(self) -> Dict[str, Any]:
+        """Current KPIs, in the shape of EngagementDashboard.metrics"""
+        total = self.total
+        return {
+            'total_employees': total.rows,
+            'avg_engagement': total.mean('engagement_score'),
+            'avg_satisfaction': total.mean('satisfaction_score'),
+            'avg_enps': total.mean('enps_score'),
+            'high_risk_employees': total.high_risk,
+            'engagement_by_dept': self.group_means('department'),
+            'satisfaction_by_arrangement': self.group_means('work_arrangement'),
+            'retention_risk': total.high_risk / total.rows * 100 if total.rows else np.nan
+        }
+
+    def group_means(self, column: str) -> Dict[Any, float]:
+        metric = KPI_GROUPS[column]
+        return {label: self.groups[column][label].mean(metric) for label in sorted(self.groups[column])}
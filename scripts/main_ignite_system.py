@@ -1,13 +1,17 @@
 import pandas as pd
 import numpy as np
+import os
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
 # Import all modules
-from data_models import EmployeeEngagementData
+from data_models import EmployeeEngagementData, SNAPSHOT_MANIFEST
 from sentiment_analysis import SentimentAnalyzer
 from predictive_analytics import TurnoverPredictor, EngagementPredictor
+from feature_store import FeatureStore
+from org_hierarchy import OrgHierarchy
+from timeseries_store import MetricHistory
 from analytics_dashboard import EngagementDashboard
 from recommendations_engine import EngagementRecommendationsEngine
 
@@ -25,42 +29,86 @@ class IGNITESystem:
         self.system_initialized = False
         self.last_analysis_date = None
         
-    def initialize_system(self, num_employees=200):
-        """Initialize the IGNITE system with sample data"""
+    def initialize_system(self, num_employees=200, snapshot_dir=None, model_registry=None):
+        """Initialize the IGNITE system with sample data
+        
+        When `snapshot_dir` holds a snapshot it is reloaded instead of
+        regenerating data; otherwise the generated data is saved there.
+        Likewise, models saved in `model_registry` (a ModelRegistry) are
+        loaded instead of retrained, and freshly trained ones are saved to it.
+        """
         print("🚀 Initializing IGNITE Employee Engagement System...")
         
-        # Generate sample data
-        print("📊 Generating sample employee data...")
-        self.data_manager.generate_sample_data(num_employees)
+        has_snapshot = bool(snapshot_dir) and os.path.exists(os.path.join(snapshot_dir, SNAPSHOT_MANIFEST))
+        if has_snapshot:
+            print("📂 Loading employee data snapshot...")
+            self.data_manager = EmployeeEngagementData.load_snapshot(snapshot_dir)
+        else:
+            # Generate sample data
+            print("📊 Generating sample employee data...")
+            self.data_manager.generate_sample_data(num_employees)
         
         # Get dataframes
         self.employees_df = self.data_manager.get_employees_df()
         self.survey_df = self.data_manager.get_survey_responses_df()
         self.metrics_df = self.data_manager.get_engagement_metrics_df()
+        # Joined once, shared by the predictors and the dashboard
+        self.feature_store = FeatureStore(self.employees_df, self.survey_df, self.metrics_df)
+        # Reporting tree with O(1) full-org KPI rollups
+        self.org_hierarchy = OrgHierarchy.from_frame(self.employees_df)
+        self.org_hierarchy.load_metrics(self.metrics_df)
+        # Snapshots across survey waves, saved and reloaded with the data snapshot;
+        # sample waves are generated only when there is no saved history
+        if self.data_manager.metric_history is None:
+            self.data_manager.metric_history = MetricHistory()
+            self.data_manager.metric_history.append(self.data_manager.generate_metric_history())
+        self.metric_history = self.data_manager.metric_history
         
-        # Generate sample feedback for sentiment analysis
-        print("💬 Analyzing employee sentiment...")
-        sample_feedback = self.generate_sample_feedback()
-        self.sentiment_df = self.sentiment_analyzer.analyze_feedback_batch(sample_feedback)
-        
-        # Train predictive models
-        print("🤖 Training predictive models...")
-        training_data = self.turnover_predictor.prepare_features(
-            self.employees_df, self.survey_df, self.metrics_df
-        )
-        training_data = self.turnover_predictor.generate_turnover_labels(training_data)
+        if self.data_manager.sentiment_results is not None:
+            self.sentiment_df = self.data_manager.sentiment_results
+        else:
+            # Generate sample feedback for sentiment analysis
+            print("💬 Analyzing employee sentiment...")
+            sample_feedback = self.generate_sample_feedback()
+            # Sample comments are attributed to the first employees
+            authors = self.employees_df['employee_id'].iloc[:len(sample_feedback)].tolist()
+            self.sentiment_df = self.sentiment_analyzer.analyze_feedback_batch(sample_feedback, employee_ids=authors)
+            self.data_manager.sentiment_results = self.sentiment_df
         
-        # Train turnover prediction model
-        turnover_results = self.turnover_predictor.train_model(training_data)
-        print(f"   Turnover Model Accuracy: {turnover_results['test_accuracy']:.3f}")
+        if snapshot_dir and not has_snapshot:
+            self.data_manager.save_snapshot(snapshot_dir)
         
-        # Train engagement prediction model
-        engagement_results = self.engagement_predictor.train_engagement_model(training_data)
-        print(f"   Engagement Model R²: {engagement_results['test_r2']:.3f}")
+        if model_registry is not None and model_registry.has_model('turnover') \
+                and model_registry.has_model('engagement'):
+            print("📦 Loading trained models from registry...")
+            self.turnover_predictor = model_registry.load('turnover')
+            self.engagement_predictor = model_registry.load('engagement')
+        else:
+            # Train predictive models
+            print("🤖 Training predictive models...")
+            training_data = self.turnover_predictor.prepare_features(
+                self.employees_df, self.survey_df, self.metrics_df, feature_store=self.feature_store
+            )
+            training_data = self.turnover_predictor.generate_turnover_labels(training_data)
+            
+            # Train turnover prediction model
+            turnover_results = self.turnover_predictor.train_model(training_data)
+            print(f"   Turnover Model Accuracy: {turnover_results['test_accuracy']:.3f}")
+            
+            # Train engagement prediction model
+            engagement_results = self.engagement_predictor.train_engagement_model(
+                training_data, feature_store=self.feature_store
+            )
+            print(f"   Engagement Model R²: {engagement_results['test_r2']:.3f}")
+            
+            if model_registry is not None:
+                model_registry.save(self.turnover_predictor, 'turnover', turnover_results)
+                model_registry.save(self.engagement_predictor, 'engagement', engagement_results)
         
         # Initialize dashboard
         print("📈 Setting up analytics dashboard...")
-        self.dashboard.load_data(self.employees_df, self.survey_df, self.metrics_df, self.sentiment_df)
+        self.dashboard.load_data(self.employees_df, self.survey_df, self.metrics_df, self.sentiment_df,
+                                 feature_store=self.feature_store, metric_history=self.metric_history)
         
         self.system_initialized = True
         self.last_analysis_date = datetime.now()
@@ -68,6 +116,20 @@ class IGNITESystem:
         print("✅ IGNITE System initialized successfully!")
         return self
     
+    def analyze_org(self, manager_id):
+        """KPI rollup and team recommendations for everyone under `manager_id` (their full org)"""
+        summary = self.org_hierarchy.rollup(manager_id, include_manager=False)
+        nodes = self.org_hierarchy.org_nodes(manager_id, include_manager=False)
+        frame = self.feature_store.frame
+        # Hierarchy nodes are employees_df rows, which are the store's rows when it has one per employee
+        if len(frame) == len(self.org_hierarchy):
+            org_data = frame.iloc[nodes]
+        else:
+            org_data = frame[frame['employee_id'].isin(self.org_hierarchy.employee_ids[nodes])]
+        summary['team_recommendations'] = \
+            self.recommendations_engine.generate_team_recommendations(org_data)['team_recommendations']
+        return summary
+    
     def generate_sample_feedback(self):
         """Generate sample employee feedback for sentiment analysis"""
         positive_feedback = [
@@ -115,4 +177,4 @@ class IGNITESystem:
         
         # Select random subset matching number of employees
         num_feedback = min(len(self.employees_df), len(all_feedback))
-        return all_feedback[:
+        return all_feedback[:num_feedback]
@@ -0,0 +1,208 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from feature_store import SURVEY_FEATURE_COLUMNS
+from kpi_engine import KPI_METRICS
+
+CUBE_DIMENSIONS = ('department', 'work_arrangement', 'level', 'period')
+# Risk bands as (label, lower exclusive, upper inclusive), the pd.cut bins the dashboard uses
+RISK_BANDS = (('Low', 0.0, 0.3), ('Medium', 0.3, 0.6), ('High', 0.6, 1.0))
+CUBE_MEASURES = KPI_METRICS + tuple(SURVEY_FEATURE_COLUMNS) + tuple(f"risk_{label.lower()}" for label, _, _ in RISK_BANDS)
+
+class EngagementCube:
+    """Materialized aggregates over department x work_arrangement x level x survey period
+
+    Every cell holds, per measure, the sum, the count of non-missing values
+    and the sum of squares, plus the cell's row count. Queries roll up by
+    summing cells over the dimensions they do not group by, so their cost
+    depends on the number of cells, not rows. Rows can be added or removed
+    at any time (e.g. per loaded chunk); dimensions grow as new labels
+    appear. Risk bands are stored as 0/1 measures whose sums count rows.
+    """
+
+    def __init__(self, period_freq: str = 'M'):
+        self.period_freq = period_freq
+        self.labels = {dim: [] for dim in CUBE_DIMENSIONS}
+        self._label_index = {dim: {} for dim in CUBE_DIMENSIONS}
+        self.rows = np.zeros((0,) * len(CUBE_DIMENSIONS))
+        self.sums = np.zeros(self.rows.shape + (len(CUBE_MEASURES),))
+        self.counts = np.zeros_like(self.sums)
+        self.sumsq = np.zeros_like(self.sums)
+        # Query results, valid until the next add()/remove()
+        self._results = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, period_freq: str = 'M') -> 'EngagementCube':
+        cube = cls(period_freq)
+        cube.add(data)
+        return cube
+
+    def _periods(self, data: pd.DataFrame) -> np.ndarray:
+        if 'timestamp' not in data.columns:
+            return np.full(len(data), None, dtype=object)
+        timestamps = pd.DatetimeIndex(pd.to_datetime(data['timestamp']))
+        return np.where(timestamps.isna(), None, timestamps.to_period(self.period_freq).astype(str))
+
+    def _coordinates(self, data: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """Cell index of every row along each dimension, registering new labels"""
+        coordinates = []
+        for dim in CUBE_DIMENSIONS:
+            values = self._periods(data) if dim == 'period' else \
+                data[dim].astype(object).to_numpy() if dim in data.columns else np.full(len(data), None, dtype=object)
+            # Missing labels get their own member (None), left out of group-bys like pandas does
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            index = self._label_index[dim]
+            for label in uniques:
+                label = None if pd.isna(label) else label
+                if label not in index:
+                    index[label] = len(self.labels[dim])
+                    self.labels[dim].append(label)
+            lookup = np.array([index[None if pd.isna(label) else label] for label in uniques], dtype=np.intp)
+            coordinates.append(lookup[codes])
+        self._grow()
+        return tuple(coordinates)
+
+    def _grow(self):
+        shape = tuple(len(self.labels[dim]) for dim in CUBE_DIMENSIONS)
+        if shape == self.rows.shape:
+            return
+        padding = [(0, new - old) for new, old in zip(shape, self.rows.shape)]
+        self.rows = np.pad(self.rows, padding)
+        self.sums = np.pad(self.sums, padding + [(0, 0)])
+        self.counts = np.pad(self.counts, padding + [(0, 0)])
+        self.sumsq = np.pad(self.sumsq, padding + [(0, 0)])
+
+    def _measure_values(self, data: pd.DataFrame) -> np.ndarray:
+        columns = {}
+        for measure in CUBE_MEASURES[:len(CUBE_MEASURES) - len(RISK_BANDS)]:
+            columns[measure] = data[measure].to_numpy(dtype=np.float64, na_value=np.nan) \
+                if measure in data.columns else np.full(len(data), np.nan)
+        risk = columns['turnover_risk']
+        for label, lower, upper in RISK_BANDS:
+            columns[f"risk_{label.lower()}"] = ((risk > lower) & (risk <= upper)).astype(np.float64)
+        return np.column_stack([columns[measure] for measure in CUBE_MEASURES])
+
+    def add(self, data: pd.DataFrame, sign: int = 1):
+        """Aggregate rows into the cube (sign=-1 removes previously added rows)"""
+        if len(data) == 0:
+            return
+        self._results.clear()
+        coordinates = self._coordinates(data)
+        values = self._measure_values(data)
+        present = ~np.isnan(values)
+        values = np.where(present, values, 0.0)
+
+        cells = np.ravel_multi_index(coordinates, self.rows.shape)
+        n_cells = self.rows.size
+        self.rows.reshape(-1)[:] += sign * np.bincount(cells, minlength=n_cells)
+        for target, contribution in ((self.sums, values), (self.counts, present), (self.sumsq, values * values)):
+            flat = target.reshape(n_cells, -1)
+            for m in range(len(CUBE_MEASURES)):
+                flat[:, m] += sign * np.bincount(cells, weights=contribution[:, m], minlength=n_cells)
+
+    def remove(self, data: pd.DataFrame):
+        self.add(data, sign=-1)
+
+    def _members(self, dim: str, where: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Positions of the `dim` members kept by the `where` slice (drill-down)"""
+        if not where or dim not in where:
+            return np.arange(len(self.labels[dim]))
+        members = where[dim] if isinstance(where[dim], (list, tuple, set)) else [where[dim]]
+        return np.array([self._label_index[dim][m] for m in members if m in self._label_index[dim]], dtype=np.intp)
+
+    def _rollup(self, measure: str, by: Sequence[str], where: Optional[Dict[str, Any]]):
+        """Group labels and (rows, sums, counts, sumsq) arrays of shape len(by) x members"""
+        m = CUBE_MEASURES.index(measure)
+        positions = [self._members(dim, where) for dim in CUBE_DIMENSIONS]
+        arrays = (self.rows, self.sums[..., m], self.counts[..., m], self.sumsq[..., m])
+        if where:
+            arrays = tuple(array[np.ix_(*positions)] for array in arrays)
+        else:
+            positions = [slice(None)] * len(CUBE_DIMENSIONS)
+
+        # Roll up every dimension not grouped by, keeping the group dimensions in `by` order
+        axes = [CUBE_DIMENSIONS.index(dim) for dim in by]
+        other_axes = tuple(i for i in range(len(CUBE_DIMENSIONS)) if i not in axes)
+        rank = np.argsort(np.argsort(axes))
+        arrays = tuple(np.transpose(array.sum(axis=other_axes), rank) for array in arrays)
+        labels = [np.array(self.labels[dim], dtype=object)[positions[CUBE_DIMENSIONS.index(dim)]] for dim in by]
+        return labels, arrays
+
+    @staticmethod
+    def _stats(sums: np.ndarray, counts: np.ndarray, sumsq: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(counts > 0, sums / counts, np.nan)
+            std = np.where(counts > 1, np.sqrt(np.maximum(sumsq - sums * mean, 0.0) / (counts - 1)), np.nan)
+        return mean, std
+
+    def _keep(self, labels, rows: np.ndarray, axis: int) -> np.ndarray:
+        """Groups to report along `axis`: labelled (not None) and holding any rows"""
+        other_axes = tuple(i for i in range(rows.ndim) if i != axis)
+        return (np.array([label is not None for label in labels[axis]], dtype=bool)
+                & (rows.sum(axis=other_axes) > 0))
+
+    def aggregate(self, measure: str, by: Sequence[str] = (), where: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Roll `measure` up to the `by` dimensions, optionally sliced by `where`
+
+        Returns one row per non-empty group with rows, count, sum, mean and
+        std (sample, as pandas computes it), indexed by the group labels.
+        """
+        by = list(by)
+        labels, (rows, sums, counts, sumsq) = self._rollup(measure, by, where)
+        mean, std = self._stats(sums, counts, sumsq)
+        if by:
+            index = pd.MultiIndex.from_product(labels, names=by) if len(by) > 1 else pd.Index(labels[0], name=by[0])
+        else:
+            index = pd.RangeIndex(1)
+        result = pd.DataFrame({'rows': rows.reshape(-1), 'count': counts.reshape(-1), 'sum': sums.reshape(-1),
+                               'mean': mean.reshape(-1), 'std': std.reshape(-1)}, index=index)
+
+        # Drop empty cells and, like groupby, missing group labels
+        keep = result['rows'].to_numpy() > 0
+        for dim in by:
+            keep &= result.index.get_level_values(dim).notna()
+        result = result[keep]
+        return result.sort_index() if by else result
+
+    def mean(self, measure: str, by: Sequence[str] = (), where: Optional[Dict[str, Any]] = None):
+        """Mean of `measure`: a scalar, a Series for one `by` dimension, or a
+        DataFrame (first dimension down, second across) for two
+        """
+        return self._reduce(measure, by, where, statistic='mean')
+
+    def total(self, measure: str, by: Sequence[str] = (), where: Optional[Dict[str, Any]] = None):
+        """Sum of `measure` (counts rows for the risk_* band measures), shaped like mean()"""
+        return self._reduce(measure, by, where, statistic='sum')
+
+    def _reduce(self, measure, by, where, statistic):
+        key = (statistic, measure, tuple(by), None if not where else tuple(sorted(
+            (dim, frozenset(m) if isinstance(m, (list, tuple, set)) else frozenset([m])) for dim, m in where.items())))
+        if key not in self._results:
+            self._results[key] = self._compute(measure, by, where, statistic)
+        result = self._results[key]
+        return result.copy() if isinstance(result, (pd.Series, pd.DataFrame)) else result
+
+    def _compute(self, measure, by, where, statistic):
+        if len(by) > 2:
+            raise ValueError("mean()/total() group by at most two dimensions; use aggregate()")
+        labels, (rows, sums, counts, sumsq) = self._rollup(measure, by, where)
+        values = sums if statistic == 'sum' else self._stats(sums, counts, sumsq)[0]
+        if not by:
+            return float(values) if statistic == 'sum' or rows > 0 else np.nan
+
+        keep = [self._keep(labels, rows, axis) for axis in range(len(by))]
+        if len(by) == 1:
+            result = pd.Series(values[keep[0]], index=pd.Index(labels[0][keep[0]], name=by[0]), name=measure)
+        else:
+            values = np.where(rows > 0, values, np.nan)[np.ix_(*keep)]
+            result = pd.DataFrame(values, index=pd.Index(labels[0][keep[0]], name=by[0]),
+                                  columns=pd.Index(labels[1][keep[1]], name=by[1]))
+        return result.sort_index().sort_index(axis=1) if len(by) == 2 else result.sort_index()
+
+    def risk_distribution(self, where: Optional[Dict[str, Any]] = None) -> pd.Series:
+        """Employees per risk band, like value_counts() of the binned turnover risk"""
+        counts = {label: int(self.total(f"risk_{label.lower()}", where=where)) for label, _, _ in RISK_BANDS}
+        # Largest band first, ties in band order (value_counts' ordering)
+        labels = sorted(counts, key=lambda label: -counts[label])
+        return pd.Series([counts[label] for label in labels], index=labels, name='count')
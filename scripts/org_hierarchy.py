@@ -0,0 +1,186 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from feature_store import _key_array
+from kpi_engine import KPI_METRICS, HIGH_RISK_THRESHOLD
+
+_RISK = KPI_METRICS.index('turnover_risk')
+
+class OrgHierarchy:
+    """Reporting tree built from employee_id / manager_id
+
+    Employees are nodes in the order given. `parent` holds each node's
+    manager (-1 for roots: no manager, a manager_id that is not an employee,
+    or a self-reference). Direct reports are stored CSR-style
+    (`child_offsets` / `children`). A preorder (Euler) tour gives every
+    node an interval [tin, tout) in `preorder` that covers exactly its
+    whole org, so once load_metrics() has built prefix sums in tour order,
+    any manager's full-org rollup is two lookups per metric.
+    """
+
+    def __init__(self, employee_ids: Sequence[str], manager_ids: Sequence[Optional[str]]):
+        ids = _key_array(employee_ids)
+        n = len(ids)
+        self.employee_ids = ids
+        # Sorted index for employee_id -> node lookups
+        self._key_order = np.argsort(ids, kind='stable')
+        self._sorted_keys = ids[self._key_order]
+        if n and (self._sorted_keys[1:] == self._sorted_keys[:-1]).any():
+            raise ValueError("employee_id values must be unique")
+
+        managers = pd.Series(manager_ids, dtype=object)
+        has_manager = managers.notna().to_numpy()
+        parent = np.full(n, -1, dtype=np.intp)
+        if has_manager.any():
+            positions = self._lookup(_key_array(managers[has_manager]))
+            parent[has_manager] = positions
+        parent[parent == np.arange(n)] = -1
+        self.parent = parent
+
+        # Direct reports of node v: children[child_offsets[v]:child_offsets[v + 1]], in input order
+        has_parent = parent >= 0
+        self.children = np.flatnonzero(has_parent)[np.argsort(parent[has_parent], kind='stable')]
+        self.child_offsets = np.concatenate([[0], np.cumsum(np.bincount(parent[has_parent], minlength=n))])
+
+        self.preorder, self.tin, self.tout, self.depth = self._euler_tour()
+        self._prefix = None
+        self._prefix_counts = None
+        self._prefix_high_risk = None
+
+    @classmethod
+    def from_frame(cls, employees_df: pd.DataFrame) -> 'OrgHierarchy':
+        return cls(employees_df['employee_id'].to_numpy(), employees_df['manager_id'].to_numpy())
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Node of each key, -1 where the key is not an employee"""
+        n = len(self._sorted_keys)
+        if n == 0:
+            return np.full(len(keys), -1, dtype=np.intp)
+        positions = np.minimum(np.searchsorted(self._sorted_keys, keys), n - 1)
+        return np.where(self._sorted_keys[positions] == keys, self._key_order[positions], -1)
+
+    def _euler_tour(self):
+        n = len(self.parent)
+        parent = self.parent.tolist()
+        children = self.children.tolist()
+        offsets = self.child_offsets.tolist()
+        preorder = []
+        depth = [0] * n
+        stack = np.flatnonzero(self.parent < 0)[::-1].tolist()
+        while stack:
+            v = stack.pop()
+            preorder.append(v)
+            if parent[v] >= 0:
+                depth[v] = depth[parent[v]] + 1
+            # Reversed so reports are visited in input order
+            stack.extend(reversed(children[offsets[v]:offsets[v + 1]]))
+        if len(preorder) != n:
+            unreached = sorted(set(range(n)) - set(preorder))
+            raise ValueError(f"Reporting cycle involving {self.employee_ids[unreached[0]]}")
+
+        # Org sizes, accumulated bottom-up over the reversed preorder
+        size = [1] * n
+        for v in reversed(preorder):
+            if parent[v] >= 0:
+                size[parent[v]] += size[v]
+        preorder = np.array(preorder, dtype=np.intp)
+        tin = np.empty(n, dtype=np.intp)
+        tin[preorder] = np.arange(n)
+        tout = tin + np.array(size, dtype=np.intp)
+        return preorder, tin, tout, np.array(depth, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def node(self, employee_id: str) -> int:
+        position = self._lookup(np.array([str(employee_id)]))[0]
+        if position < 0:
+            raise KeyError(employee_id)
+        return position
+
+    def manager(self, employee_id: str) -> Optional[str]:
+        parent = self.parent[self.node(employee_id)]
+        return None if parent < 0 else self.employee_ids[parent]
+
+    def direct_reports(self, employee_id: str) -> List[str]:
+        v = self.node(employee_id)
+        return self.employee_ids[self.children[self.child_offsets[v]:self.child_offsets[v + 1]]].tolist()
+
+    def org_size(self, employee_id: str, include_manager: bool = True) -> int:
+        v = self.node(employee_id)
+        return int(self.tout[v] - self.tin[v]) - (not include_manager)
+
+    def org_nodes(self, employee_id: str, include_manager: bool = True) -> np.ndarray:
+        """Nodes (positions in the input order) of everyone in the employee's org, in tour order"""
+        v = self.node(employee_id)
+        return self.preorder[self.tin[v] + (not include_manager):self.tout[v]]
+
+    def load_metrics(self, data: pd.DataFrame):
+        """Build tour-ordered prefix sums of KPI_METRICS from a frame with employee_id
+
+        One row per employee is expected; for repeated employees the last
+        row wins, and rows of unknown employees are ignored. Missing values
+        are skipped by the means, as in KPIEngine.
+        """
+        n = len(self.parent)
+        nodes = self._lookup(_key_array(data['employee_id']))
+        known = nodes >= 0
+        values = np.full((n, len(KPI_METRICS)), np.nan)
+        for m, metric in enumerate(KPI_METRICS):
+            if metric in data.columns:
+                values[nodes[known], m] = data[metric].to_numpy(dtype=np.float64, na_value=np.nan)[known]
+
+        values = values[self.preorder]
+        present = ~np.isnan(values)
+        zero_row = np.zeros((1, len(KPI_METRICS)))
+        self._prefix = np.concatenate([zero_row, np.cumsum(np.where(present, values, 0.0), axis=0)])
+        self._prefix_counts = np.concatenate([zero_row, np.cumsum(present, axis=0)]).astype(np.int64)
+        self._prefix_high_risk = np.concatenate([[0], np.cumsum(values[:, _RISK] > HIGH_RISK_THRESHOLD)])
+
+    def _ranges(self, nodes: np.ndarray, include_manager: bool):
+        if self._prefix is None:
+            raise RuntimeError("Call load_metrics() before rolling up metrics")
+        return self.tin[nodes] + (not include_manager), self.tout[nodes]
+
+    def rollup(self, employee_id: str, include_manager: bool = True) -> Dict[str, Any]:
+        """Headcount, metric means and high-risk count for the employee's whole org, in O(1)"""
+        start, end = self._ranges(np.array([self.node(employee_id)]), include_manager)
+        start, end = start[0], end[0]
+        sums = self._prefix[end] - self._prefix[start]
+        counts = self._prefix_counts[end] - self._prefix_counts[start]
+        headcount = int(end - start)
+        high_risk = int(self._prefix_high_risk[end] - self._prefix_high_risk[start])
+        means = {metric: float(sums[m] / counts[m]) if counts[m] else np.nan for m, metric in enumerate(KPI_METRICS)}
+        return {
+            'headcount': headcount,
+            'avg_engagement': means['engagement_score'],
+            'avg_satisfaction': means['satisfaction_score'],
+            'avg_enps': means['enps_score'],
+            'avg_turnover_risk': means['turnover_risk'],
+            'high_risk_employees': high_risk,
+            'retention_risk': high_risk / headcount * 100 if headcount else np.nan
+        }
+
+    def rollup_all(self, include_manager: bool = True, managers_only: bool = True) -> pd.DataFrame:
+        """rollup() for every employee (or every manager) as one table indexed by employee_id"""
+        nodes = np.flatnonzero(np.diff(self.child_offsets) > 0) if managers_only else np.arange(len(self.parent))
+        start, end = self._ranges(nodes, include_manager)
+        sums = self._prefix[end] - self._prefix[start]
+        counts = self._prefix_counts[end] - self._prefix_counts[start]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+            headcount = end - start
+            high_risk = self._prefix_high_risk[end] - self._prefix_high_risk[start]
+            retention_risk = np.where(headcount > 0, high_risk / headcount * 100, np.nan)
+        return pd.DataFrame({
+            'manager_id': [None if p < 0 else self.employee_ids[p] for p in self.parent[nodes].tolist()],
+            'depth': self.depth[nodes],
+            'headcount': headcount,
+            'avg_engagement': means[:, KPI_METRICS.index('engagement_score')],
+            'avg_satisfaction': means[:, KPI_METRICS.index('satisfaction_score')],
+            'avg_enps': means[:, KPI_METRICS.index('enps_score')],
+            'avg_turnover_risk': means[:, _RISK],
+            'high_risk_employees': high_risk,
+            'retention_risk': retention_risk
+        }, index=pd.Index(self.employee_ids[nodes], name='employee_id'))
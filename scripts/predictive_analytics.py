@@ -5,55 +5,201 @@ from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.metrics import classification_report, mean_squared_error, r2_score
 import joblib
+import sklearn
+import hashlib
+import json
+import os
+import re
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from feature_store import FeatureStore, float32_matrix
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+def feature_drift(scaler: StandardScaler, X: pd.DataFrame) -> float:
+    """Largest shift of a feature's mean in `X`, in units of the scaler's fitted std"""
+    shift = np.abs(np.asarray(X, dtype=float).mean(axis=0) - scaler.mean_) / scaler.scale_
+    return float(np.max(shift)) if len(shift) else 0.0
+
+def hash_training_data(X: pd.DataFrame, y: pd.Series, previous: Optional[str] = None) -> str:
+    """Content hash of a training set; `previous` chains hashes across incremental updates"""
+    digest = hashlib.sha256((previous or '').encode('utf-8'))
+    digest.update(','.join(map(str, X.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def feature_matrix(data: pd.DataFrame, columns: List[str], feature_store: Optional[FeatureStore] = None,
+                   fill_value: Optional[float] = None) -> np.ndarray:
+    """float32 features in `columns` order, from the store's cache when it still backs `data`"""
+    if feature_store is not None and feature_store.backs(data, columns):
+        return feature_store.matrix(columns, fill_value)
+    return float32_matrix(data, columns, fill_value)
+
+def _fill_column_means(X: np.ndarray) -> np.ndarray:
+    missing = np.isnan(X)
+    return np.where(missing, np.nanmean(X, axis=0), X) if missing.any() else X
+
+def risk_category(risk: float) -> Optional[str]:
+    """Scalar equivalent of the risk_category bins used by predict_turnover_risk"""
+    if risk <= 0 or risk > 1:
+        return None
+    return 'Low' if risk <= 0.3 else 'Medium' if risk <= 0.6 else 'High'
+
+def _thread_count(n_jobs: int) -> int:
+    """Threads for an n_jobs argument: -1 is all cores, -k is cores + 1 - k (joblib's convention)"""
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise ValueError(f"n_jobs must be a non-zero integer, got {n_jobs!r}")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + int(n_jobs))
+    return int(n_jobs)
+
+def _top_k_risk(results: pd.DataFrame, k: int) -> pd.DataFrame:
+    """The k highest-risk rows via argpartition, in no particular order"""
+    if len(results) <= k:
+        return results
+    risk = results['turnover_risk'].to_numpy()
+    return results.iloc[np.sort(np.argpartition(-risk, k - 1)[:k])]
+
+class FlatForestScorer:
+    """Binary random forest flattened into shared node arrays for per-row scoring
+    
+    The nodes of every tree are renumbered level by level across the whole
+    forest so that the two children of a node sit in adjacent slots: a split
+    steps to `left[i] + (x[feature[i]] > threshold[i])`. Leaves point to
+    themselves with an infinite threshold, so trees that finish early stay
+    put, and scoring walks all trees together, one level per step. Node ids
+    are intp so no gather has to cast them. The arrays are built once per fit
+    and saved with the model. Splits compare the float32 scaled features and
+    leaf fractions are summed in tree order, exactly as predict_proba does.
+    """
+    
+    def __init__(self, model: RandomForestClassifier, scaler: StandardScaler, feature_columns: List[str]):
+        if len(model.classes_) != 2:
+            raise ValueError("FlatForestScorer supports binary classifiers only")
+        self.feature_columns = list(feature_columns)
+        self.classes = model.classes_.tolist()
+        self.mean = np.array(scaler.mean_, dtype=np.float64)
+        self.scale = np.array(scaler.scale_, dtype=np.float64)
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        self.n_trees = len(trees)
+        
+        offsets = np.concatenate([[0], np.cumsum([tree.node_count for tree in trees])[:-1]]).astype(np.intp)
+        leaf = np.concatenate([tree.children_left < 0 for tree in trees])
+        left = np.concatenate([tree.children_left + o for tree, o in zip(trees, offsets)])
+        right = np.concatenate([tree.children_right + o for tree, o in zip(trees, offsets)])
+        
+        # Roots take ids 0..n_trees-1; each level's children follow in pairs
+        new_id = np.empty(len(leaf), dtype=np.intp)
+        new_id[offsets] = np.arange(self.n_trees)
+        frontier, next_id, self.depth = offsets, self.n_trees, 0
+        while True:
+            frontier = frontier[~leaf[frontier]]
+            if not len(frontier):
+                break
+            pairs = next_id + 2 * np.arange(len(frontier))
+            new_id[left[frontier]] = pairs
+            new_id[right[frontier]] = pairs + 1
+            next_id += 2 * len(frontier)
+            frontier = np.column_stack([left[frontier], right[frontier]]).ravel()
+            self.depth += 1
+        order = np.empty_like(new_id)
+        order[new_id] = np.arange(len(new_id))
+        
+        leaf = leaf[order]
+        self.left = np.where(leaf, np.arange(len(order)), new_id[np.where(leaf, 0, left[order])])
+        self.feature = np.where(leaf, 0, np.concatenate([tree.feature for tree in trees])[order]).astype(np.intp)
+        self.threshold = np.where(leaf, np.inf, np.concatenate([tree.threshold for tree in trees])[order])
+        value = np.concatenate([tree.value[:, 0, :] for tree in trees])[order]
+        self.value = value / value.sum(axis=1, keepdims=True)
+        self.roots = np.arange(self.n_trees)
+    
+    def vectorize(self, record: Dict[str, float]) -> np.ndarray:
+        """Feature vector in training column order; missing values become 0 as in training"""
+        return np.array([record.get(col, 0) for col in self.feature_columns], dtype=np.float64)
+    
+    def _scaled(self, X) -> np.ndarray:
+        # Rounded to float32 first, like the feature matrices the model was fitted on
+        X = np.asarray(X, dtype=np.float32)
+        X = np.where(np.isnan(X), np.float32(0), X)
+        return ((X - self.mean) / self.scale).astype(np.float32)
+    
+    def _leaves(self, x: np.ndarray, idx: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Leaf node of every tree for a flattened batch; `rows` holds each row's offset into it"""
+        left, feature, threshold = self.left, self.feature, self.threshold
+        for _ in range(self.depth):
+            idx = left[idx] + (x[rows + feature[idx]] > threshold[idx])
+        return idx
+    
+    def score_one(self, x) -> Tuple[float, int]:
+        """(turnover probability, predicted label) for one feature vector"""
+        x = self._scaled(x)
+        left, feature, threshold = self.left, self.feature, self.threshold
+        idx = self.roots
+        for _ in range(self.depth):
+            idx = left[idx] + (x[feature[idx]] > threshold[idx])
+        p0, p1 = np.cumsum(self.value[idx], axis=0)[-1]
+        return p1 / self.n_trees, self.classes[1] if p1 > p0 else self.classes[0]
+    
+    def score(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """Probabilities and labels for a 2-D batch of feature vectors"""
+        X = self._scaled(X).reshape(-1, len(self.feature_columns))
+        rows = (np.arange(len(X)) * X.shape[1])[:, None]
+        leaves = self._leaves(X.ravel(), np.broadcast_to(self.roots, (len(X), self.n_trees)), rows)
+        sums = np.cumsum(self.value[leaves], axis=1)[:, -1]
+        labels = np.where(sums[:, 1] > sums[:, 0], self.classes[1], self.classes[0])
+        return sums[:, 1] / self.n_trees, labels
 
 class TurnoverPredictor:
     """Predictive analytics for employee turnover risk"""
     
+    # Tree depth cap: score_employee walks one level per step, and deeper
+    # trees cost latency without improving held-out accuracy on this data
+    MAX_TREE_DEPTH = 8
+    
     def __init__(self):
         self.model = None
         self.scaler = StandardScaler()
         self.label_encoders = {}
         self.feature_importance = None
+        self.feature_columns = []
+        self.training_data_hash = None
         self.is_trained = False
+        # FlatForestScorer for the current model, saved along with it
+        self._scorer = None
+        # FeatureStore of the last prepare_features call, for its cached matrices
+        self._feature_store = None
+    
+    def __getstate__(self):
+        # The feature store belongs to the data, not the model
+        state = self.__dict__.copy()
+        state['_feature_store'] = None
+        return state
         
     def prepare_features(self, employees_df: pd.DataFrame, 
                         survey_df: pd.DataFrame, 
-                        metrics_df: pd.DataFrame) -> pd.DataFrame:
-        """Prepare features for turnover prediction"""
-        
-        # Merge all data
-        data = employees_df.merge(survey_df, on='employee_id', how='left')
-        data = data.merge(metrics_df, on='employee_id', how='left')
-        
-        # Calculate tenure in years
-        data['tenure_years'] = data['tenure_days'] / 365.25
-        
-        # Create engagement features
-        survey_cols = ['job_satisfaction', 'work_life_balance', 'career_development', 
-                      'management_support', 'company_culture', 'compensation_satisfaction']
-        
-        for col in survey_cols:
-            if col in data.columns:
-                data[f'{col}_normalized'] = data[col] / 10.0
-        
-        # Create risk indicators
-        data['low_satisfaction'] = (data['job_satisfaction'] <= 5).astype(int)
-        data['poor_work_life_balance'] = (data['work_life_balance'] <= 5).astype(int)
-        data['limited_career_dev'] = (data['career_development'] <= 5).astype(int)
-        data['weak_management'] = (data['management_support'] <= 5).astype(int)
-        
-        # Encode categorical variables
-        categorical_cols = ['department', 'work_arrangement', 'level']
-        for col in categorical_cols:
-            if col not in self.label_encoders:
-                self.label_encoders[col] = LabelEncoder()
-                data[f'{col}_encoded'] = self.label_encoders[col].fit_transform(data[col].fillna('Unknown'))
-            else:
-                data[f'{col}_encoded'] = self.label_encoders[col].transform(data[col].fillna('Unknown'))
-        
-        return data
+                        metrics_df: pd.DataFrame,
+                        feature_store: Optional[FeatureStore] = None) -> pd.DataFrame:
+        """Prepare features for turnover prediction
+        
+        Pass the FeatureStore built for these frames to reuse its join and
+        derived features instead of recomputing them.
+        """
+        store = feature_store if feature_store is not None else FeatureStore(employees_df, survey_df, metrics_df)
+        store.encode_categoricals(self.label_encoders)
+        self._feature_store = store
+        # A new frame sharing the store's columns: callers add label columns
+        # without touching the shared frame, and training and scoring on it
+        # read the store's cached feature matrix
+        return store.feature_frame()
+    
+    def _features(self, data: pd.DataFrame) -> np.ndarray:
+        """float32 model inputs in feature_columns order, missing values as 0"""
+        return feature_matrix(data, self.feature_columns, getattr(self, '_feature_store', None), fill_value=0)
+    
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        return self.scaler.transform(np.asarray(X, dtype=np.float64))
     
     def generate_turnover_labels(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate synthetic turnover labels for training (in real scenario, use historical data)"""
@@ -92,19 +238,20 @@ class TurnoverPredictor:
         
         # Filter available features
         available_features = [col for col in feature_cols if col in training_data.columns]
+        self.feature_columns = available_features
         
-        X = training_data[available_features].fillna(0)
-        y = training_data['will_turnover']
+        X = self._features(training_data)
+        y = training_data['will_turnover'].to_numpy()
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        X_train_scaled = self.scaler.fit_transform(np.asarray(X_train, dtype=np.float64))
+        X_test_scaled = self._scale(X_test)
         
         # Train model
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+        self.model = RandomForestClassifier(n_estimators=100, max_depth=self.MAX_TREE_DEPTH, random_state=42)
         self.model.fit(X_train_scaled, y_train)
         
         # Evaluate model
@@ -112,10 +259,9 @@ class TurnoverPredictor:
         test_score = self.model.score(X_test_scaled, y_test)
         
         # Feature importance
-        self.feature_importance = pd.DataFrame({
-            'feature': available_features,
-            'importance': self.model.feature_importances_
-        }).sort_values('importance', ascending=False)
+        self.training_data_hash = hash_training_data(pd.DataFrame(X, columns=available_features), pd.Series(y))
+        self._update_feature_importance()
+        self._scorer = FlatForestScorer(self.model, self.scaler, self.feature_columns)
         
         self.is_trained = True
         
@@ -125,32 +271,166 @@ class TurnoverPredictor:
             'features_used': len(available_features)
         }
     
+    def _update_feature_importance(self):
+        self.feature_importance = pd.DataFrame({
+            'feature': self.feature_columns,
+            'importance': self.model.feature_importances_
+        }).sort_values('importance', ascending=False)
+    
+    def update_model(self, new_data: pd.DataFrame, drift_threshold: float = 0.0,
+                     trees_per_update: int = 20, max_trees: int = 200) -> Dict[str, float]:
+        """Incrementally update the trained model with a new batch of labelled data
+        
+        Skips the update unless feature drift (see feature_drift) exceeds
+        `drift_threshold`. Otherwise `trees_per_update` trees are grown on the
+        new data with warm_start and the oldest trees are retired beyond
+        `max_trees`. The scaler keeps its fitted statistics, so the trees that
+        remain predict exactly as before. The default drift_threshold of 0
+        means "always update"; raise it to skip batches that look like the
+        training data.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before it can be updated")
+        
+        X = self._features(new_data)
+        y = new_data['will_turnover'].to_numpy()
+        drift = feature_drift(self.scaler, X)
+        result = {'updated': False, 'drift': drift, 'trees_added': 0, 'trees_retired': 0,
+                  'n_trees': len(self.model.estimators_)}
+        
+        if drift <= drift_threshold:
+            return result
+        if set(np.unique(y)) != set(self.model.classes_):
+            # New trees must see every class or the forest's outputs no longer line up
+            result['skipped_reason'] = 'batch does not contain every class'
+            return result
+        
+        self.model.set_params(warm_start=True, n_estimators=len(self.model.estimators_) + trees_per_update)
+        self.model.fit(self._scale(X), y)
+        self.training_data_hash = hash_training_data(pd.DataFrame(X, columns=self.feature_columns), pd.Series(y),
+                                                     previous=self.training_data_hash)
+        
+        # Retire the oldest trees
+        retired = max(len(self.model.estimators_) - max_trees, 0)
+        if retired:
+            self.model.estimators_ = self.model.estimators_[retired:]
+            self.model.n_estimators = len(self.model.estimators_)
+        self._update_feature_importance()
+        self._scorer = FlatForestScorer(self.model, self.scaler, self.feature_columns)
+        
+        result.update(updated=True, trees_added=trees_per_update, trees_retired=retired,
+                      n_trees=len(self.model.estimators_))
+        return result
+    
     def predict_turnover_risk(self, employee_data: pd.DataFrame) -> pd.DataFrame:
         """Predict turnover risk for employees"""
         
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
         
-        # Prepare features
-        feature_cols = self.feature_importance['feature'].tolist()
-        available_features = [col for col in feature_cols if col in employee_data.columns]
-        
-        X = employee_data[available_features].fillna(0)
-        X_scaled = self.scaler.transform(X)
+        results = self._score_frame(employee_data)
+        return results.sort_values('turnover_risk', ascending=False)
+    
+    RESULT_COLUMNS = ['employee_id', 'name', 'department']
+    
+    def _score_frame(self, employee_data: pd.DataFrame) -> pd.DataFrame:
+        """Unsorted risk results for one frame of merged employee data"""
+        # Features in training order
+        X_scaled = self._scale(self._features(employee_data))
         
         # Make predictions
         turnover_prob = self.model.predict_proba(X_scaled)[:, 1]
-        turnover_pred = self.model.predict(X_scaled)
         
         # Create results dataframe
-        results = employee_data[['employee_id', 'name', 'department']].copy()
+        results = employee_data[self.RESULT_COLUMNS].copy()
         results['turnover_risk'] = turnover_prob
         results['high_risk'] = (turnover_prob > 0.6).astype(int)
         results['risk_category'] = pd.cut(turnover_prob, 
                                         bins=[0, 0.3, 0.6, 1.0], 
                                         labels=['Low', 'Medium', 'High'])
+        return results
+    
+    def predict_turnover_risk_batched(self, employee_data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                                      top_k: int = 100, chunk_size: int = 50000, n_jobs: int = 1,
+                                      output_path: Optional[str] = None,
+                                      on_chunk: Optional[Callable[[pd.DataFrame], None]] = None) -> pd.DataFrame:
+        """Memory-bounded turnover scoring for a whole organization
+        
+        `employee_data` is a merged frame (scored in `chunk_size` slices) or an
+        iterable of frames, e.g. from a chunked reader. Chunks are scored on
+        `n_jobs` threads of this process, not worker processes (-1 for one per
+        core, -k for all but k - 1; 0 raises ValueError), with at most two
+        chunks per thread in flight. Every scored chunk is appended to
+        `output_path` (CSV) and/or passed to `on_chunk` in input order; only
+        the `top_k` highest-risk employees are kept in memory and returned,
+        sorted like predict_turnover_risk.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
+        n_jobs = _thread_count(n_jobs)
+        
+        if isinstance(employee_data, pd.DataFrame):
+            chunks = (employee_data.iloc[start:start + chunk_size]
+                      for start in range(0, len(employee_data), chunk_size))
+        else:
+            chunks = iter(employee_data)
+        
+        top = None
+        header = True
+        for results in self._score_chunks(chunks, n_jobs):
+            if output_path is not None:
+                results.to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+                header = False
+            if on_chunk is not None:
+                on_chunk(results)
+            top = _top_k_risk(results if top is None else pd.concat([top, results]), top_k)
+        
+        if top is None:
+            top = pd.DataFrame(columns=self.RESULT_COLUMNS + ['turnover_risk', 'high_risk', 'risk_category'])
+        return top.sort_values('turnover_risk', ascending=False, kind='stable')
+    
+    def _score_chunks(self, chunks: Iterator[pd.DataFrame], n_jobs: int) -> Iterator[pd.DataFrame]:
+        if n_jobs == 1:
+            yield from map(self._score_frame, chunks)
+            return
+        
+        # Tree traversal releases the GIL, so threads score chunks in parallel
+        # without copying the model; the bounded window keeps memory flat
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            window = [executor.submit(self._score_frame, chunk) for chunk in islice(chunks, 2 * n_jobs)]
+            while window:
+                results = window.pop(0).result()
+                window.extend(executor.submit(self._score_frame, chunk) for chunk in islice(chunks, 1))
+                yield results
+    
+    def compile_scorer(self) -> 'FlatForestScorer':
+        """Single-employee scorer for the current model
         
-        return results.sort_values('turnover_risk', ascending=False)
+        Built by train_model/update_model and saved with the predictor; it is
+        only built here for predictors pickled without one.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
+        if getattr(self, '_scorer', None) is None:
+            self._scorer = FlatForestScorer(self.model, self.scaler, self.feature_columns)
+        return self._scorer
+    
+    def score_employee(self, features) -> Dict[str, any]:
+        """Low-latency turnover risk for one employee
+        
+        `features` is a vector in `feature_columns` order or a dict keyed by
+        feature name. Results match predict_turnover_risk for the same row.
+        """
+        scorer = self.compile_scorer()
+        if isinstance(features, dict):
+            features = scorer.vectorize(features)
+        risk, prediction = scorer.score_one(features)
+        return {
+            'turnover_risk': risk,
+            'turnover_prediction': prediction,
+            'high_risk': int(risk > 0.6),
+            'risk_category': risk_category(risk)
+        }
     
     def get_risk_factors(self, employee_id: str, employee_data: pd.DataFrame) -> Dict[str, any]:
         """Get specific risk factors for an employee"""
@@ -190,10 +470,23 @@ class EngagementPredictor:
     def __init__(self):
         self.model = GradientBoostingRegressor(n_estimators=100, random_state=42)
         self.scaler = StandardScaler()
+        self.feature_columns = []
+        self.training_data_hash = None
         self.is_trained = False
+        # Stages fitted by train_engagement_model, then one (X, y, stages) entry
+        # per update block stacked on them by update_model, oldest first. The
+        # batches are kept so the window can be refitted when a block retires
+        self.base_stages = self.model.n_estimators
+        self.update_blocks = []
+        self._trained_rng_state = None
     
-    def train_engagement_model(self, data: pd.DataFrame) -> Dict[str, float]:
-        """Train model to predict engagement scores"""
+    def train_engagement_model(self, data: pd.DataFrame,
+                               feature_store: Optional[FeatureStore] = None) -> Dict[str, float]:
+        """Train model to predict engagement scores
+        
+        Pass the FeatureStore behind `data` (see TurnoverPredictor.prepare_features)
+        to read the features from its cached matrix.
+        """
         
         feature_cols = [
             'tenure_years', 'job_satisfaction', 'work_life_balance', 
@@ -201,18 +494,26 @@ class EngagementPredictor:
         ]
         
         available_features = [col for col in feature_cols if col in data.columns]
+        self.feature_columns = available_features
         
-        X = data[available_features].fillna(data[available_features].mean())
-        y = data['engagement_score'].fillna(data['engagement_score'].mean())
+        X = _fill_column_means(feature_matrix(data, available_features, feature_store))
+        y = data['engagement_score'].fillna(data['engagement_score'].mean()).to_numpy()
+        self.training_data_hash = hash_training_data(pd.DataFrame(X, columns=available_features), pd.Series(y))
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # Scale and train
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        X_train_scaled = self.scaler.fit_transform(np.asarray(X_train, dtype=np.float64))
+        X_test_scaled = self.scaler.transform(np.asarray(X_test, dtype=np.float64))
         
+        # A retrain starts over at the original size, whatever updates grew it to
+        self.model.set_params(warm_start=False, n_estimators=self.base_stages)
         self.model.fit(X_train_scaled, y_train)
+        self.update_blocks = []
+        # Warm-started fits keep drawing from the model's RNG; its state after
+        # training lets a refitted window replay exactly
+        self._trained_rng_state = self.model._rng.get_state()
         
         # Evaluate
         train_pred = self.model.predict(X_train_scaled)
@@ -226,6 +527,155 @@ class EngagementPredictor:
             'train_rmse': np.sqrt(mean_squared_error(y_train, train_pred)),
             'test_rmse': np.sqrt(mean_squared_error(y_test, test_pred))
         }
+    
+    def update_model(self, new_data: pd.DataFrame, drift_threshold: float = 0.0,
+                     stages_per_update: int = 20, max_stages: int = 300) -> Dict[str, float]:
+        """Incrementally update the engagement model with a new batch of data
+        
+        Like TurnoverPredictor.update_model, `stages_per_update` boosting
+        stages are fitted to the new batch with warm_start on the unchanged
+        scaler, and the default drift_threshold of 0 updates on every batch.
+        The stages from train_engagement_model are always kept. Once
+        `max_stages` would be exceeded the oldest batches leave the window:
+        each stage corrects the ones before it, so rather than cutting stages
+        out of the middle of the chain, it is cut back to the trained stages
+        and the batches still in the window are refitted in order. The result
+        is the model those batches alone would have produced.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before it can be updated")
+        if self.base_stages + stages_per_update > max_stages:
+            raise ValueError(f"max_stages must leave room for {stages_per_update} stages "
+                             f"on top of the {self.base_stages} trained ones")
+        
+        X = _fill_column_means(feature_matrix(new_data, self.feature_columns))
+        y = new_data['engagement_score'].fillna(new_data['engagement_score'].mean()).to_numpy()
+        drift = feature_drift(self.scaler, X)
+        result = {'updated': False, 'drift': drift, 'stages_added': 0, 'stages_retired': 0,
+                  'n_stages': len(self.model.estimators_)}
+        if drift <= drift_threshold:
+            return result
+        
+        self.update_blocks.append((X, y, stages_per_update))
+        retired = 0
+        while self.base_stages + sum(block[2] for block in self.update_blocks) > max_stages:
+            retired += self.update_blocks.pop(0)[2]
+        if retired:
+            self._rewind_to_trained_stages()
+        refit = self.update_blocks if retired else self.update_blocks[-1:]
+        for X_block, y_block, stages in refit:
+            self.model.set_params(warm_start=True, n_estimators=len(self.model.estimators_) + stages)
+            self.model.fit(self.scaler.transform(np.asarray(X_block, dtype=np.float64)), y_block)
+        self.training_data_hash = hash_training_data(pd.DataFrame(X, columns=self.feature_columns), pd.Series(y),
+                                                     previous=self.training_data_hash)
+        result.update(updated=True, stages_added=stages_per_update, stages_retired=retired,
+                      n_stages=len(self.model.estimators_))
+        return result
+    
+    def _rewind_to_trained_stages(self):
+        """Drop every update stage and put the model's RNG back where training left it"""
+        model = self.model
+        model.estimators_ = model.estimators_[:self.base_stages]
+        model.train_score_ = model.train_score_[:self.base_stages]
+        model.n_estimators_ = self.base_stages
+        model._rng.set_state(self._trained_rng_state)
+
+class ModelRegistry:
+    """Versioned on-disk store of trained predictors
+    
+    Layout: <root>/<name>/v0001/{model.joblib, metadata.json}. Models are
+    dumped uncompressed so load() can memory-map the plain NumPy arrays in
+    them (the flattened scorer's node arrays); the sklearn estimators are
+    rebuilt in memory when unpickled either way. The metadata records the
+    feature schema, label-encoder vocabularies and the training data hash so
+    a loaded model can be checked against its inputs.
+    """
+    
+    MODEL_FILE = 'model.joblib'
+    METADATA_FILE = 'metadata.json'
+    
+    def __init__(self, root: str):
+        self.root = root
+    
+    def versions(self, name: str) -> List[int]:
+        """Saved versions of `name`, oldest first"""
+        model_dir = os.path.join(self.root, name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(int(entry[1:]) for entry in os.listdir(model_dir)
+                      if re.fullmatch(r'v\d+', entry)
+                      and os.path.exists(os.path.join(model_dir, entry, self.METADATA_FILE)))
+    
+    def has_model(self, name: str) -> bool:
+        return bool(self.versions(name))
+    
+    def _version_dir(self, name: str, version: int) -> str:
+        return os.path.join(self.root, name, f"v{version:04d}")
+    
+    def save(self, predictor, name: str, metrics: Optional[Dict[str, float]] = None) -> int:
+        """Save a trained TurnoverPredictor or EngagementPredictor as the next version of `name`"""
+        if not predictor.is_trained:
+            raise ValueError("Only trained models can be saved")
+        
+        version = (self.versions(name) or [0])[-1] + 1
+        version_dir = self._version_dir(name, version)
+        os.makedirs(version_dir)
+        if hasattr(predictor, 'compile_scorer'):
+            # The flattened scorer is stored with the model so load() is ready to score
+            predictor.compile_scorer()
+        joblib.dump(predictor, os.path.join(version_dir, self.MODEL_FILE))
+        
+        encoders = getattr(predictor, 'label_encoders', {})
+        metadata = {
+            'name': name,
+            'version': version,
+            'created_at': datetime.now().isoformat(),
+            'predictor_class': type(predictor).__name__,
+            'model_class': type(predictor.model).__name__,
+            'sklearn_version': sklearn.__version__,
+            'feature_columns': list(predictor.feature_columns),
+            'encoder_vocabularies': {col: [str(c) for c in enc.classes_] for col, enc in encoders.items()},
+            'training_data_hash': predictor.training_data_hash,
+            'n_estimators': len(predictor.model.estimators_),
+            'metrics': {key: float(value) for key, value in (metrics or {}).items()}
+        }
+        # Metadata is written last: a version without it is ignored by versions()
+        with open(os.path.join(version_dir, self.METADATA_FILE), 'w') as f:
+            json.dump(metadata, f, indent=2)
+        return version
+    
+    def metadata(self, name: str, version: Optional[int] = None) -> Dict[str, any]:
+        version = version or self._latest(name)
+        with open(os.path.join(self._version_dir(name, version), self.METADATA_FILE)) as f:
+            return json.load(f)
+    
+    def _latest(self, name: str) -> int:
+        versions = self.versions(name)
+        if not versions:
+            raise FileNotFoundError(f"No saved versions of model '{name}' in {self.root}")
+        return versions[-1]
+    
+    def load(self, name: str, version: Optional[int] = None, mmap: bool = True):
+        """Load a saved predictor (latest version by default), ready to predict
+        
+        With `mmap`, NumPy arrays stored directly in the pickle (the
+        FlatForestScorer arrays) stay memory-mapped read-only; the sklearn
+        models' trees are copied into memory as they are unpickled.
+        """
+        metadata = self.metadata(name, version)
+        if metadata['sklearn_version'] != sklearn.__version__:
+            warnings.warn(f"Model '{name}' v{metadata['version']} was saved with scikit-learn "
+                          f"{metadata['sklearn_version']}, running {sklearn.__version__}")
+        
+        path = os.path.join(self._version_dir(name, metadata['version']), self.MODEL_FILE)
+        predictor = joblib.load(path, mmap_mode='r' if mmap else None)
+        
+        if list(predictor.feature_columns) != metadata['feature_columns']:
+            raise ValueError(f"Model '{name}' v{metadata['version']} does not match its feature schema")
+        for col, vocabulary in metadata['encoder_vocabularies'].items():
+            if [str(c) for c in predictor.label_encoders[col].classes_] != vocabulary:
+                raise ValueError(f"Model '{name}' v{metadata['version']} encoder for '{col}' does not match its metadata")
+        return predictor
 
 # Example usage
 if __name__ == "__main__":
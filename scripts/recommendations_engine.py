@@ -1,11 +1,119 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 from datetime import datetime
 
+from action_plans import ActionPlanRenderer
+
+# Need -> (column, comparison, threshold, default when the column is absent), in reporting order
+NEED_RULES = [
+    ('low_job_satisfaction', 'job_satisfaction', 'le', 5, 10),
+    ('poor_work_life_balance', 'work_life_balance', 'le', 5, 10),
+    ('limited_career_development', 'career_development', 'le', 5, 10),
+    ('weak_management_support', 'management_support', 'le', 5, 10),
+    ('low_engagement', 'engagement_score', 'lt', 6, 10),
+    ('high_turnover_risk', 'turnover_risk', 'gt', 0.6, 0)
+]
+NEED_BITS = {need: 1 << i for i, (need, *_) in enumerate(NEED_RULES)}
+INTERVENTIONS_PER_NEED = 2
+DEPARTMENT_INTERVENTION_IMPACT = 7.5
+# Team-wide interventions as (survey column, share of the team answering 5 or lower
+# that triggers it in percent, intervention, description, impact score)
+TEAM_INTERVENTIONS = [
+    ('job_satisfaction', 30, 'Team Role Clarity Workshop',
+     'Address role confusion and job satisfaction across the team', 8.5),
+    ('work_life_balance', 25, 'Team Workload Rebalancing',
+     'Redistribute work and implement team-wide flexible policies', 8.8),
+    ('career_development', 35, 'Team Learning Initiative',
+     'Implement team-wide learning and development program', 8.3),
+    ('management_support', 40, 'Leadership Development Program',
+     'Intensive management training for team leaders', 9.1)
+]
+# Priority score thresholds, highest first
+PRIORITY_LEVELS = [(0.7, 'Critical'), (0.5, 'High'), (0.3, 'Medium')]
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts and lists (as MappingProxyType and tuples)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+class InterventionCatalog:
+    """Precompiled, read-only view of an intervention library and department strategies
+    
+    Every intervention gets an integer ID: each need's top interventions,
+    pre-sorted by impact, and one interned entry per department intervention.
+    ranked() resolves a need bitmask (bit i = NEED_RULES[i]) and department
+    to the ranked, de-duplicated top-k IDs and their estimated impact,
+    memoized across the 64 bitmasks x departments. The catalog copies what
+    it needs at construction, so later edits to the library do not reach
+    it; build a new catalog instead. Entries are read-only mappings shared
+    by every recommendation that uses them (dict(entry) for a modifiable
+    copy).
+    """
+    
+    def __init__(self, intervention_library: Dict[str, List[Dict]], department_strategies: Dict[str, Dict]):
+        entries = []
+        need_ids = []
+        for need, *_ in NEED_RULES:
+            top = sorted(intervention_library.get(need, []), key=lambda x: x['impact_score'], reverse=True)
+            need_ids.append(tuple(range(len(entries), len(entries) + len(top[:INTERVENTIONS_PER_NEED]))))
+            entries.extend(MappingProxyType(dict(rec)) for rec in top[:INTERVENTIONS_PER_NEED])
+        
+        department_ids = {}
+        for department, strategy in department_strategies.items():
+            interventions = strategy['specific_interventions']
+            department_ids[department] = tuple(range(len(entries), len(entries) + len(interventions)))
+            entries.extend(MappingProxyType({
+                'intervention': intervention,
+                'description': f'Department-specific initiative for {department}',
+                'impact_score': DEPARTMENT_INTERVENTION_IMPACT,
+                'effort_level': 'Medium',
+                'timeline': '2-4 weeks',
+                'category': 'department_specific'
+            }) for intervention in interventions)
+        
+        self.entries = tuple(entries)
+        self.names = tuple(entry['intervention'] for entry in entries)
+        self.impacts = tuple(float(entry['impact_score']) for entry in entries)
+        self.need_ids = tuple(need_ids)
+        self.department_ids = MappingProxyType(department_ids)
+        self._ranked = {}
+    
+    def ranked(self, need_mask: int, department, top_k: int = 5) -> Tuple[Tuple[int, ...], float]:
+        """(IDs of the top_k interventions, estimated impact) for a need bitmask and department
+        
+        Candidates are each flagged need's interventions in need order, then
+        the department's; duplicates by name keep their first occurrence, and
+        the stable sort by impact keeps candidate order among ties.
+        """
+        department = department if department in self.department_ids else None
+        key = (int(need_mask), department, top_k)
+        result = self._ranked.get(key)
+        if result is None:
+            candidates = [i for bit, ids in enumerate(self.need_ids) if need_mask >> bit & 1 for i in ids]
+            candidates += self.department_ids.get(department, ())
+            seen = set()
+            unique = [i for i in candidates if not (self.names[i] in seen or seen.add(self.names[i]))]
+            ids = tuple(sorted(unique, key=lambda i: self.impacts[i], reverse=True)[:top_k])
+            
+            # Same diminishing-returns weighting as estimate_overall_impact
+            total_impact, weight = 0.0, 1.0
+            for i in ids:
+                total_impact += self.impacts[i] * weight
+                weight *= 0.8
+            result = self._ranked[key] = (ids, min(total_impact, 10.0))
+        return result
+
 class EngagementRecommendationsEngine:
     """AI-powered recommendations engine for employee engagement initiatives"""
     
+    # Stored read-only; assigning either one rebuilds the catalog
+    CATALOG_ATTRIBUTES = ('intervention_library', 'department_strategies')
+    
     def __init__(self):
         self.intervention_library = {
             'low_job_satisfaction': [
@@ -166,6 +274,21 @@ class EngagementRecommendationsEngine:
                 'specific_interventions': ['HR Business Partner Training', 'Employee Experience Design', 'People Analytics']
             }
         }
+        
+        self.build_catalog()
+    
+    def __setattr__(self, name, value):
+        # Frozen so in-place edits fail instead of leaving the catalog stale
+        if name in self.CATALOG_ATTRIBUTES:
+            value = _freeze(value)
+        super().__setattr__(name, value)
+        if name in self.CATALOG_ATTRIBUTES and 'catalog' in self.__dict__:
+            self.build_catalog()
+    
+    def build_catalog(self):
+        """Compile the library and strategies into the catalog and action plan renderer"""
+        self.catalog = InterventionCatalog(self.intervention_library, self.department_strategies)
+        self.action_plans = ActionPlanRenderer(self.catalog.entries)
     
     def analyze_employee_needs(self, employee_data: pd.Series) -> List[str]:
         """Analyze individual employee needs based on survey data"""
@@ -197,50 +320,99 @@ class EngagementRecommendationsEngine:
         """Generate personalized recommendations for an individual employee"""
         
         needs = self.analyze_employee_needs(employee_data)
-        recommendations = []
-        
-        for need in needs:
-            if need in self.intervention_library:
-                interventions = self.intervention_library[need]
-                # Sort by impact score and select top 2
-                top_interventions = sorted(interventions, key=lambda x: x['impact_score'], reverse=True)[:2]
-                recommendations.extend(top_interventions)
-        
-        # Add department-specific recommendations
         department = employee_data.get('department', '')
-        if department in self.department_strategies:
-            dept_strategy = self.department_strategies[department]
-            for intervention in dept_strategy['specific_interventions']:
-                recommendations.append({
-                    'intervention': intervention,
-                    'description': f'Department-specific initiative for {department}',
-                    'impact_score': 7.5,
-                    'effort_level': 'Medium',
-                    'timeline': '2-4 weeks',
-                    'category': 'department_specific'
-                })
-        
-        # Remove duplicates and sort by impact
-        unique_recommendations = []
-        seen_interventions = set()
-        
-        for rec in recommendations:
-            if rec['intervention'] not in seen_interventions:
-                unique_recommendations.append(rec)
-                seen_interventions.add(rec['intervention'])
         
-        unique_recommendations = sorted(unique_recommendations, key=lambda x: x['impact_score'], reverse=True)
+        # Ranked, de-duplicated top 5 for this need combination and department, by table lookup
+        ids, estimated_impact = self.catalog.ranked(sum(NEED_BITS[need] for need in needs), department)
+        recommendations = [self.catalog.entries[i] for i in ids]
         
         return {
             'employee_id': employee_data.get('employee_id', ''),
             'employee_name': employee_data.get('name', ''),
             'department': employee_data.get('department', ''),
             'identified_needs': needs,
-            'recommendations': unique_recommendations[:5],  # Top 5 recommendations
+            'recommendations': recommendations,  # Top 5 recommendations (shared catalog entries)
             'priority_level': self.calculate_priority_level(employee_data),
-            'estimated_impact': self.estimate_overall_impact(unique_recommendations[:5])
+            'estimated_impact': estimated_impact
         }
     
+    def need_masks(self, data: pd.DataFrame) -> np.ndarray:
+        """Need bitmask of every row (bit i = NEED_RULES[i]) as uint8"""
+        flags = self.analyze_needs_bulk(data)
+        return flags.astype(np.uint8) @ (1 << np.arange(len(NEED_RULES), dtype=np.uint8))
+    
+    def analyze_needs_bulk(self, data: pd.DataFrame) -> np.ndarray:
+        """Need flags for every row as a (rows x NEED_RULES) boolean array
+        
+        Same rules as analyze_employee_needs; missing values never flag a need.
+        """
+        flags = np.zeros((len(data), len(NEED_RULES)), dtype=bool)
+        for i, (need, column, comparison, threshold, default) in enumerate(NEED_RULES):
+            if column not in data.columns:
+                continue
+            values = data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            flags[:, i] = getattr(np, {'le': 'less_equal', 'lt': 'less', 'gt': 'greater'}[comparison])(values, threshold)
+        return flags
+    
+    def generate_bulk_recommendations(self, data: pd.DataFrame, top_k: int = 5) -> pd.DataFrame:
+        """Recommendations for every row of a merged DataFrame in one vectorized pass
+        
+        Matches generate_individual_recommendations row by row. Each distinct
+        (need bitmask, department) pair is resolved once through the catalog
+        and broadcast to its rows. Returns one row per employee with the need
+        bitmask (bit i = NEED_RULES[i]), the needs, the top_k intervention
+        names (None in slots past an employee's last intervention), priority
+        level and estimated impact.
+        """
+        n = len(data)
+        need_mask = self.need_masks(data)
+        departments = data['department'].astype(object).to_numpy() if 'department' in data.columns else np.full(n, '', dtype=object)
+        dept_codes, dept_labels = pd.factorize(departments, use_na_sentinel=False)
+        
+        n_labels = max(len(dept_labels), 1)
+        combos, inverse = np.unique(need_mask.astype(np.int64) * n_labels + dept_codes, return_inverse=True)
+        ranked_ids = np.full((len(combos), top_k), -1, dtype=np.intp)
+        impacts = np.empty(len(combos))
+        for row, combo in enumerate(combos.tolist()):
+            ids, impacts[row] = self.catalog.ranked(combo // n_labels, dept_labels[combo % n_labels], top_k)
+            ranked_ids[row, :len(ids)] = ids
+        # ID -1 picks the trailing None, for rows with fewer than top_k interventions
+        names = np.append(np.array(self.catalog.names, dtype=object), None)
+        ranked_names = names[ranked_ids[inverse]]
+        
+        need_lists = np.empty(1 << len(NEED_RULES), dtype=object)
+        need_lists[:] = [[need for i, (need, *_) in enumerate(NEED_RULES) if mask >> i & 1]
+                         for mask in range(1 << len(NEED_RULES))]
+        
+        results = pd.DataFrame({
+            'employee_id': data['employee_id'].to_numpy() if 'employee_id' in data.columns else np.full(n, ''),
+            'employee_name': data['name'].to_numpy() if 'name' in data.columns else np.full(n, ''),
+            'department': departments,
+            'need_mask': need_mask,
+            'identified_needs': need_lists[need_mask]
+        }, index=data.index)
+        for k in range(top_k):
+            # Object dtype keeps unfilled slots as None; pandas would infer str and turn them into NaN
+            results[f"recommendation_{k + 1}"] = pd.Series(ranked_names[:, k], index=data.index, dtype=object)
+        results['priority_level'] = self.calculate_priority_levels(data)
+        results['estimated_impact'] = impacts[inverse]
+        return results
+    
+    def calculate_priority_levels(self, data: pd.DataFrame) -> np.ndarray:
+        """Vectorized calculate_priority_level over every row"""
+        def column(name, default):
+            if name not in data.columns:
+                return np.full(len(data), float(default))
+            return data[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        priority_score = (
+            column('turnover_risk', 0) * 0.4 +
+            (10 - column('engagement_score', 10)) / 10 * 0.3 +
+            (10 - column('satisfaction_score', 10)) / 10 * 0.3
+        )
+        return np.select([priority_score > threshold for threshold, _ in PRIORITY_LEVELS],
+                         [level for _, level in PRIORITY_LEVELS], default='Low').astype(object)
+    
     def calculate_priority_level(self, employee_data: pd.Series) -> str:
         """Calculate priority level for intervention"""
         
@@ -282,48 +454,18 @@ class EngagementRecommendationsEngine:
     def generate_team_recommendations(self, team_data: pd.DataFrame) -> Dict[str, any]:
         """Generate team-level recommendations"""
         
-        team_issues = {}
-        
-        # Identify common issues
-        low_satisfaction_pct = (team_data['job_satisfaction'] <= 5).mean() * 100
-        poor_balance_pct = (team_data['work_life_balance'] <= 5).mean() * 100
-        limited_development_pct = (team_data['career_development'] <= 5).mean() * 100
-        weak_management_pct = (team_data['management_support'] <= 5).mean() * 100
-        
         team_recommendations = []
         
         # Team-wide interventions based on common issues
-        if low_satisfaction_pct > 30:
-            team_recommendations.append({
-                'intervention': 'Team Role Clarity Workshop',
-                'description': 'Address role confusion and job satisfaction across the team',
-                'affected_percentage': low_satisfaction_pct,
-                'impact_score': 8.5
-            })
-        
-        if poor_balance_pct > 25:
-            team_recommendations.append({
-                'intervention': 'Team Workload Rebalancing',
-                'description': 'Redistribute work and implement team-wide flexible policies',
-                'affected_percentage': poor_balance_pct,
-                'impact_score': 8.8
-            })
-        
-        if limited_development_pct > 35:
-            team_recommendations.append({
-                'intervention': 'Team Learning Initiative',
-                'description': 'Implement team-wide learning and development program',
-                'affected_percentage': limited_development_pct,
-                'impact_score': 8.3
-            })
-        
-        if weak_management_pct > 40:
-            team_recommendations.append({
-                'intervention': 'Leadership Development Program',
-                'description': 'Intensive management training for team leaders',
-                'affected_percentage': weak_management_pct,
-                'impact_score': 9.1
-            })
+        for column, threshold, intervention, description, impact_score in TEAM_INTERVENTIONS:
+            affected_percentage = (team_data[column] <= 5).mean() * 100
+            if affected_percentage > threshold:
+                team_recommendations.append({
+                    'intervention': intervention,
+                    'description': description,
+                    'affected_percentage': affected_percentage,
+                    'impact_score': impact_score
+                })
         
         return {
             'team_size': len(team_data),
@@ -334,49 +476,89 @@ class EngagementRecommendationsEngine:
             'individual_attention_needed': len(team_data[team_data['turnover_risk'] > 0.7])
         }
     
+    def generate_team_recommendations_grouped(self, data: pd.DataFrame, by: str = 'department') -> pd.DataFrame:
+        """generate_team_recommendations for every team at once, teams keyed by `by` (e.g. manager_id)
+        
+        One factorize plus bincounts over all rows, instead of one pandas pass
+        per team. Returns a table indexed by team (sorted, missing keys
+        dropped, as groupby does) with the team statistics, each issue's
+        affected percentage, a bitmask of triggered interventions (bit i =
+        TEAM_INTERVENTIONS[i]) and their names ordered by impact.
+        """
+        codes, teams = pd.factorize(data[by], sort=True)
+        kept = codes >= 0
+        codes = codes[kept]
+        n_teams = len(teams)
+        team_size = np.bincount(codes, minlength=n_teams)
+        
+        def team_sum(values):
+            return np.bincount(codes, weights=values[kept], minlength=n_teams)
+        
+        def team_mean(column):
+            values = data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(values)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return team_sum(np.where(present, values, 0.0)) / team_sum(present.astype(np.float64))
+        
+        turnover_risk = data['turnover_risk'].to_numpy(dtype=np.float64, na_value=np.nan)
+        results = pd.DataFrame({
+            'team_size': team_size,
+            'avg_engagement': team_mean('engagement_score'),
+            'avg_satisfaction': team_mean('satisfaction_score'),
+            'high_risk_count': team_sum(turnover_risk > 0.6).astype(np.int64),
+            'individual_attention_needed': team_sum(turnover_risk > 0.7).astype(np.int64)
+        }, index=pd.Index(teams, name=by))
+        
+        intervention_mask = np.zeros(n_teams, dtype=np.uint8)
+        for i, (column, threshold, *_) in enumerate(TEAM_INTERVENTIONS):
+            affected = team_sum(data[column].to_numpy(dtype=np.float64, na_value=np.nan) <= 5) / team_size * 100
+            results[f"{column}_affected_pct"] = affected
+            intervention_mask |= (affected > threshold).astype(np.uint8) << i
+        
+        # Intervention names per mask, highest impact first (stable, like the per-team sort)
+        by_impact = sorted(range(len(TEAM_INTERVENTIONS)), key=lambda i: TEAM_INTERVENTIONS[i][4], reverse=True)
+        names = np.empty(1 << len(TEAM_INTERVENTIONS), dtype=object)
+        names[:] = [[TEAM_INTERVENTIONS[i][2] for i in by_impact if mask >> i & 1]
+                    for mask in range(1 << len(TEAM_INTERVENTIONS))]
+        results['intervention_mask'] = intervention_mask
+        results['team_interventions'] = names[intervention_mask]
+        return results
+    
     def create_action_plan(self, recommendations: Dict[str, any]) -> str:
         """Create a detailed action plan"""
-        
-        action_plan = f"""
-EMPLOYEE ENGAGEMENT ACTION PLAN
-{'='*50}
-
-Employee: {recommendations['employee_name']}
-Department: {recommendations['department']}
-Priority Level: {recommendations['priority_level']}
-Estimated Impact: {recommendations['estimated_impact']:.1f}/10
-
-IDENTIFIED NEEDS:
-{chr(10).join([f"• {need.replace('_', ' ').title()}" for need in recommendations['identified_needs']])}
-
-RECOMMENDED ACTIONS:
-"""
-        
-        for i, rec in enumerate(recommendations['recommendations'], 1):
-            action_plan += f"""
-{i}. {rec['intervention']}
-   Description: {rec['description']}
-   Impact Score: {rec['impact_score']}/10
-   Effort Level: {rec['effort_level']}
-   Timeline: {rec['timeline']}
-   
-"""
-        
-        action_plan += """
-IMPLEMENTATION TIMELINE:
-Week 1: Conduct stay interview and implement quick wins
-Week 2-3: Begin medium-effort interventions
-Week 4-8: Execute high-impact, longer-term initiatives
-Week 12: Review progress and adjust plan
-
-SUCCESS METRICS:
-• Improvement in relevant survey scores
-• Reduction in turnover risk score
-• Increase in engagement metrics
-• Employee feedback on interventions
-"""
-        
-        return action_plan
+        return self.action_plans.render(recommendations)
+    
+    def iter_action_plan_inputs(self, data: pd.DataFrame,
+                                priority_levels: Tuple[str, ...] = ('Critical', 'High'),
+                                chunk_size: int = 10000) -> Iterator[Dict[str, any]]:
+        """Lazily yield generate_individual_recommendations-shaped dicts for the
+        rows of `data` at the given priority levels, from the bulk results
+        
+        Bulk results are computed `chunk_size` rows at a time as the
+        iterator advances, so only one chunk's results are held at once.
+        """
+        for start in range(0, len(data), chunk_size):
+            bulk = self.generate_bulk_recommendations(data.iloc[start:start + chunk_size])
+            bulk = bulk[bulk['priority_level'].isin(priority_levels)]
+            for employee_id, name, department, need_mask, needs, priority, impact in zip(
+                    bulk['employee_id'], bulk['employee_name'], bulk['department'], bulk['need_mask'].tolist(),
+                    bulk['identified_needs'], bulk['priority_level'], bulk['estimated_impact']):
+                ids, _ = self.catalog.ranked(need_mask, department)
+                yield {
+                    'employee_id': employee_id,
+                    'employee_name': name,
+                    'department': department,
+                    'identified_needs': needs,
+                    'recommendations': [self.catalog.entries[i] for i in ids],
+                    'priority_level': priority,
+                    'estimated_impact': impact
+                }
+    
+    def write_action_plans(self, data: pd.DataFrame, path: str,
+                           priority_levels: Tuple[str, ...] = ('Critical', 'High'),
+                           chunk_size: int = 10000) -> int:
+        """Stream action plans for every employee at `priority_levels` to a text or .zip file"""
+        return self.action_plans.write(self.iter_action_plan_inputs(data, priority_levels, chunk_size), path)
 
 # Example usage
 if __name__ == "__main__":
@@ -2,13 +2,222 @@ import pandas as pd
 import numpy as np
 from textblob import TextBlob
 import re
-from collections import Counter
-from typing import List, Dict, Tuple
+import os
+import json
+import hashlib
+import sqlite3
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from types import MappingProxyType
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Bump whenever scoring logic changes so cached results are discarded
+ANALYZER_VERSION = '1'
+
+# Analyzer held by each worker process of a parallel batch
+_worker_analyzer = None
+
+def _init_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_chunk(texts: List[str]) -> List[Dict[str, float]]:
+    return [_worker_analyzer.analyze_text(text) for text in texts]
+
+class KeywordMatcher:
+    """Counts keyword hits for several keyword groups in one pass over the text
+    
+    All keywords are compiled into a single regex alternation. With
+    `word_boundaries` a keyword only matches whole words ("time" does not
+    match "sometimes"); without it, matching is by substring like a plain
+    `in` check. Each distinct keyword is counted once per text.
+    """
+    
+    def __init__(self, groups: Dict[str, List[str]], word_boundaries: bool = True):
+        self.groups = list(groups)
+        self.word_boundaries = word_boundaries
+        
+        # keyword -> groups it counts towards (a keyword may be in several)
+        self.keyword_groups = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self.keyword_groups.setdefault(keyword.lower(), []).append(group)
+        
+        # Longest first, so the alternation reports the longest keyword at a position
+        alternatives = '|'.join(re.escape(k) for k in sorted(self.keyword_groups, key=len, reverse=True))
+        if word_boundaries:
+            self.pattern = re.compile(rf'\b(?:{alternatives})\b')
+        else:
+            # Zero-width lookahead so overlapping keywords are all visited
+            self.pattern = re.compile(rf'(?=({alternatives}))')
+        
+        # A match only names the longest keyword at its position; any shorter
+        # keyword that is a prefix of it (at a word boundary if required) also matched
+        self.expansions = {}
+        for keyword in self.keyword_groups:
+            self.expansions[keyword] = [
+                other for other in self.keyword_groups
+                if keyword.startswith(other) and (
+                    not word_boundaries or len(other) == len(keyword) or not keyword[len(other)].isalnum())
+            ]
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords from each group found in `text`"""
+        found = set()
+        group_index = 0 if self.word_boundaries else 1
+        for match in self.pattern.finditer(text):
+            found.update(self.expansions[match.group(group_index)])
+        
+        counts = dict.fromkeys(self.groups, 0)
+        for keyword in found:
+            for group in self.keyword_groups[keyword]:
+                counts[group] += 1
+        return counts
+
+class SentimentCache:
+    """Cache of analyzer results keyed by a hash of the cleaned comment text
+    
+    Lookups hit a bounded in-memory LRU first, then an optional sqlite file
+    that survives restarts. Entries are tied to the analyzer fingerprint
+    (version + keyword configuration); binding a new fingerprint drops
+    everything computed under the old one.
+    """
+    
+    def __init__(self, max_entries: int = 100000, path: str = None, commit_every: int = 500):
+        self.max_entries = max_entries
+        self.path = path
+        self.commit_every = commit_every
+        self.fingerprint = None
+        self._memory = OrderedDict()
+        self._uncommitted = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                "fingerprint TEXT NOT NULL, key TEXT NOT NULL, result TEXT NOT NULL, "
+                "PRIMARY KEY (fingerprint, key))"
+            )
+            self._conn.commit()
+    
+    @staticmethod
+    def key(cleaned_text: str) -> str:
+        return hashlib.blake2b(cleaned_text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def bind(self, fingerprint: str):
+        """Attach to an analyzer configuration, invalidating results from any other"""
+        if fingerprint == self.fingerprint:
+            return
+        self.fingerprint = fingerprint
+        self._memory.clear()
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM sentiment_cache WHERE fingerprint != ?", (fingerprint,))
+            self._conn.commit()
+    
+    def get(self, key: str):
+        """Cached result for `key`, or None on a miss"""
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return dict(result)
+        
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT result FROM sentiment_cache WHERE fingerprint = ? AND key = ?",
+                (self.fingerprint, key)
+            ).fetchone()
+            if row is not None:
+                result = json.loads(row[0])
+                self._remember(key, result)
+                self.disk_hits += 1
+                return dict(result)
+        
+        self.misses += 1
+        return None
+    
+    def put(self, key: str, result: Dict[str, float]):
+        self._remember(key, dict(result))
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sentiment_cache (fingerprint, key, result) VALUES (?, ?, ?)",
+                (self.fingerprint, key, json.dumps(result))
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self.flush()
+    
+    def _remember(self, key: str, result: Dict[str, float]):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+    
+    def flush(self):
+        """Commit pending disk writes"""
+        if self._conn is not None and self._uncommitted:
+            self._conn.commit()
+            self._uncommitted = 0
+    
+    def close(self):
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for monitoring"""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            'hits': hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'evictions': self.evictions
+        }
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Worker count for an n_jobs argument, following the joblib convention
+    
+    Positive values are used as-is; -1 means all cores and -k means
+    cores + 1 - k (at least one). 0 is rejected.
+    """
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise ValueError(f"n_jobs must be a non-zero integer, got {n_jobs!r}")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + int(n_jobs))
+    return int(n_jobs)
 
 class SentimentAnalyzer:
-    """AI-driven sentiment analysis for employee feedback"""
+    """AI-driven sentiment analysis for employee feedback
     
-    def __init__(self):
+    The keyword lists are compiled once, at construction and whenever one of
+    them is reassigned. They are stored as tuples (and emotion_categories as
+    a read-only mapping), so edits have to go through assignment.
+    """
+    
+    def __init__(self, word_boundaries: bool = True, cache: SentimentCache = None):
+        self.word_boundaries = word_boundaries
+        self.cache = cache
         self.positive_keywords = [
             'excellent', 'great', 'amazing', 'fantastic', 'wonderful', 'outstanding',
             'satisfied', 'happy', 'pleased', 'motivated', 'engaged', 'supportive',
@@ -29,6 +238,52 @@ class SentimentAnalyzer:
             'workload': ['workload', 'busy', 'overworked', 'deadline', 'time'],
             'culture': ['culture', 'environment', 'atmosphere', 'team', 'colleagues']
         }
+        
+        self.compile_keywords()
+    
+    KEYWORD_ATTRIBUTES = ('word_boundaries', 'positive_keywords', 'negative_keywords', 'emotion_categories')
+    
+    def __getstate__(self):
+        # Worker processes never get the cache (sqlite handles don't pickle)
+        state = self.__dict__.copy()
+        state['cache'] = None
+        state['emotion_categories'] = dict(self.emotion_categories)
+        return state
+    
+    def __setstate__(self, state):
+        # Bypass __setattr__ so unpickling does not recompile per attribute
+        state = dict(state)
+        state['emotion_categories'] = MappingProxyType(state['emotion_categories'])
+        self.__dict__.update(state)
+    
+    def __setattr__(self, name, value):
+        # Reassigning a keyword list recompiles the matcher (once __init__ has set them all)
+        if name in ('positive_keywords', 'negative_keywords'):
+            value = tuple(value)
+        elif name == 'emotion_categories':
+            value = MappingProxyType({emotion: tuple(keywords) for emotion, keywords in value.items()})
+        super().__setattr__(name, value)
+        if name in self.KEYWORD_ATTRIBUTES and 'keyword_matcher' in self.__dict__:
+            self.compile_keywords()
+    
+    def _keyword_state(self) -> tuple:
+        return (self.word_boundaries, self.positive_keywords, self.negative_keywords,
+                tuple(self.emotion_categories.items()))
+    
+    def compile_keywords(self):
+        """(Re)build the keyword matcher and rebind the cache to the new configuration"""
+        self._compiled_state = self._keyword_state()
+        self.keyword_matcher = KeywordMatcher({
+            'positive': self.positive_keywords,
+            'negative': self.negative_keywords,
+            **self.emotion_categories
+        }, word_boundaries=self.word_boundaries)
+        if self.cache is not None:
+            self.cache.bind(self.fingerprint())
+    
+    def fingerprint(self) -> str:
+        """Hash of the analyzer version and keyword configuration"""
+        return hashlib.sha256(repr((ANALYZER_VERSION, self._compiled_state)).encode('utf-8')).hexdigest()[:16]
     
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze sentiment of text using TextBlob and custom keywords"""
@@ -37,15 +292,36 @@ class SentimentAnalyzer:
         
         # Clean text
         cleaned_text = self.clean_text(text)
+        result = self._analyze_cleaned(cleaned_text)
+        return {key: result[key] for key in
+                ('polarity', 'subjectivity', 'compound_score', 'positive_keywords', 'negative_keywords')}
+    
+    def _analyze_cleaned(self, cleaned_text: str) -> Dict[str, float]:
+        """Sentiment and emotion scores for already-cleaned text, via the cache if any"""
+        if self.cache is not None:
+            key = self.cache.key(cleaned_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
         
+        counts = self.keyword_matcher.count(cleaned_text)
+        result = {
+            **self._score_sentiment(cleaned_text, counts),
+            **{emotion: counts[emotion] for emotion in self.emotion_categories}
+        }
+        if self.cache is not None:
+            self.cache.put(key, result)
+        return result
+    
+    def _score_sentiment(self, cleaned_text: str, keyword_counts: Dict[str, int]) -> Dict[str, float]:
         # TextBlob analysis
-        blob = TextBlob(cleaned_text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        sentiment = TextBlob(cleaned_text).sentiment
+        polarity = sentiment.polarity
+        subjectivity = sentiment.subjectivity
         
         # Custom keyword analysis
-        positive_count = sum(1 for word in self.positive_keywords if word in cleaned_text.lower())
-        negative_count = sum(1 for word in self.negative_keywords if word in cleaned_text.lower())
+        positive_count = keyword_counts['positive']
+        negative_count = keyword_counts['negative']
         
         # Calculate compound score
         keyword_score = (positive_count - negative_count) / max(len(cleaned_text.split()), 1)
@@ -80,78 +356,225 @@ class SentimentAnalyzer:
         if not text or pd.isna(text):
             return {category: 0 for category in self.emotion_categories}
         
-        cleaned_text = self.clean_text(text)
-        emotion_scores = {}
+        counts = self.keyword_matcher.count(self.clean_text(text))
+        return {emotion: counts[emotion] for emotion in self.emotion_categories}
+    
+    def analyze_text(self, text: str) -> Dict[str, float]:
+        """Sentiment and emotion scores for one text, cleaning and matching it once"""
+        if not text or pd.isna(text):
+            return {**self.analyze_sentiment(text), **self.extract_emotions(text)}
         
-        for emotion, keywords in self.emotion_categories.items():
-            score = sum(1 for keyword in keywords if keyword in cleaned_text)
-            emotion_scores[emotion] = score
-            
-        return emotion_scores
+        return self._analyze_cleaned(self.clean_text(text))
+    
+    def result_columns(self) -> List[str]:
+        """Column order of the DataFrames returned by analyze_feedback_batch"""
+        return ['feedback_id', 'text', 'polarity', 'subjectivity', 'compound_score',
+                'positive_keywords', 'negative_keywords', *self.emotion_categories]
+    
+    def analyze_feedback_batch(self, feedback_list: List[str], n_jobs: int = 1,
+                               chunk_size: int = 1000, employee_ids: List[str] = None,
+                               timestamps: List[datetime] = None) -> pd.DataFrame:
+        """Analyze sentiment for a batch of feedback
+        
+        With n_jobs > 1 (negative values count back from the number of
+        cores, see resolve_n_jobs) the comments are scored in `chunk_size`
+        pieces on a process pool. Rows keep the input order and the column
+        layout is the same either way. `employee_ids` (and
+        optionally `timestamps`), one per comment, link each result to its
+        author as employee_id / timestamp columns; see summarize_by_employee.
+        """
+        feedback_list = list(feedback_list)
+        for name, values in (('employee_ids', employee_ids), ('timestamps', timestamps)):
+            if values is not None and len(values) != len(feedback_list):
+                raise ValueError(f"{name} must have one entry per feedback item")
+        n_jobs = resolve_n_jobs(n_jobs)
+        results = self._results_frame(feedback_list, self._score_batch(feedback_list, n_jobs, chunk_size))
+        if employee_ids is not None:
+            results.insert(1, 'employee_id', np.asarray(employee_ids, dtype=object))
+        if timestamps is not None:
+            results['timestamp'] = pd.to_datetime(pd.Series(timestamps, dtype=object))
+        return results
+    
+    def _results_frame(self, feedback_list: List[str], scores: List[Dict[str, float]],
+                       offset: int = 0) -> pd.DataFrame:
+        if self.cache is not None:
+            self.cache.flush()
+        results = [
+            {'feedback_id': i, 'text': feedback, **score}
+            for i, (feedback, score) in enumerate(zip(feedback_list, scores), offset)
+        ]
+        return pd.DataFrame(results, columns=self.result_columns())
+    
+    def _process_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,))
     
-    def analyze_feedback_batch(self, feedback_list: List[str]) -> pd.DataFrame:
-        """Analyze sentiment for a batch of feedback"""
-        results = []
+    def _score_batch(self, feedback_list: List[str], n_jobs: int, chunk_size: int,
+                     executor: ProcessPoolExecutor = None) -> List[Dict[str, float]]:
+        """Scores in input order, with uncached comments on a process pool when n_jobs > 1
         
+        `executor` is a running pool to submit to (it is left open); without
+        one, a pool is started and shut down for this batch.
+        """
+        if n_jobs == 1 or len(feedback_list) <= chunk_size:
+            return [self.analyze_text(feedback) for feedback in feedback_list]
+        
+        scores = [None] * len(feedback_list)
+        misses, cleaned = [], []
         for i, feedback in enumerate(feedback_list):
-            sentiment = self.analyze_sentiment(feedback)
-            emotions = self.extract_emotions(feedback)
-            
-            result = {
-                'feedback_id': i,
-                'text': feedback,
-                **sentiment,
-                **emotions
-            }
-            results.append(result)
-        
-        return pd.DataFrame(results)
+            if not feedback or pd.isna(feedback):
+                scores[i] = self.analyze_text(feedback)
+                continue
+            text = self.clean_text(feedback)
+            cached = self.cache.get(self.cache.key(text)) if self.cache is not None else None
+            if cached is None:
+                misses.append(i)
+                cleaned.append(text)
+            else:
+                scores[i] = cached
+        
+        # Scores depend only on the cleaned text, so each distinct miss is
+        # scored once (via its first raw comment) and mapped back to every row
+        codes, unique_cleaned = pd.factorize(np.array(cleaned, dtype=object))
+        first = np.unique(codes, return_index=True)[1]
+        texts = [feedback_list[misses[j]] for j in first]
+        chunks = [texts[j:j + chunk_size] for j in range(0, len(texts), chunk_size)]
+        if chunks:
+            owned = executor is None
+            if owned:
+                executor = self._process_pool(min(n_jobs, len(chunks)))
+            try:
+                # map() yields chunk results in submission order
+                computed = [score for chunk in executor.map(_analyze_chunk, chunks) for score in chunk]
+            finally:
+                if owned:
+                    executor.shutdown()
+            if self.cache is not None:
+                for text, score in zip(unique_cleaned, computed):
+                    self.cache.put(self.cache.key(text), score)
+            for i, code in zip(misses, codes):
+                scores[i] = computed[code]
+        return scores
+    
+    @staticmethod
+    def summarize_by_employee(sentiment_df: pd.DataFrame) -> pd.DataFrame:
+        """Per-employee sentiment summary, indexed by sorted employee_id
+        
+        Needs linked results (an employee_id column). Columns: mean compound
+        score, feedback / positive / negative counts (same thresholds as
+        generate_insights) and the latest feedback timestamp (NaT if unknown).
+        """
+        if 'employee_id' not in sentiment_df.columns:
+            raise ValueError("Sentiment results are not linked to employees; pass employee_ids when analyzing")
+        
+        compound = sentiment_df['compound_score']
+        frame = pd.DataFrame({
+            'employee_id': sentiment_df['employee_id'].to_numpy(dtype=object),
+            'sentiment_compound_mean': compound.to_numpy(),
+            'sentiment_positive_count': (compound > SentimentAggregator.POSITIVE_THRESHOLD).to_numpy(dtype=np.int64),
+            'sentiment_negative_count': (compound < SentimentAggregator.NEGATIVE_THRESHOLD).to_numpy(dtype=np.int64),
+            'sentiment_latest_at': pd.to_datetime(sentiment_df['timestamp']).to_numpy()
+            if 'timestamp' in sentiment_df.columns else np.full(len(sentiment_df), np.datetime64('NaT', 'us'))
+        })
+        grouped = frame.groupby('employee_id', sort=True)
+        summary = grouped.agg(sentiment_compound_mean=('sentiment_compound_mean', 'mean'),
+                              sentiment_feedback_count=('sentiment_compound_mean', 'size'),
+                              sentiment_positive_count=('sentiment_positive_count', 'sum'),
+                              sentiment_negative_count=('sentiment_negative_count', 'sum'),
+                              sentiment_latest_at=('sentiment_latest_at', 'max'))
+        return summary
+    
+    def analyze_feedback_stream(self, feedback_iter: Iterable[str], batch_size: int = 500,
+                                aggregator: 'SentimentAggregator' = None,
+                                n_jobs: int = 1) -> Iterator[pd.DataFrame]:
+        """Score an unbounded stream of comments, yielding one DataFrame per micro-batch
+        
+        Only one batch is held in memory at a time. feedback_id keeps counting
+        across batches, and `aggregator` (if given) is updated before each
+        batch is yielded so its insights() are always current. With n_jobs > 1
+        (or negative, see resolve_n_jobs) one process pool serves the whole
+        stream, and each batch is split into n_jobs chunks for it.
+        """
+        n_jobs = resolve_n_jobs(n_jobs)
+        chunk_size = max(1, batch_size // n_jobs)
+        executor = self._process_pool(n_jobs) if n_jobs > 1 else None
+        try:
+            offset = 0
+            iterator = iter(feedback_iter)
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    return
+                batch_df = self._results_frame(batch, self._score_batch(batch, n_jobs, chunk_size, executor), offset)
+                offset += len(batch)
+                if aggregator is not None:
+                    aggregator.update(batch_df)
+                yield batch_df
+        finally:
+            if executor is not None:
+                executor.shutdown()
     
     def generate_insights(self, sentiment_df: pd.DataFrame) -> Dict[str, any]:
         """Generate insights from sentiment analysis results"""
-        insights = {
+        return SentimentAggregator().update(sentiment_df).insights()
+
+class SentimentAggregator:
+    """Running totals behind generate_insights, updated one batch at a time"""
+    
+    EMOTIONS = ['stress', 'satisfaction', 'growth', 'support', 'workload', 'culture']
+    POSITIVE_THRESHOLD = 0.1
+    NEGATIVE_THRESHOLD = -0.1
+    
+    def __init__(self):
+        self.count = 0
+        self.polarity_sum = 0.0
+        self.compound_sum = 0.0
+        self.positive_count = 0
+        self.negative_count = 0
+        # emotion -> total, overall and within positive / negative feedback
+        self.emotion_totals = {}
+        self.positive_emotion_totals = {}
+        self.negative_emotion_totals = {}
+    
+    def update(self, sentiment_df: pd.DataFrame) -> 'SentimentAggregator':
+        """Fold one batch of analyze_feedback_batch output into the totals"""
+        compound = sentiment_df['compound_score']
+        positive = compound > self.POSITIVE_THRESHOLD
+        negative = compound < self.NEGATIVE_THRESHOLD
+        
+        self.count += len(sentiment_df)
+        self.polarity_sum += sentiment_df['polarity'].sum()
+        self.compound_sum += compound.sum()
+        self.positive_count += int(positive.sum())
+        self.negative_count += int(negative.sum())
+        
+        for emotion in self.EMOTIONS:
+            if emotion not in sentiment_df.columns:
+                continue
+            values = sentiment_df[emotion]
+            self.emotion_totals[emotion] = self.emotion_totals.get(emotion, 0) + values.sum()
+            self.positive_emotion_totals[emotion] = self.positive_emotion_totals.get(emotion, 0) + values[positive].sum()
+            self.negative_emotion_totals[emotion] = self.negative_emotion_totals.get(emotion, 0) + values[negative].sum()
+        return self
+    
+    @staticmethod
+    def _top_emotions(totals: Dict[str, float]) -> List[Tuple[str, float]]:
+        top_emotions = [(emotion, total) for emotion, total in totals.items() if total > 0]
+        return sorted(top_emotions, key=lambda x: x[1], reverse=True)[:3]
+    
+    def insights(self) -> Dict[str, any]:
+        """Current insights, in the same shape as SentimentAnalyzer.generate_insights"""
+        count = self.count or np.nan
+        return {
             'overall_sentiment': {
-                'avg_polarity': sentiment_df['polarity'].mean(),
-                'avg_compound_score': sentiment_df['compound_score'].mean(),
-                'positive_feedback_pct': (sentiment_df['compound_score'] > 0.1).mean() * 100,
-                'negative_feedback_pct': (sentiment_df['compound_score'] < -0.1).mean() * 100
+                'avg_polarity': self.polarity_sum / count,
+                'avg_compound_score': self.compound_sum / count,
+                'positive_feedback_pct': self.positive_count / count * 100,
+                'negative_feedback_pct': self.negative_count / count * 100
             },
-            'top_concerns': [],
-            'top_positives': [],
-            'emotion_distribution': {}
+            'top_concerns': self._top_emotions(self.negative_emotion_totals) if self.negative_count else [],
+            'top_positives': self._top_emotions(self.positive_emotion_totals) if self.positive_count else [],
+            'emotion_distribution': dict(self.emotion_totals)
         }
-        
-        # Emotion distribution
-        emotion_cols = ['stress', 'satisfaction', 'growth', 'support', 'workload', 'culture']
-        for emotion in emotion_cols:
-            if emotion in sentiment_df.columns:
-                insights['emotion_distribution'][emotion] = sentiment_df[emotion].sum()
-        
-        # Top concerns (negative sentiment)
-        negative_feedback = sentiment_df[sentiment_df['compound_score'] < -0.1]
-        if not negative_feedback.empty:
-            top_emotions = []
-            for emotion in emotion_cols:
-                if emotion in negative_feedback.columns:
-                    total = negative_feedback[emotion].sum()
-                    if total > 0:
-                        top_emotions.append((emotion, total))
-            
-            insights['top_concerns'] = sorted(top_emotions, key=lambda x: x[1], reverse=True)[:3]
-        
-        # Top positives
-        positive_feedback = sentiment_df[sentiment_df['compound_score'] > 0.1]
-        if not positive_feedback.empty:
-            top_emotions = []
-            for emotion in emotion_cols:
-                if emotion in positive_feedback.columns:
-                    total = positive_feedback[emotion].sum()
-                    if total > 0:
-                        top_emotions.append((emotion, total))
-            
-            insights['top_positives'] = sorted(top_emotions, key=lambda x: x[1], reverse=True)[:3]
-        
-        return insights
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from columnar_store import ColumnTable
+from data_models import Employee, EmployeeEngagementData, SurveyResponse
+
+
+@pytest.fixture
+def data():
+    np.random.seed(0)
+    return EmployeeEngagementData(reference_date=datetime(2026, 1, 1)).generate_sample_data(50)
+
+
+def test_records_round_trip_through_the_tables(data):
+    records = data.employees.to_records()
+    copy = EmployeeEngagementData()
+    copy.employees.extend(records)
+
+    assert copy.employees.to_records() == records
+    assert copy.employees[3] == records[3] and data.employees[3] == copy.employees[3]
+    assert [r.responses for r in data.survey_responses.to_records()] == \
+        [r.responses for r in data.survey_responses]
+
+
+def test_frames_match_the_dataclass_path(data):
+    # The frames the record lists used to be converted into, row by row
+    employees = pd.DataFrame([vars(e) for e in data.employees.to_records()], dtype=object)
+    surveys = pd.DataFrame([{**{k: v for k, v in vars(r).items() if k != 'responses'}, **r.responses}
+                            for r in data.survey_responses.to_records()], dtype=object)
+    metrics = pd.DataFrame([vars(m) for m in data.engagement_metrics.to_records()], dtype=object)
+
+    for expected, actual in ((employees, data.get_employees_df()),
+                             (surveys, data.get_survey_responses_df()),
+                             (metrics, data.get_engagement_metrics_df())):
+        pd.testing.assert_frame_equal(actual[expected.columns].astype(object), expected, check_dtype=False)
+    reference = np.datetime64(data.reference_date, 'us')
+    assert (data.get_employees_df()['tenure_days'] ==
+            (reference - employees['hire_date'].to_numpy().astype('datetime64[us]')).astype('timedelta64[D]')
+            .astype(np.int64)).all()
+
+
+def test_public_frames_take_new_labels(data):
+    df = data.get_employees_df()
+    df.loc[0, 'department'] = 'Legal'
+    assert df.loc[0, 'department'] == 'Legal'
+    assert data.get_employees_df().loc[0, 'department'] != 'Legal'
+
+
+def test_unanswered_questions_are_stored_as_missing():
+    data = EmployeeEngagementData()
+    data.survey_responses.append(SurveyResponse('R1', 'E1', 'custom', {'job_satisfaction': None,
+                                                                       'work_life_balance': 6}))
+    data.survey_responses.append(SurveyResponse('R2', 'E2', 'custom', {'job_satisfaction': 8.0}))
+
+    assert data.survey_responses[0].responses == {'work_life_balance': 6}
+    assert data.survey_responses[1].responses == {'job_satisfaction': 8}
+    df = data.get_survey_responses_df()
+    assert df['job_satisfaction'].isna().tolist() == [True, False]
+    assert df['work_life_balance'].isna().tolist() == [False, True]
+
+
+@pytest.mark.parametrize('answer', [7.6, 0, 11, 'seven'])
+def test_invalid_answers_are_rejected_without_a_partial_row(answer):
+    data = EmployeeEngagementData()
+    with pytest.raises(ValueError):
+        data.survey_responses.append(SurveyResponse('R1', 'E1', 'custom', {'job_satisfaction': answer}))
+    assert len(data.survey_responses) == 0
+
+
+def test_unknown_question_keys_are_kept():
+    data = EmployeeEngagementData()
+    data.survey_responses.append(SurveyResponse('R1', 'E1', 'custom', {'job_satisfaction': 4, 'foo': 3}))
+
+    assert data.survey_responses[0].responses == {'job_satisfaction': 4, 'foo': 3}
+    assert data.get_survey_responses_df().loc[0, 'foo'] == 3
+
+
+def test_integer_columns_reject_fractions_and_missing_values():
+    table = ColumnTable({'answer': 'int8'})
+    table.append_columns({'answer': np.array([1.0, 2.0])})
+    for bad in (np.array([1.0, 2.5]), np.array([1.0, np.nan])):
+        with pytest.raises(ValueError):
+            table.append_columns({'answer': bad})
+    with pytest.raises(ValueError):
+        table.append_row({'answer': None})
+    assert table.column('answer').tolist() == [1, 2]
+
+
+def test_row_proxies_are_unhashable_like_the_dataclasses(data):
+    with pytest.raises(TypeError):
+        hash(data.employees[0])
+    with pytest.raises(TypeError):
+        hash(Employee('E', 'n', 'd', 'r', datetime.now(), 'remote', 'mid'))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_export import ChunkedExporter
+
+pytest.importorskip('pyarrow')
+
+
+def _frame():
+    return pd.DataFrame({
+        'employee_id': [f"EMP{i:04d}" for i in range(6)],
+        'late_score': pd.Series([None, None, None, 4, 5, 6], dtype=object),
+        'never_set': pd.Series([None] * 6, dtype=object),
+        'engagement_score': np.linspace(1, 10, 6),
+        'department': pd.Categorical(['HR', 'HR', 'Sales', 'Sales', 'IT', 'IT']),
+    })
+
+
+def test_parquet_schema_covers_values_after_the_first_chunk(tmp_path):
+    data = _frame()
+    path = str(tmp_path / 'export.parquet')
+    ChunkedExporter('parquet', chunk_size=2).export(data, path, background=False)
+
+    result = pd.read_parquet(path)
+    assert result['late_score'].tolist()[3:] == [4, 5, 6] and result['late_score'].isna().sum() == 3
+    assert result['never_set'].isna().all()
+    pd.testing.assert_frame_equal(result[['employee_id', 'engagement_score']],
+                                  data[['employee_id', 'engagement_score']], check_dtype=False)
+
+
+@pytest.mark.parametrize('file_format, name', [('csv', 'empty.csv'), ('csv.gz', 'empty.csv.gz')])
+def test_empty_csv_export_keeps_the_header(tmp_path, file_format, name):
+    path = str(tmp_path / name)
+    ChunkedExporter(file_format).export(_frame().iloc[:0], path, background=False)
+    assert pd.read_csv(path).columns.tolist() == list(_frame().columns)
+
+
+@pytest.mark.parametrize('file_format, name', [('csv', 'out.csv'), ('ndjson', 'out.ndjson'),
+                                               ('parquet', 'out.parquet')])
+def test_chunked_export_round_trips(tmp_path, file_format, name):
+    data = _frame()[['employee_id', 'engagement_score', 'department']]
+    path = str(tmp_path / name)
+    ChunkedExporter(file_format, chunk_size=4).export(data, path, background=False)
+
+    if file_format == 'parquet':
+        result = pd.read_parquet(path)
+    elif file_format == 'csv':
+        result = pd.read_csv(path)
+    else:
+        result = pd.read_json(path, lines=True)
+    pd.testing.assert_frame_equal(result.astype({'department': object}), data.astype({'department': object}),
+                                  check_dtype=False)
@@ -0,0 +1,48 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_models import EmployeeEngagementData
+from timeseries_store import MetricHistory
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def data():
+    np.random.seed(0)
+    data = EmployeeEngagementData(reference_date=datetime(2026, 1, 1)).generate_sample_data(60)
+    data.metric_history = MetricHistory()
+    data.metric_history.append(data.generate_metric_history(num_waves=4, rng=np.random.default_rng(0)))
+    data.sentiment_results = pd.DataFrame({'feedback_id': range(3), 'text': ['good', 'bad', ''],
+                                           'compound_score': [0.4, -0.3, 0.0]})
+    return data
+
+
+@pytest.mark.parametrize('file_format', ['arrow', 'parquet'])
+def test_snapshot_round_trips(data, tmp_path, file_format):
+    data.save_snapshot(str(tmp_path), file_format=file_format)
+    loaded = EmployeeEngagementData.load_snapshot(str(tmp_path))
+
+    assert loaded.reference_date == data.reference_date
+    for frame in ('get_employees_df', 'get_survey_responses_df', 'get_engagement_metrics_df'):
+        pd.testing.assert_frame_equal(getattr(loaded, frame)(), getattr(data, frame)())
+    assert loaded.employees.to_records() == data.employees.to_records()
+    pd.testing.assert_frame_equal(loaded.sentiment_results, data.sentiment_results, check_dtype=False)
+
+    assert len(loaded.metric_history) == len(data.metric_history)
+    pd.testing.assert_frame_equal(loaded.metric_history.range(), data.metric_history.range(), check_dtype=False)
+    pd.testing.assert_frame_equal(loaded.metric_history.trend('engagement_score'),
+                                  data.metric_history.trend('engagement_score'))
+
+
+def test_snapshot_rejects_other_format_versions(data, tmp_path):
+    data.save_snapshot(str(tmp_path))
+    path = tmp_path / 'manifest.json'
+    manifest = json.loads(path.read_text())
+    path.write_text(json.dumps({**manifest, 'format_version': manifest['format_version'] + 1}))
+    with pytest.raises(ValueError):
+        EmployeeEngagementData.load_snapshot(str(tmp_path))
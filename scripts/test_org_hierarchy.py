@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kpi_engine import HIGH_RISK_THRESHOLD
+from org_hierarchy import OrgHierarchy
+
+ROLLUP_METRICS = {'avg_engagement': 'engagement_score', 'avg_satisfaction': 'satisfaction_score',
+                  'avg_enps': 'enps_score', 'avg_turnover_risk': 'turnover_risk'}
+
+
+@pytest.fixture
+def org():
+    rng = np.random.default_rng(0)
+    n = 300
+    ids = [f"EMP{i:04d}" for i in range(n)]
+    # Each employee reports to someone earlier; plus a second root, an unknown manager and a self-reference
+    managers = [None] + [ids[rng.integers(0, i)] for i in range(1, n)]
+    managers[40], managers[41], managers[42] = None, 'EMP9999', ids[42]
+    metrics = pd.DataFrame({
+        'employee_id': ids,
+        'engagement_score': rng.uniform(1, 10, n),
+        'satisfaction_score': rng.uniform(1, 10, n),
+        'enps_score': rng.uniform(-100, 100, n),
+        'turnover_risk': rng.uniform(0, 1, n),
+    })
+    metrics.loc[rng.choice(n, 30, replace=False), 'engagement_score'] = np.nan
+    hierarchy = OrgHierarchy(ids, managers)
+    hierarchy.load_metrics(metrics)
+    return hierarchy, dict(zip(ids, managers)), metrics.set_index('employee_id')
+
+
+def _naive_rollup(employee_id, managers, metrics, include_manager):
+    reports = {}
+    for employee, manager in managers.items():
+        if manager in managers and manager != employee:
+            reports.setdefault(manager, []).append(employee)
+
+    def org(employee):
+        return [employee] + [member for report in reports.get(employee, []) for member in org(report)]
+
+    members = org(employee_id)[(not include_manager):]
+    rows = metrics.loc[members]
+    high_risk = int((rows['turnover_risk'] > HIGH_RISK_THRESHOLD).sum())
+    return {'headcount': len(members), **{name: rows[column].mean() for name, column in ROLLUP_METRICS.items()},
+            'high_risk_employees': high_risk,
+            'retention_risk': high_risk / len(members) * 100 if members else np.nan}
+
+
+@pytest.mark.parametrize('include_manager', [True, False])
+def test_rollups_match_a_recursive_walk(org, include_manager):
+    hierarchy, managers, metrics = org
+    table = hierarchy.rollup_all(include_manager=include_manager, managers_only=False)
+
+    for employee_id in managers:
+        expected = _naive_rollup(employee_id, managers, metrics, include_manager)
+        assert hierarchy.rollup(employee_id, include_manager) == pytest.approx(expected, nan_ok=True)
+        row = table.loc[employee_id]
+        assert {key: row[key] for key in expected} == pytest.approx(expected, nan_ok=True)
+
+
+def test_tree_structure(org):
+    hierarchy, managers, _ = org
+    assert hierarchy.manager('EMP0040') is None and hierarchy.manager('EMP0041') is None
+    assert hierarchy.manager('EMP0042') is None
+    assert hierarchy.org_size('EMP0000') + hierarchy.org_size('EMP0040') + hierarchy.org_size('EMP0041') + \
+        hierarchy.org_size('EMP0042') == len(managers)
+    for employee_id, manager in managers.items():
+        if manager in managers and manager != employee_id:
+            assert employee_id in hierarchy.direct_reports(manager)
+
+
+def test_reporting_cycles_are_rejected():
+    with pytest.raises(ValueError):
+        OrgHierarchy(['A', 'B', 'C'], ['C', 'A', 'B'])
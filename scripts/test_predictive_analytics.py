@@ -0,0 +1,190 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from data_models import EmployeeEngagementData
+from feature_store import FeatureStore
+from predictive_analytics import EngagementPredictor, ModelRegistry, TurnoverPredictor, feature_matrix
+
+
+def _merged_frame(predictor, num_employees, seed):
+    np.random.seed(seed)
+    data = EmployeeEngagementData().generate_sample_data_vectorized(num_employees, np.random.default_rng(seed))
+    frame = predictor.prepare_features(data.get_employees_df(), data.get_survey_responses_df(),
+                                       data.get_engagement_metrics_df())
+    return predictor.generate_turnover_labels(frame)
+
+
+@pytest.fixture
+def turnover():
+    predictor = TurnoverPredictor()
+    old = _merged_frame(predictor, 400, seed=0)
+    predictor.train_model(old)
+    return predictor, old, _merged_frame(predictor, 200, seed=1)
+
+
+def test_turnover_update_keeps_existing_tree_predictions(turnover):
+    predictor, old, batch = turnover
+    X_old = predictor._scale(predictor._features(old))
+    trees = list(predictor.model.estimators_)
+    before = predictor.model.predict_proba(X_old)
+    per_tree = [tree.predict_proba(X_old) for tree in trees]
+
+    result = predictor.update_model(batch, trees_per_update=10)
+
+    assert result['updated'] and result['n_trees'] == len(trees) + 10
+    assert predictor.model.estimators_[:len(trees)] == trees
+    X_scaled = predictor._scale(predictor._features(old))
+    for tree, expected in zip(trees, per_tree):
+        np.testing.assert_array_equal(tree.predict_proba(X_scaled), expected)
+    # The original forest's share of the grown forest is its old prediction
+    old_share = np.mean([tree.predict_proba(X_scaled) for tree in trees], axis=0)
+    np.testing.assert_allclose(old_share, before, rtol=0, atol=1e-12)
+
+
+def test_turnover_update_retires_oldest_trees(turnover):
+    predictor, old, batch = turnover
+    trees = list(predictor.model.estimators_)
+
+    result = predictor.update_model(batch, trees_per_update=20, max_trees=110)
+
+    assert result['trees_retired'] == 10 and result['n_trees'] == 110
+    assert predictor.model.estimators_[:90] == trees[10:]
+
+
+def _engagement_frame(turnover, num_employees, seed, shift=0.0):
+    """Merged frame whose engagement_score is a learnable function of the answers"""
+    frame = _merged_frame(turnover, num_employees, seed)
+    noise = np.random.default_rng(seed + 100).normal(0, 0.3, len(frame))
+    frame['engagement_score'] = (0.5 * frame['job_satisfaction'] + 0.3 * frame['management_support'] +
+                                 0.2 * frame['company_culture'] + shift + noise).astype(float)
+    return frame
+
+
+def _engagement_rmse(predictor, frame):
+    X = feature_matrix(frame, predictor.feature_columns, fill_value=0).astype(np.float64)
+    error = predictor.model.predict(predictor.scaler.transform(X)) - frame['engagement_score'].to_numpy()
+    return float(np.sqrt(np.mean(error ** 2)))
+
+
+def test_engagement_update_refits_the_window_at_the_cap():
+    turnover = TurnoverPredictor()
+    old = _engagement_frame(turnover, 400, seed=0)
+    batches = {seed: _engagement_frame(turnover, 200, seed=seed, shift=1.0) for seed in (1, 2, 3)}
+    holdout = _engagement_frame(turnover, 1000, seed=9, shift=1.0)
+    predictor = EngagementPredictor()
+    predictor.train_engagement_model(old)
+    base = predictor.model.estimators_.copy()
+
+    for seed in (1, 2):
+        predictor.update_model(batches[seed], stages_per_update=20, max_stages=140)
+    before = _engagement_rmse(predictor, holdout)
+    result = predictor.update_model(batches[3], stages_per_update=20, max_stages=140)
+    assert result['stages_retired'] == 20 and result['n_stages'] == 140
+    assert [block[2] for block in predictor.update_blocks] == [20, 20]
+    assert (predictor.model.estimators_[:len(base)] == base).all()
+    assert len(predictor.model.train_score_) == 140
+    # Retiring a block keeps the chain consistent, so the error does not jump
+    assert _engagement_rmse(predictor, holdout) <= before * 1.1
+
+    # Same model as if the retired batch had never been seen
+    reference = EngagementPredictor()
+    reference.train_engagement_model(old)
+    for seed in (2, 3):
+        reference.update_model(batches[seed], stages_per_update=20, max_stages=140)
+    X = predictor.scaler.transform(feature_matrix(holdout, predictor.feature_columns, fill_value=0).astype(np.float64))
+    np.testing.assert_array_equal(predictor.model.predict(X), reference.model.predict(X))
+
+    predictor.train_engagement_model(old)
+    assert len(predictor.model.estimators_) == len(base) and predictor.update_blocks == []
+
+
+def test_engagement_update_needs_room_above_the_trained_stages():
+    turnover = TurnoverPredictor()
+    predictor = EngagementPredictor()
+    predictor.train_engagement_model(_merged_frame(turnover, 200, seed=0))
+    with pytest.raises(ValueError):
+        predictor.update_model(_merged_frame(turnover, 100, seed=1), stages_per_update=20, max_stages=110)
+
+
+def test_flat_scorer_is_saved_and_matches_predict_proba(turnover, tmp_path):
+    predictor, old, batch = turnover
+    predictor.update_model(batch, trees_per_update=10)
+    registry = ModelRegistry(str(tmp_path))
+    registry.save(predictor, 'turnover')
+    loaded = registry.load('turnover')
+
+    X = loaded._features(old)
+    expected = loaded.model.predict_proba(loaded._scale(X))[:, 1]
+    assert loaded._scorer is not None and loaded._scorer.n_trees == len(loaded.model.estimators_)
+    risk, labels = loaded._scorer.score(X)
+    np.testing.assert_array_equal(risk, expected)
+    np.testing.assert_array_equal(labels, loaded.model.predict(loaded._scale(X)))
+    for row, p in zip(X[:50], expected[:50]):
+        assert loaded.score_employee(row)['turnover_risk'] == p
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2, -1])
+def test_batched_scoring_matches_predict_turnover_risk(turnover, n_jobs):
+    predictor, old, _ = turnover
+    expected = predictor.predict_turnover_risk(old)
+    top = predictor.predict_turnover_risk_batched(old, top_k=25, chunk_size=64, n_jobs=n_jobs)
+    # Ties may pick different employees, but the risks are the same
+    np.testing.assert_array_equal(top['turnover_risk'], expected['turnover_risk'].head(25))
+    risk = expected.set_index('employee_id')['turnover_risk']
+    np.testing.assert_array_equal(top['turnover_risk'], risk[top['employee_id']])
+
+
+@pytest.mark.parametrize('n_jobs', [0, 1.5])
+def test_batched_scoring_rejects_invalid_n_jobs(turnover, n_jobs):
+    predictor, old, _ = turnover
+    with pytest.raises(ValueError):
+        predictor.predict_turnover_risk_batched(old, n_jobs=n_jobs)
+
+
+# p99 budget for score_employee; the strict target only holds on a quiet
+# machine, so it is opt-in and the default just guards against regressions
+SCORE_EMPLOYEE_P99 = 100e-6 if os.environ.get('IGNITE_BENCHMARK') else 2e-3
+
+
+def test_score_employee_latency(turnover):
+    predictor, old, batch = turnover
+    predictor.update_model(batch, trees_per_update=10)
+    assert predictor.compile_scorer().depth <= TurnoverPredictor.MAX_TREE_DEPTH
+
+    rows = list(predictor._features(old))
+    for row in rows[:100]:
+        predictor.score_employee(row)
+    timings = []
+    for row in rows * 5:
+        start = time.perf_counter()
+        predictor.score_employee(row)
+        timings.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(timings, [50, 99])
+    assert p99 < SCORE_EMPLOYEE_P99, f"score_employee p50 {p50 * 1e6:.0f}us, p99 {p99 * 1e6:.0f}us"
+
+
+def test_prepare_features_leaves_the_store_frame_alone_and_reads_its_matrix():
+    data = EmployeeEngagementData().generate_sample_data_vectorized(300, np.random.default_rng(0))
+    store = FeatureStore(data.get_employees_df(), data.get_survey_responses_df(), data.get_engagement_metrics_df())
+    columns = list(store.frame.columns)
+    predictor = TurnoverPredictor()
+    np.random.seed(0)
+    training_data = predictor.generate_turnover_labels(
+        predictor.prepare_features(None, None, None, feature_store=store))
+    predictor.train_model(training_data)
+
+    assert list(store.frame.columns) == columns
+    assert 'department_encoded' in training_data.columns
+    assert store.backs(training_data, predictor.feature_columns)
+    assert predictor._features(training_data) is store.matrix(predictor.feature_columns, 0)
+    np.testing.assert_array_equal(predictor._features(training_data),
+                                  feature_matrix(training_data.copy(), predictor.feature_columns, fill_value=0))
+
+    # Edited copies are scored from their own values
+    edited = training_data.copy()
+    edited.loc[:, 'job_satisfaction'] = 1
+    assert not store.backs(edited, predictor.feature_columns)
+    assert (predictor._features(edited)[:, predictor.feature_columns.index('job_satisfaction')] == 1).all()
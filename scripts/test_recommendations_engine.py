@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recommendations_engine import EngagementRecommendationsEngine
+
+SURVEY_COLUMNS = ['job_satisfaction', 'work_life_balance', 'career_development', 'management_support']
+
+
+@pytest.fixture
+def engine():
+    return EngagementRecommendationsEngine()
+
+
+def _employees(n, seed=0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'employee_id': [f"EMP{i:04d}" for i in range(n)],
+        'name': [f"Employee {i}" for i in range(n)],
+        'department': rng.choice(['Engineering', 'Sales', 'Marketing', 'HR', 'Finance'], n),
+        **{column: rng.integers(1, 11, n) for column in SURVEY_COLUMNS},
+        'engagement_score': rng.uniform(1, 10, n).round(1),
+        'satisfaction_score': rng.uniform(1, 10, n).round(1),
+        'turnover_risk': rng.uniform(0, 1, n).round(3),
+    })
+    data.loc[0, 'job_satisfaction'] = np.nan
+    return data
+
+
+def test_bulk_recommendations_match_per_employee(engine):
+    data = _employees(300)
+    bulk = engine.generate_bulk_recommendations(data)
+
+    for i, (_, row) in enumerate(data.iterrows()):
+        expected = engine.generate_individual_recommendations(row)
+        actual = bulk.iloc[i]
+        names = [rec['intervention'] for rec in expected['recommendations']]
+        assert [actual[f"recommendation_{k + 1}"] for k in range(len(names))] == names
+        assert actual['identified_needs'] == expected['identified_needs']
+        assert actual['priority_level'] == expected['priority_level']
+        assert actual['estimated_impact'] == pytest.approx(expected['estimated_impact'])
+
+
+def test_unfilled_recommendation_slots_are_none(engine):
+    # No needs and a department without strategies: nothing to recommend
+    data = pd.DataFrame({'employee_id': ['EMP0001', 'EMP0002'], 'name': ['A', 'B'],
+                         'department': ['Finance', 'Engineering'],
+                         **{column: [9, 9] for column in SURVEY_COLUMNS},
+                         'engagement_score': [9.0, 9.0], 'turnover_risk': [0.1, 0.1]})
+    bulk = engine.generate_bulk_recommendations(data)
+
+    assert all(bulk.loc[0, f"recommendation_{k}"] is None for k in range(1, 6))
+    assert bulk.loc[1, 'recommendation_3'] is not None and bulk.loc[1, 'recommendation_4'] is None
+
+
+def test_catalog_entries_are_read_only(engine):
+    recommendations = engine.generate_individual_recommendations(_employees(1).iloc[0])['recommendations']
+    with pytest.raises(TypeError):
+        recommendations[0]['impact_score'] = 0
+    with pytest.raises(TypeError):
+        engine.catalog.department_ids['Finance'] = ()
+    with pytest.raises((TypeError, AttributeError)):
+        engine.intervention_library['low_engagement'].append({'intervention': 'Ignored'})
+
+
+def test_assigning_the_library_rebuilds_the_catalog(engine):
+    employee = _employees(1).iloc[0].copy()
+    employee[SURVEY_COLUMNS + ['engagement_score', 'turnover_risk']] = [9, 9, 9, 9, 9.0, 0.9]
+    before = engine.generate_individual_recommendations(employee)['recommendations']
+    assert before[0]['intervention'] != 'Sabbatical Option'
+
+    sabbatical = {'intervention': 'Sabbatical Option', 'description': 'Paid extended leave',
+                  'impact_score': 9.9, 'effort_level': 'High', 'timeline': '3-6 months'}
+    engine.intervention_library = {**engine.intervention_library,
+                                   'high_turnover_risk': [*engine.intervention_library['high_turnover_risk'],
+                                                          sabbatical]}
+    after = engine.generate_individual_recommendations(employee)
+    assert after['recommendations'][0]['intervention'] == 'Sabbatical Option'
+    assert engine.generate_bulk_recommendations(employee.to_frame().T)['recommendation_1'].iloc[0] == \
+        'Sabbatical Option'
+    assert 'Sabbatical Option' in engine.create_action_plan(after)
+
+
+@pytest.mark.parametrize('chunk_size', [7, 10000])
+def test_action_plan_inputs_match_per_employee(engine, chunk_size):
+    data = _employees(100)
+    expected = [recommendations for recommendations in (engine.generate_individual_recommendations(row)
+                                                         for _, row in data.iterrows())
+                if recommendations['priority_level'] in ('Critical', 'High')]
+    actual = list(engine.iter_action_plan_inputs(data, chunk_size=chunk_size))
+
+    assert expected
+    assert [plan['employee_id'] for plan in actual] == [plan['employee_id'] for plan in expected]
+    for plan, reference in zip(actual, expected):
+        assert plan['recommendations'] == reference['recommendations']
+        assert engine.create_action_plan(plan) == engine.create_action_plan(reference)
+
+
+def test_action_plan_inputs_are_computed_chunk_by_chunk(engine, monkeypatch):
+    sizes = []
+    bulk = engine.generate_bulk_recommendations
+    monkeypatch.setattr(engine, 'generate_bulk_recommendations', lambda chunk: sizes.append(len(chunk)) or bulk(chunk))
+
+    plans = engine.iter_action_plan_inputs(_employees(50), priority_levels=('Critical', 'High', 'Medium', 'Low'),
+                                           chunk_size=20)
+    assert sizes == []
+    next(plans)
+    assert sizes == [20]
+    assert len(list(plans)) == 49 and sizes == [20, 20, 10]
+
+
+def test_grouped_team_recommendations_match_per_team(engine):
+    data = _employees(400)
+    data['manager_id'] = [f"MGR{i % 13:02d}" if i % 17 else None for i in range(len(data))]
+    grouped = engine.generate_team_recommendations_grouped(data, by='manager_id')
+
+    assert grouped.index.tolist() == sorted(data['manager_id'].dropna().unique())
+    for manager_id, team in data.groupby('manager_id'):
+        expected = engine.generate_team_recommendations(team)
+        row = grouped.loc[manager_id]
+        assert row['team_size'] == expected['team_size']
+        assert row['avg_engagement'] == pytest.approx(expected['avg_engagement'])
+        assert row['avg_satisfaction'] == pytest.approx(expected['avg_satisfaction'])
+        assert row['high_risk_count'] == expected['high_risk_count']
+        assert row['individual_attention_needed'] == expected['individual_attention_needed']
+        assert row['team_interventions'] == [rec['intervention'] for rec in expected['team_recommendations']]
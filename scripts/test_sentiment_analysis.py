@@ -0,0 +1,94 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from sentiment_analysis import SentimentAnalyzer, SentimentCache, resolve_n_jobs
+
+FEEDBACK = [
+    "I love working here! The team is very supportive and I have great opportunities for growth.",
+    "The workload is overwhelming and I'm feeling burned out. Management doesn't seem to care.",
+    "Toxic work environment with micromanagement. Very stressful and demotivating.",
+    "Underpaid and overworked. No recognition for hard work. Considering leaving.",
+    "",
+]
+
+
+@pytest.mark.parametrize('n_jobs', [0, 1.5, 'all'])
+def test_invalid_n_jobs_is_rejected(n_jobs):
+    with pytest.raises(ValueError):
+        resolve_n_jobs(n_jobs)
+    with pytest.raises(ValueError):
+        SentimentAnalyzer().analyze_feedback_batch(FEEDBACK, n_jobs=n_jobs)
+
+
+def test_negative_n_jobs_counts_back_from_the_cores(monkeypatch):
+    monkeypatch.setattr('os.cpu_count', lambda: 8)
+    assert [resolve_n_jobs(n) for n in (1, 3, -1, -2, -8, -20)] == [1, 3, 8, 7, 1, 1]
+
+
+def test_keywords_are_recompiled_on_assignment_only():
+    analyzer = SentimentAnalyzer()
+    matcher, fingerprint = analyzer.keyword_matcher, analyzer.fingerprint()
+    analyzer.analyze_feedback_batch(FEEDBACK)
+    assert analyzer.keyword_matcher is matcher
+
+    text = "The hours are exhausting"
+    assert analyzer.analyze_text(text)['negative_keywords'] == 0
+    analyzer.negative_keywords = [*analyzer.negative_keywords, 'exhausting']
+    assert analyzer.analyze_text(text)['negative_keywords'] == 1
+    assert analyzer.fingerprint() != fingerprint
+    with pytest.raises(AttributeError):
+        analyzer.positive_keywords.append('fine')
+    with pytest.raises(TypeError):
+        analyzer.emotion_categories['stress'] = ('stressed',)
+
+
+def test_analyzer_pickles_for_worker_processes():
+    analyzer = SentimentAnalyzer()
+    analyzer.emotion_categories = {**analyzer.emotion_categories, 'recognition': ['recognition']}
+    copy = pickle.loads(pickle.dumps(analyzer))
+    assert copy.analyze_text(FEEDBACK[3]) == analyzer.analyze_text(FEEDBACK[3])
+    assert copy.fingerprint() == analyzer.fingerprint()
+
+
+def _comments(n=40):
+    comments = [FEEDBACK[i % len(FEEDBACK)] for i in range(n)]
+    # Same cleaned text as FEEDBACK[0]; scored once and shared
+    comments[7] = FEEDBACK[0].upper()
+    return comments
+
+
+def test_parallel_scoring_matches_serial():
+    comments = _comments()
+    serial = SentimentAnalyzer().analyze_feedback_batch(comments)
+    parallel = SentimentAnalyzer(cache=SentimentCache()).analyze_feedback_batch(comments, n_jobs=2, chunk_size=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+    streamed = pd.concat(SentimentAnalyzer().analyze_feedback_stream(iter(comments), batch_size=16, n_jobs=2),
+                         ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, serial)
+
+
+def test_cache_returns_the_computed_scores(tmp_path):
+    comments = _comments()
+    expected = SentimentAnalyzer().analyze_feedback_batch(comments)
+    path = str(tmp_path / 'sentiment.sqlite')
+
+    with SentimentCache(path=path) as cache:
+        analyzer = SentimentAnalyzer(cache=cache)
+        pd.testing.assert_frame_equal(analyzer.analyze_feedback_batch(comments), expected)
+        # Four distinct non-empty comments: scored once each, every repeat is a memory hit
+        assert cache.stats()['misses'] == 4 and cache.stats()['disk_hits'] == 0
+        assert cache.stats()['memory_hits'] == sum(bool(c) for c in comments) - 4
+
+    with SentimentCache(path=path) as cache:
+        pd.testing.assert_frame_equal(SentimentAnalyzer(cache=cache).analyze_feedback_batch(comments), expected)
+        assert cache.stats()['misses'] == 0 and cache.stats()['disk_hits'] == 4
+
+    with SentimentCache(path=path) as cache:
+        analyzer = SentimentAnalyzer(cache=cache)
+        analyzer.negative_keywords = [*analyzer.negative_keywords, 'exhausting']
+        analyzer.analyze_feedback_batch(comments)
+        # New keywords, new fingerprint: nothing computed under the old one is reused
+        assert cache.stats()['disk_hits'] == 0 and cache.stats()['misses'] == 4
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from timeseries_store import MetricHistory
+
+
+@pytest.fixture
+def history():
+    # Two snapshots a day per department, Feb 25 - Mar 5, scored by day of month
+    timestamps = [day + pd.Timedelta(hours=hour) for day in pd.date_range('2026-02-25', '2026-03-05')
+                  for hour in (9, 18)]
+    data = pd.DataFrame({
+        'employee_id': [f"EMP{i % 7:04d}" for i in range(2 * len(timestamps))],
+        'department': ['Sales'] * len(timestamps) + ['HR'] * len(timestamps),
+        'timestamp': timestamps * 2,
+        'engagement_score': [t.day + (t.hour == 18) for t in timestamps] * 2,
+    })
+    history = MetricHistory()
+    history.append(data.sample(frac=1, random_state=0))
+    return history
+
+
+def test_trend_end_bound_is_exclusive(history):
+    trend = history.trend('engagement_score', freq='D', by_department=False, start='2026-02-27', end='2026-03-02')
+    assert trend.index.tolist() == list(pd.date_range('2026-02-27', '2026-03-01'))
+    assert trend['All'].tolist() == [27.5, 28.5, 1.5]
+
+    # Bounds are truncated to whole days
+    for end in ('2026-03-02 00:00:01', '2026-03-02 12:00'):
+        pd.testing.assert_frame_equal(
+            history.trend('engagement_score', freq='D', by_department=False, start='2026-02-27 08:00', end=end),
+            trend)
+
+
+@pytest.mark.parametrize('start, end', [('2026-02-26', '2026-03-03'), (None, '2026-03-01'), ('2026-03-01', None)])
+def test_trend_matches_range_for_midnight_bounds(history, start, end):
+    snapshots = history.range(start, end)
+    expected = snapshots.groupby([snapshots['timestamp'].dt.to_period('M').dt.start_time.rename('period'),
+                                  'department'])['engagement_score'].mean().unstack('department')
+
+    trend = history.trend('engagement_score', start=start, end=end)
+    np.testing.assert_allclose(trend[expected.columns].to_numpy(), expected.to_numpy())
+    assert trend.index.tolist() == expected.index.tolist()
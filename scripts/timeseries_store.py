@@ -0,0 +1,222 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from feature_store import SURVEY_FEATURE_COLUMNS
+from kpi_engine import KPI_METRICS
+
+# Metrics kept per snapshot, in bucket order
+HISTORY_METRICS = KPI_METRICS + tuple(SURVEY_FEATURE_COLUMNS)
+# Buckets are per day; trend() downsamples them to any coarser period
+_DAY_US = 86400 * 10**6
+
+class _Partition:
+    """Rows of one time partition: appended chunks, merged and sorted by timestamp on first read"""
+
+    __slots__ = ('chunks', '_frame')
+
+    def __init__(self):
+        self.chunks = []
+        self._frame = None
+
+    def append(self, chunk: pd.DataFrame):
+        self.chunks.append(chunk)
+        self._frame = None
+
+    def frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            frame = pd.concat(self.chunks, ignore_index=True) if len(self.chunks) > 1 else self.chunks[0]
+            self._frame = frame.sort_values('timestamp', kind='stable', ignore_index=True)
+            self.chunks = [self._frame]
+        return self._frame
+
+    def between(self, start: Optional[np.datetime64], end: Optional[np.datetime64]) -> pd.DataFrame:
+        """Rows with start <= timestamp < end, by binary search on the sorted timestamps"""
+        frame = self.frame()
+        timestamps = frame['timestamp'].to_numpy()
+        lo = 0 if start is None else np.searchsorted(timestamps, start, side='left')
+        hi = len(frame) if end is None else np.searchsorted(timestamps, end, side='left')
+        return frame.iloc[lo:hi]
+
+class MetricHistory:
+    """Append-only, time-partitioned store of per-employee metric snapshots
+
+    Each snapshot row holds employee_id, department, timestamp and the
+    HISTORY_METRICS taken at that time (one row per employee per survey
+    wave, say). Rows live in partitions of `partition_freq` periods, so
+    range and as-of queries only read the partitions they overlap and
+    binary-search their sorted timestamps. Every append also folds its rows
+    into per-day, per-department sums and counts; trend() downsamples those
+    buckets instead of rescanning snapshots.
+    """
+
+    def __init__(self, partition_freq: str = 'M', metrics: Sequence[str] = HISTORY_METRICS):
+        self.partition_freq = partition_freq
+        self.metrics = tuple(metrics)
+        self.partitions: Dict[pd.Period, _Partition] = {}
+        self.rows = 0
+        # Bumped by every append, e.g. to invalidate cached charts
+        self.version = 0
+        # (day ordinal, department) -> row in the bucket arrays
+        self._bucket_index = {}
+        self._bucket_sums = np.zeros((0, len(self.metrics)))
+        self._bucket_counts = np.zeros((0, len(self.metrics)), dtype=np.int64)
+        # Bucket table for trend(), valid until the next append
+        self._bucket_frame = None
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @staticmethod
+    def _datetime(value) -> Optional[np.datetime64]:
+        return None if value is None else np.datetime64(pd.Timestamp(value).to_datetime64(), 'us')
+
+    def append(self, data: pd.DataFrame, timestamp_column: str = 'timestamp') -> int:
+        """Add snapshot rows (employee_id, timestamp, optional department and metric columns)
+
+        Metrics the frame lacks are stored as missing. Returns the rows added.
+        """
+        if len(data) == 0:
+            return 0
+        timestamps = pd.DatetimeIndex(pd.to_datetime(data[timestamp_column])).as_unit('us')
+        if timestamps.isna().any():
+            raise ValueError(f"Snapshot rows need a '{timestamp_column}'")
+        chunk = pd.DataFrame({
+            'employee_id': data['employee_id'].astype(str).to_numpy(),
+            'department': data['department'].astype(object).to_numpy() if 'department' in data.columns
+            else np.full(len(data), None, dtype=object),
+            'timestamp': timestamps.to_numpy()
+        })
+        values = np.column_stack([
+            data[metric].to_numpy(dtype=np.float64, na_value=np.nan) if metric in data.columns
+            else np.full(len(data), np.nan) for metric in self.metrics
+        ])
+        for m, metric in enumerate(self.metrics):
+            chunk[metric] = values[:, m]
+
+        codes, periods = pd.factorize(timestamps.to_period(self.partition_freq))
+        # One reorder by partition, then a slice per partition
+        order = np.argsort(codes, kind='stable')
+        grouped = chunk if len(periods) == 1 else chunk.iloc[order].reset_index(drop=True)
+        bounds = np.searchsorted(codes[order], np.arange(len(periods) + 1))
+        for code, period in enumerate(periods):
+            self.partitions.setdefault(period, _Partition()).append(grouped.iloc[bounds[code]:bounds[code + 1]])
+
+        self._add_to_buckets(timestamps.asi8 // _DAY_US, chunk['department'].to_numpy(), values)
+        self.rows += len(chunk)
+        self.version += 1
+        return len(chunk)
+
+    def _add_to_buckets(self, days: np.ndarray, departments: np.ndarray, values: np.ndarray):
+        dept_codes, dept_labels = pd.factorize(departments, use_na_sentinel=False)
+        keys, inverse = np.unique(days * len(dept_labels) + dept_codes, return_inverse=True)
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        sums = np.column_stack([np.bincount(inverse, weights=filled[:, m], minlength=len(keys))
+                                for m in range(values.shape[1])])
+        counts = np.column_stack([np.bincount(inverse, weights=present[:, m], minlength=len(keys))
+                                  for m in range(values.shape[1])]).astype(np.int64)
+
+        rows = []
+        for key in keys.tolist():
+            department = dept_labels[key % len(dept_labels)]
+            bucket = (key // len(dept_labels), None if pd.isna(department) else department)
+            if bucket not in self._bucket_index:
+                self._bucket_index[bucket] = len(self._bucket_index)
+            rows.append(self._bucket_index[bucket])
+        grow = len(self._bucket_index) - len(self._bucket_sums)
+        if grow > 0:
+            self._bucket_sums = np.vstack([self._bucket_sums, np.zeros((grow, values.shape[1]))])
+            self._bucket_counts = np.vstack([self._bucket_counts, np.zeros((grow, values.shape[1]), dtype=np.int64)])
+        self._bucket_sums[rows] += sums
+        self._bucket_counts[rows] += counts
+        self._bucket_frame = None
+
+    def partition_frames(self):
+        """(period, rows sorted by timestamp) for every partition, oldest first, e.g. to persist them"""
+        for period in sorted(self.partitions):
+            yield period, self.partitions[period].frame()
+
+    def _partitions_between(self, start, end):
+        for period in sorted(self.partitions):
+            if end is not None and period.start_time >= end:
+                break
+            if start is not None and period.end_time < start:
+                continue
+            yield self.partitions[period]
+
+    def range(self, start=None, end=None, employee_ids: Optional[Sequence[str]] = None,
+              columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Snapshots with start <= timestamp < end (either bound optional), oldest first"""
+        start, end = self._datetime(start), self._datetime(end)
+        parts = [part.between(start, end) for part in self._partitions_between(start, end)]
+        result = pd.concat(parts, ignore_index=True) if parts else self._empty()
+        if employee_ids is not None:
+            result = result[result['employee_id'].isin([str(e) for e in employee_ids])].reset_index(drop=True)
+        if columns is not None:
+            result = result[['employee_id', 'timestamp'] + [c for c in columns if c not in ('employee_id', 'timestamp')]]
+        return result
+
+    def _empty(self) -> pd.DataFrame:
+        return pd.DataFrame({'employee_id': pd.Series(dtype=object), 'department': pd.Series(dtype=object),
+                             'timestamp': pd.Series(dtype='datetime64[us]'),
+                             **{metric: pd.Series(dtype=np.float64) for metric in self.metrics}})
+
+    def as_of(self, when, employee_ids: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Each employee's latest snapshot taken at or before `when`, indexed by employee_id"""
+        history = self.range(end=self._datetime(when) + np.timedelta64(1, 'us'), employee_ids=employee_ids)
+        return history.drop_duplicates('employee_id', keep='last').set_index('employee_id')
+
+    def asof_join(self, data: pd.DataFrame, on: str = 'timestamp',
+                  columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """`data` (employee_id and `on` columns) with the latest snapshot at or before each row's time
+
+        Snapshot metrics are added as columns, with the snapshot's time as
+        `snapshot_timestamp`; rows without an earlier snapshot get missing
+        values. Row order of `data` is kept.
+        """
+        columns = list(self.metrics if columns is None else columns)
+        left = data.assign(**{on: pd.to_datetime(data[on]).astype('datetime64[us]'),
+                              '_row': np.arange(len(data)),
+                              '_key': data['employee_id'].astype(str).to_numpy()})
+        right = self.range(end=left[on].max() + pd.Timedelta(1, 'us') if len(left) else None, columns=columns)
+        right = right.rename(columns={'timestamp': 'snapshot_timestamp', 'employee_id': '_key'})
+        joined = pd.merge_asof(left.sort_values(on, kind='stable'), right, left_on=on,
+                               right_on='snapshot_timestamp', by='_key', direction='backward')
+        return joined.sort_values('_row').drop(columns=['_row', '_key']).set_index(data.index)
+
+    def _buckets(self) -> pd.DataFrame:
+        if self._bucket_frame is None:
+            keys = list(self._bucket_index)
+            self._bucket_frame = pd.DataFrame({
+                'day': np.array([day for day, _ in keys], dtype='datetime64[D]'),
+                'department': pd.Series([department for _, department in keys], dtype=object)
+            })
+        return self._bucket_frame
+
+    def trend(self, metric: str, freq: str = 'M', by_department: bool = True, start=None, end=None) -> pd.DataFrame:
+        """Mean of `metric` per `freq` period (rows, labelled by period start) and department (columns)
+
+        Computed from the daily buckets; by_department=False gives one 'All'
+        column over every snapshot. Like range(), the bounds are half-open
+        (start <= day < end), at whole-day resolution: both are truncated to
+        their day, so end='2024-03-01' or '2024-03-01 12:00' stops before
+        March 1 and matches range() exactly for midnight bounds.
+        """
+        m = self.metrics.index(metric)
+        buckets = self._buckets()
+        keep = np.ones(len(buckets), dtype=bool)
+        if start is not None:
+            keep &= buckets['day'].to_numpy() >= np.datetime64(pd.Timestamp(start).floor('D'), 'D')
+        if end is not None:
+            keep &= buckets['day'].to_numpy() < np.datetime64(pd.Timestamp(end).floor('D'), 'D')
+        table = pd.DataFrame({
+            'period': pd.DatetimeIndex(buckets['day']).to_period(freq).start_time,
+            'department': buckets['department'] if by_department else 'All',
+            'sum': self._bucket_sums[:len(buckets), m],
+            'count': self._bucket_counts[:len(buckets), m]
+        })[keep]
+        totals = table.groupby(['period', 'department'], sort=True)[['sum', 'count']].sum()
+        means = (totals['sum'] / totals['count'].where(totals['count'] > 0)).unstack('department')
+        means.columns.name = 'department'
+        return means